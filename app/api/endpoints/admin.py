@@ -2,23 +2,46 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.api.endpoints.auth import get_current_user
+from app.core.analytics import AnalyticsTimeoutError, analytics_reporter
 from app.core.database import get_db
+from app.core.executor import run_db
+from app.core.search import post_search_index
+from app.core.writer import run_write
+from app.crud.announcements import (
+    create_announcement,
+    get_active_announcements,
+    get_cached_active_announcements,
+    update_announcement,
+)
 from app.crud.posts import (
+    POST_SUMMARY_LENGTH,
     delete_comment,
     delete_post,
     get_comment_by_id,
+    get_dashboard_series,
     get_dashboard_stats,
     get_post_by_id,
     get_posts,
+    reconcile_user_stats,
 )
 from app.models.users import User
 from app.schemas.posts import (
+    ActivityBucketResponse,
     AdminDashboardResponse,
+    AdminDashboardSeriesResponse,
     AdminDeleteRequest,
+    AnalyticsActivityResponse,
+    AnalyticsTopAuthorsResponse,
+    AnalyticsTopTagsResponse,
     AnnouncementCreateRequest,
     AnnouncementResponse,
+    AnnouncementUpdateRequest,
     PostListResponse,
     PostSummaryResponse,
+    SearchReindexResponse,
+    TopAuthorResponse,
+    TopTagResponse,
+    UserStatsReconcileResponse,
 )
 
 router = APIRouter(prefix="/admin", tags=["admin"])
@@ -46,7 +69,7 @@ async def get_admin_dashboard(
     check_admin_permission(current_user)
 
     try:
-        stats = get_dashboard_stats(db)
+        stats = await run_db(get_dashboard_stats, db)
         return AdminDashboardResponse(**stats)
 
     except Exception as e:
@@ -56,6 +79,143 @@ async def get_admin_dashboard(
         )
 
 
+@router.get("/dashboard/series", response_model=AdminDashboardSeriesResponse)
+async def get_admin_dashboard_series(
+    days: int = Query(30, ge=1, le=365),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """관리자 대시보드 일별 가입/글/댓글 수 추이"""
+    check_admin_permission(current_user)
+
+    try:
+        series = await run_db(get_dashboard_series, db, days)
+        return AdminDashboardSeriesResponse(series=series)
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"대시보드 추이 조회 중 오류가 발생했습니다: {str(e)}",
+        )
+
+
+def _analytics_timeout_error(e: AnalyticsTimeoutError) -> HTTPException:
+    """분석 쿼리 시간 초과 응답"""
+    return HTTPException(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail=str(e)
+    )
+
+
+@router.get("/analytics/activity", response_model=AnalyticsActivityResponse)
+async def get_activity_analytics(
+    bucket: str = Query("day", pattern="^(hour|day|week)$"),
+    days: int = Query(30, ge=1, le=365),
+    current_user: User = Depends(get_current_user),
+):
+    """기간 내 단위 시간별 가입/글/댓글/좋아요 수 (분석 전용 스레드 풀)"""
+    check_admin_permission(current_user)
+
+    try:
+        rows = await analytics_reporter.activity(bucket, days)
+        return AnalyticsActivityResponse(
+            bucket=bucket,
+            days=days,
+            series=[
+                ActivityBucketResponse(
+                    bucketStart=row["bucket_start"],
+                    signups=row["signups"],
+                    posts=row["posts"],
+                    comments=row["comments"],
+                    likes=row["likes"],
+                )
+                for row in rows
+            ],
+        )
+
+    except AnalyticsTimeoutError as e:
+        raise _analytics_timeout_error(e)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"활동 추이 분석 중 오류가 발생했습니다: {str(e)}",
+        )
+
+
+@router.get(
+    "/analytics/top-authors", response_model=AnalyticsTopAuthorsResponse
+)
+async def get_top_authors_analytics(
+    days: int = Query(30, ge=1, le=365),
+    limit: int = Query(10, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+):
+    """기간 내 작성 글 수 기준 상위 작성자 (분석 전용 스레드 풀)"""
+    check_admin_permission(current_user)
+
+    try:
+        rows = await analytics_reporter.top_authors(days, limit)
+        return AnalyticsTopAuthorsResponse(
+            days=days, authors=[TopAuthorResponse(**row) for row in rows]
+        )
+
+    except AnalyticsTimeoutError as e:
+        raise _analytics_timeout_error(e)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"상위 작성자 분석 중 오류가 발생했습니다: {str(e)}",
+        )
+
+
+@router.get("/analytics/top-tags", response_model=AnalyticsTopTagsResponse)
+async def get_top_tags_analytics(
+    days: int = Query(30, ge=1, le=365),
+    limit: int = Query(10, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+):
+    """기간 내 작성 글 수 기준 상위 태그 (분석 전용 스레드 풀)"""
+    check_admin_permission(current_user)
+
+    try:
+        rows = await analytics_reporter.top_tags(days, limit)
+        return AnalyticsTopTagsResponse(
+            days=days, tags=[TopTagResponse(**row) for row in rows]
+        )
+
+    except AnalyticsTimeoutError as e:
+        raise _analytics_timeout_error(e)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"상위 태그 분석 중 오류가 발생했습니다: {str(e)}",
+        )
+
+
+def _create_admin_post_summaries(posts) -> list[PostSummaryResponse]:
+    """관리자 글 목록 요약 생성 (post_summary_columns 행)"""
+    post_summaries = []
+    for post in posts:
+        # 글 요약 생성
+        summary = post.summary
+        if len(summary) > POST_SUMMARY_LENGTH:
+            summary = summary[:POST_SUMMARY_LENGTH] + "..."
+        post_summaries.append(
+            PostSummaryResponse(
+                id=post.id,
+                title=post.title,
+                summary=summary,
+                likeCount=post.like_count,
+                commentCount=post.comment_count,
+                author={
+                    "id": post.author_id,
+                    "nickname": post.author_nickname,
+                },
+                createdAt=post.created_at,
+            )
+        )
+    return post_summaries
+
+
 @router.get("/posts", response_model=PostListResponse)
 async def get_admin_posts(
     page: int = Query(1, ge=1),
@@ -67,31 +227,12 @@ async def get_admin_posts(
     check_admin_permission(current_user)
 
     try:
-        posts, total_count = get_posts(db=db, page=page, limit=limit)
+        posts, total_count, _ = await run_db(
+            get_posts, db=db, page=page, limit=limit, include_total=True
+        )
         total_pages = (total_count + limit - 1) // limit
 
-        post_summaries = []
-        for post in posts:
-            # 글 요약 생성
-            summary = (
-                post.content[:100] + "..."
-                if len(post.content) > 100
-                else post.content
-            )
-            post_summaries.append(
-                PostSummaryResponse(
-                    id=post.id,
-                    title=post.title,
-                    summary=summary,
-                    likeCount=post.like_count,
-                    commentCount=len(post.comments) if post.comments else 0,
-                    author={
-                        "id": post.author.id,
-                        "nickname": post.author.nickname,
-                    },
-                    createdAt=post.created_at,
-                )
-            )
+        post_summaries = _create_admin_post_summaries(posts)
 
         return PostListResponse(
             posts=post_summaries, totalPages=total_pages, currentPage=page
@@ -114,7 +255,7 @@ async def admin_delete_post(
     """관리자에 의한 글 삭제"""
     check_admin_permission(current_user)
 
-    post = get_post_by_id(db, post_id)
+    post = await run_db(get_post_by_id, db, post_id, load_comments=False)
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -123,7 +264,7 @@ async def admin_delete_post(
 
     try:
         soft_delete = delete_request.deleteType == "soft"
-        delete_post(db=db, post=post, soft_delete=soft_delete)
+        await run_write(delete_post, db=db, post=post, soft_delete=soft_delete)
 
     except Exception as e:
         raise HTTPException(
@@ -143,7 +284,7 @@ async def admin_delete_comment(
     """관리자에 의한 댓글 삭제"""
     check_admin_permission(current_user)
 
-    comment = get_comment_by_id(db, comment_id)
+    comment = await run_db(get_comment_by_id, db, comment_id)
     if not comment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -151,7 +292,7 @@ async def admin_delete_comment(
         )
 
     try:
-        delete_comment(db=db, comment=comment)
+        await run_write(delete_comment, db=db, comment=comment)
 
     except Exception as e:
         raise HTTPException(
@@ -160,16 +301,56 @@ async def admin_delete_comment(
         )
 
 
-# 공지사항 관련 (간단한 구현)
-announcements_storage = []  # 임시 저장소 (실제로는 DB 모델 필요)
+@router.post("/search/reindex", response_model=SearchReindexResponse)
+async def rebuild_search_index(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """게시글 검색 색인 재구성"""
+    check_admin_permission(current_user)
+
+    try:
+        indexed = await run_db(post_search_index.rebuild, db)
+        return SearchReindexResponse(indexedPosts=indexed)
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"검색 색인 재구성 중 오류가 발생했습니다: {str(e)}",
+        )
 
 
+@router.post(
+    "/user-stats/reconcile", response_model=UserStatsReconcileResponse
+)
+async def reconcile_user_stats_endpoint(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """사용자 집계를 원본 테이블 기준으로 재계산하고 차이 보고"""
+    check_admin_permission(current_user)
+
+    try:
+        result = await run_write(reconcile_user_stats, db)
+        return UserStatsReconcileResponse(
+            reconciledUsers=result["users"],
+            driftedColumns=result["columns"],
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"사용자 집계 재계산 중 오류가 발생했습니다: {str(e)}",
+        )
+
+
+# 공지사항 관련
 @router.post(
     "/announcements",
     response_model=AnnouncementResponse,
     status_code=status.HTTP_201_CREATED,
 )
-async def create_announcement(
+async def create_announcement_endpoint(
     announcement_data: AnnouncementCreateRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -177,26 +358,64 @@ async def create_announcement(
     """공지사항 작성"""
     check_admin_permission(current_user)
 
-    from datetime import datetime
+    try:
+        announcement = await run_write(
+            create_announcement,
+            db,
+            title=announcement_data.title,
+            content=announcement_data.content,
+            is_active=announcement_data.isActive,
+        )
+        return AnnouncementResponse(**announcement)
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"공지사항 작성 중 오류가 발생했습니다: {str(e)}",
+        )
+
+
+@router.patch(
+    "/announcements/{announcement_id}", response_model=AnnouncementResponse
+)
+async def update_announcement_endpoint(
+    announcement_id: int,
+    announcement_data: AnnouncementUpdateRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """공지사항 수정 (활성화 여부 포함)"""
+    check_admin_permission(current_user)
 
-    announcement = {
-        "id": len(announcements_storage) + 1,
-        "title": announcement_data.title,
-        "content": announcement_data.content,
-        "isActive": announcement_data.isActive,
-        "createdAt": datetime.utcnow(),
-    }
+    try:
+        announcement = await run_write(
+            update_announcement,
+            db,
+            announcement_id,
+            title=announcement_data.title,
+            content=announcement_data.content,
+            is_active=announcement_data.isActive,
+        )
 
-    announcements_storage.append(announcement)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"공지사항 수정 중 오류가 발생했습니다: {str(e)}",
+        )
 
+    if announcement is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="공지사항을 찾을 수 없습니다.",
+        )
     return AnnouncementResponse(**announcement)
 
 
 @router.get("/announcements", response_model=list[AnnouncementResponse])
-async def get_active_announcements():
-    """활성화된 공지사항 조회 (일반 사용자용)"""
-    active_announcements = [
-        ann for ann in announcements_storage if ann["isActive"]
-    ]
+async def get_active_announcements_endpoint(db: Session = Depends(get_db)):
+    """활성화된 공지사항 조회 (일반 사용자용, 캐시 적중 시 DB 조회 없음)"""
+    announcements = get_cached_active_announcements()
+    if announcements is None:
+        announcements = await run_db(get_active_announcements, db)
 
-    return [AnnouncementResponse(**ann) for ann in active_announcements]
+    return [AnnouncementResponse(**ann) for ann in announcements]
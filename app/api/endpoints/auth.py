@@ -4,10 +4,13 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
+from app.core.auth_cache import auth_cache
 from app.core.config import settings
 from app.core.database import get_db
-from app.core.security import create_access_token, verify_token
-from app.crud.users import authenticate_user, get_user_by_email
+from app.core.executor import run_db
+from app.core.password_hasher import password_hasher
+from app.core.security import create_access_token
+from app.crud.users import get_user_by_email
 from app.models.users import User
 from app.schemas.auth import LoginRequest, TokenResponse
 
@@ -30,14 +33,22 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    email = verify_token(token)
+    email = auth_cache.get_subject(token)
     if email is None:
         raise credentials_exception
 
-    user = get_user_by_email(db, email=email)
+    # 캐시 적중 시 DB 조회 없이 요청 세션에 붙인 사용자 반환
+    user = auth_cache.get_user(db, email)
+    if user is not None:
+        return user
+
+    # 조회 도중 사용자가 수정되면 이전 값을 캐시하지 않도록 버전을 먼저 읽음
+    version = auth_cache.user_version()
+    user = await run_db(get_user_by_email, db, email=email)
     if user is None:
         raise credentials_exception
 
+    auth_cache.set_user(user, version)
     return user
 
 
@@ -46,9 +57,12 @@ async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
     """
     로그인 - 이메일과 비밀번호로 사용자를 인증하고 JWT 토큰을 발급합니다.
     """
-    user = authenticate_user(db, login_data.email, login_data.password)
+    user = await run_db(get_user_by_email, db, email=login_data.email)
 
-    if not user:
+    # bcrypt 검증은 CPU 작업이므로 전용 프로세스 풀에서 실행
+    if not user or not await password_hasher.verify(
+        login_data.password, user.password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="이메일이 존재하지 않거나 비밀번호가 틀렸습니다.",
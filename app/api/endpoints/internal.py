@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, HTTPException, Header, status
+
+from app.core.executor import run_db
+from app.core.security import INTERNAL_TOKEN_HEADER, verify_internal_token
+from app.core.view_counter import view_count_buffer
+from app.schemas.posts import ViewCountsRequest
+
+
+def verify_internal_request(
+    x_internal_token: str = Header(None, alias=INTERNAL_TOKEN_HEADER)
+):
+    """내부 API 토큰 확인 (reader만 알고 있는 공유 비밀)"""
+    if not verify_internal_token(x_internal_token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="내부 API 권한이 없습니다.",
+        )
+
+
+# writer 프로세스 전용 내부 API (reader 프로세스만 유닉스 소켓으로 호출)
+router = APIRouter(
+    prefix="/internal",
+    include_in_schema=False,
+    dependencies=[Depends(verify_internal_request)],
+)
+
+
+@router.post("/view-counts", status_code=status.HTTP_204_NO_CONTENT)
+async def add_view_counts(request: ViewCountsRequest):
+    """reader에서 모인 조회수 증분 반영"""
+    try:
+        await run_db(view_count_buffer.increment_many, request.counts)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"조회수 반영 중 오류가 발생했습니다: {str(e)}",
+        )
@@ -1,17 +1,29 @@
+import asyncio
+from collections import defaultdict
+from typing import Dict, List
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.api.endpoints.auth import get_current_user
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_db, sqlalchemy_manager
+from app.core.executor import run_db
+from app.core.tag_cache import tag_dictionary
+from app.core.view_counter import view_count_buffer
+from app.core.writer import run_write, run_write_retrying
 from app.crud.posts import (
+    CURSOR_SORT_KEYS,
+    POST_SUMMARY_LENGTH,
     create_comment,
     create_post,
     delete_comment,
     delete_post,
     get_comment_by_id,
-    get_comment_count,
+    get_comments_page,
     get_post_by_id,
     get_posts,
+    post_list_cache,
     toggle_post_like,
     update_comment,
     update_post,
@@ -20,6 +32,7 @@ from app.models.users import User
 from app.schemas.posts import (
     AuthorResponse,
     CommentCreateRequest,
+    CommentListResponse,
     CommentResponse,
     CommentUpdateRequest,
     LikeResponse,
@@ -32,38 +45,40 @@ from app.schemas.posts import (
 
 router = APIRouter(tags=["posts"])
 
+# 진행 중인 글 목록 캐시 백그라운드 재계산 (작업 참조 유지용)
+_refresh_tasks = set()
 
-def _create_post_summary_response(
-    post, comment_count: int = None
-) -> PostSummaryResponse:
-    """글 요약 응답 생성 헬퍼 함수"""
-    if comment_count is None:
-        # 댓글 수는 이미 로드된 관계에서 계산하거나 별도로 조회
-        comment_count = (
-            len(post.comments)
-            if hasattr(post, "comments") and post.comments
-            else 0
-        )
 
-    # 요약 생성 (본문의 첫 100자)
-    summary = (
-        post.content[:100] + "..." if len(post.content) > 100 else post.content
-    )
+def _create_post_summary_response(post) -> PostSummaryResponse:
+    """글 목록 행(post_summary_columns)으로 요약 응답 생성"""
+    # 요약 생성 (본문의 첫 100자, 행에는 한 글자 더 잘라 조회됨)
+    summary = post.summary
+    if len(summary) > POST_SUMMARY_LENGTH:
+        summary = summary[:POST_SUMMARY_LENGTH] + "..."
 
     return PostSummaryResponse(
         id=post.id,
         title=post.title,
         summary=summary,
         likeCount=post.like_count,
-        commentCount=comment_count,
+        commentCount=post.comment_count,
         author=AuthorResponse(
-            id=post.author.id, nickname=post.author.nickname
+            id=post.author_id, nickname=post.author_nickname
         ),
         createdAt=post.created_at,
     )
 
 
-def _create_comment_response(comment) -> CommentResponse:
+def _calculate_total_pages(total_count: int | None, limit: int) -> int | None:
+    """전체 페이지 수 계산 (전체 개수를 조회하지 않았으면 None)"""
+    if total_count is None:
+        return None
+    return (total_count + limit - 1) // limit
+
+
+def _create_comment_response(
+    comment, reply_count: int = None
+) -> CommentResponse:
     """댓글 응답 생성 헬퍼 함수"""
     return CommentResponse(
         id=comment.id,
@@ -73,7 +88,77 @@ def _create_comment_response(comment) -> CommentResponse:
         ),
         createdAt=comment.created_at,
         parentCommentId=comment.parent_comment_id,
-        replies=[],  # 대댓글은 별도 처리 필요
+        replies=[],  # 대댓글은 _build_comment_tree에서 채움
+        replyCount=reply_count,
+    )
+
+
+def _build_comment_tree(
+    comments, max_depth: int = None, reply_counts: Dict[int, int] = None
+) -> List[CommentResponse]:
+    """댓글 목록을 대댓글 트리로 변환 (O(n))
+
+    부모 id별로 한 번 묶은 뒤 작성순으로 내려가며 연결합니다. max_depth를
+    넘는 답글은 버리지 않고 가장 깊은 단계의 답글 목록에 순서대로 붙이며,
+    부모가 목록에 없는 댓글은 최상위 댓글로 취급합니다.
+    reply_counts가 주어지면 (답글 미리보기) 댓글별 전체 답글 수를 채웁니다.
+    """
+    max_depth = max_depth or settings.COMMENT_MAX_DEPTH
+    reply_counts = reply_counts or {}
+    ordered = sorted(comments, key=lambda c: (c.created_at, c.id))
+    responses = {
+        c.id: _create_comment_response(c, reply_counts.get(c.id))
+        for c in ordered
+    }
+
+    children = defaultdict(list)
+    roots = []
+    for comment in ordered:
+        if comment.parent_comment_id in responses:
+            children[comment.parent_comment_id].append(comment)
+        else:
+            roots.append(comment)
+
+    tree = []
+    stack = [(comment, 1, tree) for comment in reversed(roots)]
+    while stack:
+        comment, depth, siblings = stack.pop()
+        response = responses[comment.id]
+        siblings.append(response)
+
+        if depth < max_depth:
+            child_depth, child_siblings = depth + 1, response.replies
+        else:
+            child_depth, child_siblings = depth, siblings
+        for child in reversed(children[comment.id]):
+            stack.append((child, child_depth, child_siblings))
+
+    return tree
+
+
+def _create_post_detail_response(
+    post,
+    comments,
+    reply_counts: Dict[int, int] = None,
+    comments_next_cursor: str = None,
+) -> PostDetailResponse:
+    """글 상세 응답 생성 헬퍼 함수 (댓글 첫 페이지/답글 미리보기 포함)"""
+    # 태그 정보 추출
+    tags = [pt.tag.name for pt in post.post_tags] if post.post_tags else []
+
+    return PostDetailResponse(
+        id=post.id,
+        title=post.title,
+        content=post.content,
+        viewCount=view_count_buffer.approximate(post),
+        likeCount=post.like_count,
+        createdAt=post.created_at,
+        author=AuthorResponse(
+            id=post.author.id, nickname=post.author.nickname
+        ),
+        tags=tags,
+        comments=_build_comment_tree(comments, reply_counts=reply_counts),
+        commentsNextCursor=comments_next_cursor,
     )
 
 
@@ -89,7 +174,8 @@ async def create_post_endpoint(
 ):
     """글 작성"""
     try:
-        post = create_post(
+        post = await run_write(
+            create_post,
             db=db,
             title=post_data.title,
             content=post_data.content,
@@ -98,7 +184,9 @@ async def create_post_endpoint(
         )
 
         # 생성된 글 상세 정보 조회
-        created_post = get_post_by_id(db, post.id)
+        created_post = await run_db(
+            get_post_by_id, db, post.id, load_comments=False
+        )
 
         # 태그 정보 추출
         tags = (
@@ -129,34 +217,102 @@ async def create_post_endpoint(
         )
 
 
+def _build_post_list(db: Session, **params) -> PostListResponse:
+    """글 목록 조회 후 응답 생성 (DB 스레드에서 실행)"""
+    posts, total_count, next_cursor = get_posts(db=db, **params)
+
+    return PostListResponse(
+        posts=[_create_post_summary_response(post) for post in posts],
+        totalPages=_calculate_total_pages(total_count, params["limit"]),
+        currentPage=params["page"],
+        nextCursor=next_cursor,
+    )
+
+
+def _refresh_post_list(key: tuple, scope: int | None, params: dict):
+    """stale 항목 재계산 (요청 세션과 별도 세션 사용)"""
+    try:
+        version = post_list_cache.version(scope)
+        db = sqlalchemy_manager.get_session()
+        try:
+            response = _build_post_list(db, **params)
+        finally:
+            db.close()
+        post_list_cache.set(key, response, version, scope)
+    finally:
+        post_list_cache.end_refresh(key)
+
+
+async def _run_post_list_refresh(key: tuple, scope: int | None, params):
+    try:
+        await run_db(_refresh_post_list, key, scope, params)
+    except Exception as e:
+        print(f"Post list cache refresh error: {e}")
+
+
+async def _get_cached_post_list(db: Session, params: dict) -> PostListResponse:
+    """글 목록 응답 캐시 조회 (stale이면 이전 응답 후 백그라운드 재계산)
+
+    키는 정규화한 조회 조건이고, 태그 목록은 태그 버전, 전체 목록은 전체
+    버전으로 무효화됩니다. 태그 사전에 없는 태그는 전체 버전을 따릅니다.
+    """
+    sort = params["sort"] if params["sort"] in CURSOR_SORT_KEYS else "latest"
+    tag = params["tag"] or None
+    key = (sort, tag, params["page"], params["limit"], params["include_total"])
+    scope = tag_dictionary.lookup([tag]).get(tag) if tag else None
+
+    response, stale = post_list_cache.get(key, scope)
+    if response is not None:
+        if stale and post_list_cache.begin_refresh(key):
+            task = asyncio.create_task(
+                _run_post_list_refresh(key, scope, params)
+            )
+            _refresh_tasks.add(task)
+            task.add_done_callback(_refresh_tasks.discard)
+        return response
+
+    # 조회 전에 읽은 버전으로 저장 (조회 중 바뀐 결과는 저장되지 않음)
+    version = post_list_cache.version(scope)
+    response = await run_db(_build_post_list, db, **params)
+    post_list_cache.set(key, response, version, scope)
+    return response
+
+
 @router.get("/posts", response_model=PostListResponse)
 async def get_posts_endpoint(
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=50),
-    sort: str = Query("latest", regex="^(latest|popular)$"),
+    sort: str = Query(
+        "latest", regex="^(latest|popular|discussed|relevance)$"
+    ),
     query: str = Query(None),
     tag: str = Query(None),
+    cursor: str = Query(None),
+    includeTotal: bool = Query(False),
     db: Session = Depends(get_db),
 ):
-    """글 목록 조회"""
+    """글 목록 조회 (cursor 지정 시 키셋 페이지네이션)
+
+    검색어/커서 없는 앞 페이지는 글 목록 응답 캐시에서 응답합니다.
+    """
+    params = dict(
+        page=page,
+        limit=limit,
+        sort=sort,
+        query=query,
+        tag=tag,
+        cursor=cursor,
+        include_total=includeTotal,
+    )
     try:
-        posts, total_count = get_posts(
-            db=db, page=page, limit=limit, sort=sort, query=query, tag=tag
-        )
+        if query or cursor or page > settings.POST_LIST_CACHE_MAX_PAGE:
+            return await run_db(_build_post_list, db, **params)
+        return await _get_cached_post_list(db, params)
 
-        total_pages = (total_count + limit - 1) // limit
-
-        post_summaries = []
-        for post in posts:
-            comment_count = get_comment_count(db, post.id)
-            post_summaries.append(
-                _create_post_summary_response(post, comment_count)
-            )
-
-        return PostListResponse(
-            posts=post_summaries, totalPages=total_pages, currentPage=page
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
         )
-
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -165,9 +321,20 @@ async def get_posts_endpoint(
 
 
 @router.get("/posts/{post_id}", response_model=PostDetailResponse)
-async def get_post_detail(post_id: int, db: Session = Depends(get_db)):
-    """글 상세 조회 (조회수 증가)"""
-    post = get_post_by_id(db, post_id, increment_view=True)
+async def get_post_detail(
+    post_id: int,
+    commentsLimit: int = Query(
+        settings.POST_DETAIL_COMMENTS_LIMIT,
+        ge=0,
+        le=100,
+        description="함께 조회할 최상위 댓글 수 (나머지는 댓글 목록 API로 조회)",
+    ),
+    db: Session = Depends(get_db),
+):
+    """글 상세 조회 (조회수 증가, 댓글은 첫 페이지만 포함)"""
+    post = await run_db(
+        get_post_by_id, db, post_id, increment_view=True, load_comments=False
+    )
 
     if not post:
         raise HTTPException(
@@ -175,37 +342,70 @@ async def get_post_detail(post_id: int, db: Session = Depends(get_db)):
             detail="글을 찾을 수 없습니다.",
         )
 
-    # 태그 정보 추출
-    tags = [pt.tag.name for pt in post.post_tags] if post.post_tags else []
+    comments, reply_counts, next_cursor = [], {}, None
+    if commentsLimit:
+        comments, reply_counts, next_cursor = await run_db(
+            get_comments_page,
+            db=db,
+            post_id=post_id,
+            limit=commentsLimit,
+            replies_limit=settings.COMMENT_REPLIES_PREVIEW_LIMIT,
+        )
 
-    # 댓글 정보 변환 (대댓글 처리)
-    comments = []
-    parent_comments = [c for c in post.comments if c.parent_comment_id is None]
+    return _create_post_detail_response(
+        post, comments, reply_counts, next_cursor
+    )
 
-    for comment in parent_comments:
-        comment_response = _create_comment_response(comment)
-        # 대댓글 추가
-        replies = [
-            c for c in post.comments if c.parent_comment_id == comment.id
-        ]
-        comment_response.replies = [
-            _create_comment_response(reply) for reply in replies
-        ]
-        comments.append(comment_response)
 
-    return PostDetailResponse(
-        id=post.id,
-        title=post.title,
-        content=post.content,
-        viewCount=post.view_count,
-        likeCount=post.like_count,
-        createdAt=post.created_at,
-        author=AuthorResponse(
-            id=post.author.id, nickname=post.author.nickname
-        ),
-        tags=tags,
-        comments=comments,
-    )
+@router.get("/posts/{post_id}/comments", response_model=CommentListResponse)
+async def get_comments_endpoint(
+    post_id: int,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str = Query(None),
+    parentCommentId: int = Query(
+        None, description="지정하면 해당 댓글의 답글 목록을 조회"
+    ),
+    repliesLimit: int = Query(
+        settings.COMMENT_REPLIES_PREVIEW_LIMIT,
+        ge=0,
+        le=20,
+        description="댓글별 답글 미리보기 수",
+    ),
+    db: Session = Depends(get_db),
+):
+    """댓글 목록 조회 (작성순 커서 페이지네이션 + 답글 미리보기)"""
+    post = await run_db(get_post_by_id, db, post_id, load_comments=False)
+    if not post:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="글을 찾을 수 없습니다.",
+        )
+
+    try:
+        comments, reply_counts, next_cursor = await run_db(
+            get_comments_page,
+            db=db,
+            post_id=post_id,
+            limit=limit,
+            cursor=cursor,
+            parent_comment_id=parentCommentId,
+            replies_limit=repliesLimit,
+        )
+
+        return CommentListResponse(
+            comments=_build_comment_tree(comments, reply_counts=reply_counts),
+            nextCursor=next_cursor,
+        )
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"댓글 목록 조회 중 오류가 발생했습니다: {str(e)}",
+        )
 
 
 @router.patch("/posts/{post_id}", response_model=PostDetailResponse)
@@ -216,7 +416,7 @@ async def update_post_endpoint(
     db: Session = Depends(get_db),
 ):
     """글 수정 (소유권 확인)"""
-    post = get_post_by_id(db, post_id)
+    post = await run_db(get_post_by_id, db, post_id, load_comments=False)
 
     if not post:
         raise HTTPException(
@@ -231,7 +431,8 @@ async def update_post_endpoint(
         )
 
     try:
-        updated_post = update_post(
+        updated_post = await run_write(
+            update_post,
             db=db,
             post=post,
             title=post_data.title,
@@ -240,7 +441,9 @@ async def update_post_endpoint(
         )
 
         # 수정된 글 상세 정보 조회
-        updated_post = get_post_by_id(db, post_id)
+        updated_post = await run_db(
+            get_post_by_id, db, post_id, load_comments=False
+        )
         tags = (
             [pt.tag.name for pt in updated_post.post_tags]
             if updated_post.post_tags
@@ -251,7 +454,7 @@ async def update_post_endpoint(
             id=updated_post.id,
             title=updated_post.title,
             content=updated_post.content,
-            viewCount=updated_post.view_count,
+            viewCount=view_count_buffer.approximate(updated_post),
             likeCount=updated_post.like_count,
             createdAt=updated_post.created_at,
             author=AuthorResponse(
@@ -276,7 +479,7 @@ async def delete_post_endpoint(
     db: Session = Depends(get_db),
 ):
     """글 삭제 (소유권 확인)"""
-    post = get_post_by_id(db, post_id)
+    post = await run_db(get_post_by_id, db, post_id, load_comments=False)
 
     if not post:
         raise HTTPException(
@@ -291,7 +494,7 @@ async def delete_post_endpoint(
         )
 
     try:
-        delete_post(db=db, post=post, soft_delete=True)
+        await run_write(delete_post, db=db, post=post, soft_delete=True)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -306,52 +509,64 @@ async def toggle_post_like_endpoint(
     db: Session = Depends(get_db),
 ):
     """글 좋아요/좋아요 취소"""
-    post = get_post_by_id(db, post_id)
-
-    if not post:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="글을 찾을 수 없습니다.",
-        )
-
     try:
-        like_count, user_liked = toggle_post_like(db, post_id, current_user.id)
-
-        return LikeResponse(likeCount=like_count, userLiked=user_liked)
-
+        result = await run_write_retrying(
+            toggle_post_like, db, post_id, current_user.id
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"좋아요 처리 중 오류가 발생했습니다: {str(e)}",
         )
 
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="글을 찾을 수 없습니다.",
+        )
+
+    like_count, user_liked = result
+    return LikeResponse(likeCount=like_count, userLiked=user_liked)
+
 
 @router.get("/me/posts", response_model=PostListResponse)
 async def get_my_posts(
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=50),
+    cursor: str = Query(None),
+    includeTotal: bool = Query(False),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """내가 쓴 글 목록 조회"""
+    """내가 쓴 글 목록 조회 (cursor 지정 시 키셋 페이지네이션)"""
     try:
-        posts, total_count = get_posts(
-            db=db, page=page, limit=limit, user_id=current_user.id
+        posts, total_count, next_cursor = await run_db(
+            get_posts,
+            db=db,
+            page=page,
+            limit=limit,
+            user_id=current_user.id,
+            cursor=cursor,
+            include_total=includeTotal,
         )
 
-        total_pages = (total_count + limit - 1) // limit
+        total_pages = _calculate_total_pages(total_count, limit)
 
-        post_summaries = []
-        for post in posts:
-            comment_count = get_comment_count(db, post.id)
-            post_summaries.append(
-                _create_post_summary_response(post, comment_count)
-            )
+        post_summaries = [
+            _create_post_summary_response(post) for post in posts
+        ]
 
         return PostListResponse(
-            posts=post_summaries, totalPages=total_pages, currentPage=page
+            posts=post_summaries,
+            totalPages=total_pages,
+            currentPage=page,
+            nextCursor=next_cursor,
         )
 
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -373,7 +588,7 @@ async def create_comment_endpoint(
 ):
     """댓글/대댓글 작성"""
     # 글 존재 확인
-    post = get_post_by_id(db, post_id)
+    post = await run_db(get_post_by_id, db, post_id, load_comments=False)
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -382,7 +597,9 @@ async def create_comment_endpoint(
 
     # 부모 댓글 존재 확인 (대댓글인 경우)
     if comment_data.parentCommentId:
-        parent_comment = get_comment_by_id(db, comment_data.parentCommentId)
+        parent_comment = await run_db(
+            get_comment_by_id, db, comment_data.parentCommentId
+        )
         if not parent_comment or parent_comment.post_id != post_id:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -390,7 +607,8 @@ async def create_comment_endpoint(
             )
 
     try:
-        comment = create_comment(
+        comment = await run_write(
+            create_comment,
             db=db,
             post_id=post_id,
             user_id=current_user.id,
@@ -399,7 +617,7 @@ async def create_comment_endpoint(
         )
 
         # 생성된 댓글 정보 조회
-        created_comment = get_comment_by_id(db, comment.id)
+        created_comment = await run_db(get_comment_by_id, db, comment.id)
 
         return _create_comment_response(created_comment)
 
@@ -418,7 +636,7 @@ async def update_comment_endpoint(
     db: Session = Depends(get_db),
 ):
     """댓글 수정 (소유권 확인)"""
-    comment = get_comment_by_id(db, comment_id)
+    comment = await run_db(get_comment_by_id, db, comment_id)
 
     if not comment:
         raise HTTPException(
@@ -433,10 +651,14 @@ async def update_comment_endpoint(
         )
 
     try:
-        updated_comment = update_comment(
-            db=db, comment=comment, content=comment_data.content
+        updated_comment = await run_write(
+            update_comment,
+            db=db,
+            comment=comment,
+            content=comment_data.content,
         )
-        return _create_comment_response(updated_comment)
+        # 커밋 후 만료된 작성자 관계 로딩도 스레드 풀에서 처리
+        return await run_db(_create_comment_response, updated_comment)
 
     except Exception as e:
         raise HTTPException(
@@ -454,7 +676,7 @@ async def delete_comment_endpoint(
     db: Session = Depends(get_db),
 ):
     """댓글 삭제 (소유권 확인)"""
-    comment = get_comment_by_id(db, comment_id)
+    comment = await run_db(get_comment_by_id, db, comment_id)
 
     if not comment:
         raise HTTPException(
@@ -469,7 +691,7 @@ async def delete_comment_endpoint(
         )
 
     try:
-        delete_comment(db=db, comment=comment)
+        await run_write(delete_comment, db=db, comment=comment)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
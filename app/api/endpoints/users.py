@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.api.endpoints.auth import get_current_user
 from app.core.database import get_db
+from app.core.executor import run_db
+from app.core.password_hasher import password_hasher
+from app.core.writer import run_write
+from app.crud.posts import get_posts, get_user_stats
 from app.crud.users import (
     create_user,
     get_user_by_email,
@@ -11,17 +14,20 @@ from app.crud.users import (
     get_user_by_nickname,
     update_user,
 )
-from app.models.posts import Post
 from app.models.users import User
 from app.schemas.users import (
     UserPublicResponse,
     UserResponse,
     UserSignupRequest,
+    UserStatsResponse,
     UserUpdateRequest,
 )
 
 router = APIRouter(tags=["users"])
 
+# 사용자 글 목록의 본문 미리보기 길이
+USER_POSTS_PREVIEW_LENGTH = 200
+
 
 @router.post("/users/signup", response_model=UserResponse, status_code=201)
 async def signup(
@@ -31,7 +37,7 @@ async def signup(
     회원가입 - 새로운 사용자 계정을 생성합니다.
     """
     # 이메일 중복 체크
-    existing_email = get_user_by_email(db, signup_data.email)
+    existing_email = await run_db(get_user_by_email, db, signup_data.email)
     if existing_email:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -39,20 +45,27 @@ async def signup(
         )
 
     # 닉네임 중복 체크
-    existing_nickname = get_user_by_nickname(db, signup_data.nickname)
+    existing_nickname = await run_db(
+        get_user_by_nickname, db, signup_data.nickname
+    )
     if existing_nickname:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="이미 사용중인 닉네임입니다.",
         )
 
+    # 비밀번호 해싱은 전용 프로세스 풀에서 실행 (과부하 시 429/503)
+    hashed_password = await password_hasher.hash(signup_data.password)
+
     # 사용자 생성
     try:
-        user = create_user(
+        user = await run_write(
+            create_user,
             db=db,
             email=signup_data.email,
             password=signup_data.password,
             nickname=signup_data.nickname,
+            hashed_password=hashed_password,
         )
 
         return UserResponse(
@@ -93,19 +106,26 @@ async def update_my_profile(
     """
     # 닉네임 변경 시 중복 체크
     if update_data.nickname and update_data.nickname != current_user.nickname:
-        existing_nickname = get_user_by_nickname(db, update_data.nickname)
+        existing_nickname = await run_db(
+            get_user_by_nickname, db, update_data.nickname
+        )
         if existing_nickname:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="이미 사용중인 닉네임입니다.",
             )
 
+    hashed_password = None
+    if update_data.password is not None:
+        hashed_password = await password_hasher.hash(update_data.password)
+
     try:
-        updated_user = update_user(
+        updated_user = await run_write(
+            update_user,
             db=db,
             user=current_user,
             nickname=update_data.nickname,
-            password=update_data.password,
+            hashed_password=hashed_password,
         )
 
         return UserResponse(
@@ -127,85 +147,121 @@ async def get_user_profile(user_id: int, db: Session = Depends(get_db)):
     """
     특정 사용자 정보 조회 - 공개 정보만 반환합니다.
     """
-    user = get_user_by_id(db, user_id)
+    user = await run_db(get_user_by_id, db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="사용자를 찾을 수 없습니다.",
         )
 
+    stats = await run_db(get_user_stats, db, user_id)
+
     return UserPublicResponse(
-        id=user.id, nickname=user.nickname, createdAt=user.created_at
+        id=user.id,
+        nickname=user.nickname,
+        createdAt=user.created_at,
+        stats=UserStatsResponse(
+            postCount=stats["post_count"],
+            commentCount=stats["comment_count"],
+            likesGiven=stats["likes_given"],
+            likesReceived=stats["likes_received"],
+        ),
     )
 
 
+def _create_user_posts_response(
+    user: User,
+    posts,
+    page: int,
+    limit: int,
+    total_count: int | None,
+    next_cursor: str | None,
+    cursor: str = None,
+) -> dict:
+    """사용자 글 목록 응답 구성 (작성자는 같은 사용자이므로 한 번만 생성)"""
+    author = {"id": user.id, "nickname": user.nickname}
+
+    post_list = []
+    for post in posts:
+        post_data = {
+            "id": post.id,
+            "title": post.title,
+            "content": (
+                post.summary[:USER_POSTS_PREVIEW_LENGTH] + "..."
+                if len(post.summary) > USER_POSTS_PREVIEW_LENGTH
+                else post.summary
+            ),
+            "author": author,
+            "createdAt": post.created_at,
+            "updatedAt": post.updated_at,
+        }
+        post_list.append(post_data)
+
+    return {
+        "posts": post_list,
+        "pagination": {
+            "currentPage": page,
+            "totalPages": (
+                (total_count + limit - 1) // limit
+                if total_count is not None
+                else None
+            ),
+            "totalCount": total_count,
+            "hasNext": next_cursor is not None,
+            "hasPrevious": page > 1 or cursor is not None,
+            "nextCursor": next_cursor,
+        },
+    }
+
+
 @router.get("/users/{user_id}/posts")
 async def get_user_posts(
     user_id: int,
     page: int = Query(1, ge=1, description="페이지 번호"),
     limit: int = Query(10, ge=1, le=100, description="페이지당 글 개수"),
+    cursor: str = Query(
+        None, description="다음 페이지 커서 (지정 시 page 무시)"
+    ),
+    includeTotal: bool = Query(False, description="전체 개수 포함 여부"),
     db: Session = Depends(get_db),
 ):
     """
     특정 사용자가 작성한 글 목록 조회
     """
     # 사용자 존재 확인
-    user = get_user_by_id(db, user_id)
+    user = await run_db(get_user_by_id, db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="사용자를 찾을 수 없습니다.",
         )
 
-    # 페이지네이션 계산
-    offset = (page - 1) * limit
-
     try:
-        # 해당 사용자의 글 조회
-        stmt = (
-            select(Post)
-            .where(Post.user_id == user_id)
-            .order_by(Post.created_at.desc())
-            .offset(offset)
-            .limit(limit)
+        # 공용 글 목록 조회 사용 (삭제된 글 제외)
+        posts, _, next_cursor = await run_db(
+            get_posts,
+            db=db,
+            page=page,
+            limit=limit,
+            user_id=user_id,
+            cursor=cursor,
+            include_total=False,
+            summary_length=USER_POSTS_PREVIEW_LENGTH,
         )
-        posts = db.scalars(stmt).all()
-
-        # 전체 글 개수 조회
-        total_stmt = select(Post).where(Post.user_id == user_id)
-        total_count = len(db.scalars(total_stmt).all())
-
-        # 응답 데이터 구성
-        post_list = []
-        for post in posts:
-            post_data = {
-                "id": post.id,
-                "title": post.title,
-                "content": (
-                    post.content[:200] + "..."
-                    if len(post.content) > 200
-                    else post.content
-                ),
-                "author": {
-                    "id": post.author.id,
-                    "nickname": post.author.nickname,
-                },
-                "createdAt": post.created_at,
-                "updatedAt": post.updated_at,
-            }
-            post_list.append(post_data)
-
-        return {
-            "posts": post_list,
-            "pagination": {
-                "currentPage": page,
-                "totalPages": (total_count + limit - 1) // limit,
-                "totalCount": total_count,
-                "hasNext": page * limit < total_count,
-                "hasPrevious": page > 1,
-            },
-        }
 
+        # 전체 개수는 사용자 집계 테이블에서 읽음
+        total_count = None
+        if includeTotal:
+            stats = await run_db(get_user_stats, db, user_id)
+            total_count = stats["post_count"]
+        return _create_user_posts_response(
+            user, posts, page, limit, total_count, next_cursor, cursor
+        )
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -0,0 +1,198 @@
+import threading
+import time
+from typing import Any, Dict, List
+
+import duckdb
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import duckdb_manager
+from app.core.executor import DatabaseExecutor
+
+# 활동 추이 집계 단위 (date_trunc 단위)
+ANALYTICS_BUCKETS = ("hour", "day", "week")
+
+# 조회 기간 시작 시각 (최근 $days일)
+_WINDOW_START = "now()::TIMESTAMP - to_days(CAST($days AS INTEGER))"
+
+# 가입/글/댓글/좋아요를 한 번의 스캔으로 단위 시간별 집계
+# (좋아요 시각은 post_likes.created_at 추가 이후 행에만 있음)
+ACTIVITY_SQL = f"""
+WITH events AS (
+    SELECT 'signups' AS kind, created_at FROM users
+    UNION ALL
+    SELECT 'posts', created_at FROM posts WHERE deleted_at IS NULL
+    UNION ALL
+    SELECT 'comments', created_at FROM comments
+    UNION ALL
+    SELECT 'likes', created_at FROM post_likes
+)
+SELECT
+    date_trunc($bucket, created_at) AS bucket_start,
+    count(*) FILTER (WHERE kind = 'signups') AS signups,
+    count(*) FILTER (WHERE kind = 'posts') AS posts,
+    count(*) FILTER (WHERE kind = 'comments') AS comments,
+    count(*) FILTER (WHERE kind = 'likes') AS likes
+FROM events
+WHERE created_at >= {_WINDOW_START}
+GROUP BY bucket_start
+ORDER BY bucket_start
+"""
+
+# 기간 내 작성 글 기준 작성자 순위 (집계 후 윈도 함수로 순위, QUALIFY로 자름)
+TOP_AUTHORS_SQL = f"""
+SELECT
+    rank() OVER (
+        ORDER BY count(*) DESC, sum(p.like_count) DESC
+    ) AS rank,
+    u.id,
+    u.nickname,
+    count(*) AS posts,
+    sum(p.like_count) AS likes,
+    sum(p.comment_count) AS comments
+FROM posts p
+JOIN users u ON u.id = p.user_id
+WHERE p.deleted_at IS NULL AND p.created_at >= {_WINDOW_START}
+GROUP BY u.id, u.nickname
+QUALIFY rank <= $limit
+ORDER BY rank, u.id
+"""
+
+# 기간 내 작성 글 기준 태그 순위
+TOP_TAGS_SQL = f"""
+SELECT
+    rank() OVER (
+        ORDER BY count(*) DESC, sum(p.like_count) DESC
+    ) AS rank,
+    t.id,
+    t.name,
+    count(*) AS posts,
+    sum(p.like_count) AS likes
+FROM post_tags pt
+JOIN posts p ON p.id = pt.post_id
+JOIN tags t ON t.id = pt.tag_id
+WHERE p.deleted_at IS NULL AND p.created_at >= {_WINDOW_START}
+GROUP BY t.id, t.name
+QUALIFY rank <= $limit
+ORDER BY rank, t.name
+"""
+
+
+class AnalyticsTimeoutError(Exception):
+    """분석 쿼리 시간 상한 초과 (504)"""
+
+
+class AnalyticsReporter:
+    """관리자 분석 리포트 실행기
+
+    요청 처리용 DB 스레드 풀과 연결 풀을 쓰지 않도록 전용 스레드 풀에서,
+    Raw SQL 커서 풀(duckdb_manager)의 커서로 집계 쿼리를 실행합니다.
+    쿼리가 query_timeout을 넘으면 중단하고, 결과는 (리포트, 인자) 키로
+    cache_ttl 동안 재사용합니다.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = None,
+        query_timeout: float = None,
+        cache_ttl: float = None,
+        cache_max_entries: int = None,
+    ):
+        self.query_timeout = (
+            query_timeout or settings.ANALYTICS_QUERY_TIMEOUT_SECONDS
+        )
+        self.executor = DatabaseExecutor(
+            max_workers=max_workers or settings.ANALYTICS_MAX_WORKERS,
+            thread_name_prefix="analytics",
+        )
+        self.cache = TTLCache(
+            max_entries=cache_max_entries
+            or settings.ANALYTICS_CACHE_MAX_ENTRIES,
+            ttl_seconds=cache_ttl or settings.ANALYTICS_CACHE_TTL_SECONDS,
+        )
+        self._lock = threading.Lock()
+
+        # 메트릭
+        self._queries = 0
+        self._timeouts = 0
+        self._total_query = 0.0
+
+    def _query(self, sql: str, params: Dict[str, Any]) -> List[dict]:
+        """시간 상한을 두고 쿼리 실행 (워커 스레드에서 실행)"""
+        started_at = time.perf_counter()
+        try:
+            # 중단된 커서는 풀에 반납되지 않고 버려짐
+            with duckdb_manager.cursor() as cursor:
+                timer = threading.Timer(self.query_timeout, cursor.interrupt)
+                timer.start()
+                try:
+                    result = cursor.execute(sql, params)
+                    columns = [column[0] for column in result.description]
+                    rows = [
+                        dict(zip(columns, row)) for row in result.fetchall()
+                    ]
+                finally:
+                    timer.cancel()
+        except duckdb.InterruptException as e:
+            with self._lock:
+                self._timeouts += 1
+            raise AnalyticsTimeoutError(
+                "분석 쿼리가 시간 제한을 초과했습니다."
+            ) from e
+
+        with self._lock:
+            self._queries += 1
+            self._total_query += time.perf_counter() - started_at
+        return rows
+
+    async def _report(self, name: str, sql: str, **params: Any) -> List[dict]:
+        """캐시된 결과가 없을 때만 전용 스레드 풀에서 쿼리 실행"""
+        key = (name, tuple(sorted(params.items())))
+        rows = self.cache.get(key)
+        if rows is None:
+            rows = await self.executor.run(self._query, sql, params)
+            self.cache.set(key, rows)
+        return rows
+
+    async def activity(self, bucket: str, days: int) -> List[dict]:
+        """단위 시간별 가입/글/댓글/좋아요 수"""
+        if bucket not in ANALYTICS_BUCKETS:
+            raise ValueError("지원하지 않는 집계 단위입니다.")
+        return await self._report(
+            "activity", ACTIVITY_SQL, bucket=bucket, days=days
+        )
+
+    async def top_authors(self, days: int, limit: int) -> List[dict]:
+        """기간 내 글 수 기준 상위 작성자"""
+        return await self._report(
+            "topAuthors", TOP_AUTHORS_SQL, days=days, limit=limit
+        )
+
+    async def top_tags(self, days: int, limit: int) -> List[dict]:
+        """기간 내 글 수 기준 상위 태그"""
+        return await self._report(
+            "topTags", TOP_TAGS_SQL, days=days, limit=limit
+        )
+
+    def stats(self) -> dict:
+        """쿼리/캐시/스레드 풀 메트릭"""
+        with self._lock:
+            return {
+                "queries": self._queries,
+                "timeouts": self._timeouts,
+                "avgQueryMs": (
+                    round(self._total_query / self._queries * 1000, 3)
+                    if self._queries
+                    else 0.0
+                ),
+                "cache": self.cache.stats(),
+                "executor": self.executor.stats(),
+            }
+
+    def shutdown(self):
+        """스레드 풀 종료"""
+        self.executor.shutdown()
+
+
+# 전역 분석 리포트 실행기 인스턴스
+analytics_reporter = AnalyticsReporter()
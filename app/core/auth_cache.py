@@ -0,0 +1,111 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.security import decode_token
+from app.models.users import User
+
+
+class AuthCache:
+    """인증 요청마다 반복되는 토큰 디코딩/사용자 조회 캐시
+
+    토큰 해시 → subject(이메일), subject → 사용자 컬럼 값 두 단계로
+    캐시합니다. 캐시한 사용자는 요청 세션에 조회 없이 붙여서 반환하며,
+    사용자 수정/삭제 시 invalidate_user로 무효화해야 합니다.
+
+    사용자를 조회하기 전에 user_version()을 읽어 두었다가 set_user()에
+    넘기면, 조회 도중 그 사용자가 무효화된 경우 이전 값은 저장되지
+    않습니다 (VersionedCache와 같은 방식, 버전은 이메일별로 기록).
+    """
+
+    def __init__(self, max_entries: int = None, ttl_seconds: float = None):
+        max_entries = max_entries or settings.AUTH_CACHE_MAX_ENTRIES
+        self.ttl_seconds = ttl_seconds or settings.AUTH_CACHE_TTL_SECONDS
+        self.tokens = TTLCache(max_entries, self.ttl_seconds)
+        self.users = TTLCache(max_entries, self.ttl_seconds)
+        self._user_columns = [attr.key for attr in inspect(User).column_attrs]
+        self._lock = threading.Lock()
+        self._version = 0
+        # 이메일별 마지막 무효화 버전 (최근 max_entries개만 유지)
+        self._max_invalidated = max_entries
+        self._invalidated: "OrderedDict[str, int]" = OrderedDict()
+        # 이 버전 이전에 시작한 조회는 저장하지 않음 (기록이 밀려난 경우 등)
+        self._min_version = 0
+
+    def get_subject(self, token: str) -> str | None:
+        """토큰의 subject 반환 (검증 실패 시 None)"""
+        key = hashlib.sha256(token.encode()).hexdigest()
+        subject = self.tokens.get(key)
+        if subject is not None:
+            return subject
+
+        payload = decode_token(token)
+        if payload is None or payload.get("sub") is None:
+            return None
+
+        # 토큰 만료 시각 이후까지는 캐시하지 않음
+        ttl = self.ttl_seconds
+        if payload.get("exp") is not None:
+            ttl = min(ttl, payload["exp"] - time.time())
+        self.tokens.set(key, payload["sub"], ttl)
+        return payload["sub"]
+
+    def get_user(self, db: Session, email: str) -> User | None:
+        """캐시된 사용자를 요청 세션에 붙여서 반환 (없으면 None)"""
+        values = self.users.get(email)
+        if values is None:
+            return None
+
+        user = User(**values)
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+    def user_version(self) -> int:
+        """사용자 조회 전에 읽어 set_user()에 넘길 현재 버전"""
+        with self._lock:
+            return self._version
+
+    def set_user(self, user: User, version: int) -> bool:
+        """조회 이후 무효화되지 않았을 때만 사용자 캐시 (저장 여부 반환)"""
+        values = {key: getattr(user, key) for key in self._user_columns}
+        with self._lock:
+            if (
+                version < self._min_version
+                or self._invalidated.get(user.email, 0) > version
+            ):
+                return False
+            self.users.set(user.email, values)
+            return True
+
+    def invalidate_user(self, email: str):
+        """사용자 캐시 무효화 (사용자 수정/삭제 시)"""
+        with self._lock:
+            self._version += 1
+            self._invalidated[email] = self._version
+            self._invalidated.move_to_end(email)
+            while len(self._invalidated) > self._max_invalidated:
+                # 기록이 밀려난 사용자도 무효화 이전 조회는 저장되지 않도록
+                _, version = self._invalidated.popitem(last=False)
+                self._min_version = version
+            self.users.pop(email)
+
+    def invalidate_users(self):
+        """모든 사용자 캐시 무효화 (reader의 스냅샷 교체 시)"""
+        with self._lock:
+            self._version += 1
+            self._min_version = self._version
+            self.users.clear()
+
+    def stats(self) -> dict:
+        """캐시 메트릭"""
+        return {"tokens": self.tokens.stats(), "users": self.users.stats()}
+
+
+# 전역 인증 캐시 인스턴스
+auth_cache = AuthCache()
@@ -0,0 +1,266 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable
+
+
+class TTLCache:
+    """만료 시간(TTL)과 최대 항목 수(LRU)를 가진 스레드 안전 캐시
+
+    항목 수가 max_entries를 넘으면 가장 오래 사용하지 않은 항목부터
+    제거합니다. 조회 적중/실패 횟수를 메트릭으로 제공합니다.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = (
+            OrderedDict()
+        )
+
+        # 메트릭
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """캐시 조회 (없거나 만료되었으면 default)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: float = None):
+        """캐시 저장 (ttl_seconds 미지정 시 기본 TTL)"""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return
+
+        expires_at = time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def pop(self, key: Hashable):
+        """캐시 항목 무효화"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """전체 캐시 무효화"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """캐시 메트릭"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hitRate": (
+                    round(self._hits / lookups, 4) if lookups else 0.0
+                ),
+                "evictions": self._evictions,
+            }
+
+
+class VersionedCache:
+    """버전 번호로 한 번에 무효화하는 TTL 캐시
+
+    항목은 (버전, 키)로 저장되어 쓰기 경로가 bump()로 버전을 올리면 이전
+    항목은 더 이상 조회되지 않습니다. 값을 계산하기 전에 version을 읽어
+    두었다가 그 버전으로 set()하면, 계산 도중 무효화된 결과는 저장되지
+    않습니다. TTL은 다른 프로세스의 쓰기가 반영되기까지의 최대 지연입니다.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self._cache = TTLCache(max_entries, ttl_seconds)
+        self._lock = threading.Lock()
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """현재 버전"""
+        with self._lock:
+            return self._version
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """현재 버전의 항목 조회 (없거나 만료되었으면 default)"""
+        return self._cache.get((self.version, key), default)
+
+    def set(self, key: Hashable, value: Any, version: int) -> bool:
+        """version이 현재 버전일 때만 저장 (저장 여부 반환)"""
+        with self._lock:
+            if version != self._version:
+                return False
+            self._cache.set((version, key), value)
+            return True
+
+    def bump(self) -> int:
+        """버전을 올려 모든 항목 무효화 (새 버전 반환)"""
+        with self._lock:
+            self._version += 1
+            self._cache.clear()
+            return self._version
+
+    def stats(self) -> dict:
+        """캐시 메트릭"""
+        return {"version": self.version, **self._cache.stats()}
+
+
+class ScopedVersionedCache:
+    """범위(scope)별 버전으로 무효화하는 stale-while-revalidate 캐시
+
+    항목은 계산을 시작할 때 읽은 버전과 함께 저장됩니다. 전체 범위(None)
+    항목은 전체 버전, 그 외 범위(예: 태그) 항목은 해당 범위 버전이 같을
+    때만 유효합니다. bump(scopes)는 전체 버전과 주어진 범위들의 버전을
+    올리고, bump_all()은 모든 항목을 무효화합니다.
+
+    버전이 같아도 TTL이 지난 항목은 stale 상태가 되어, stale_seconds 동안은
+    이전 값을 그대로 돌려주고 호출한 쪽이 백그라운드에서 다시 계산합니다
+    (TTL은 캐시를 거치지 않은 쓰기가 반영되기까지의 지연 상한).
+    항목 수가 max_entries를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(
+        self, max_entries: int, ttl_seconds: float, stale_seconds: float
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self._lock = threading.Lock()
+        # 키 -> (버전, 저장 시각, 값)
+        self._entries: "OrderedDict[Hashable, tuple[tuple, float, Any]]" = (
+            OrderedDict()
+        )
+        self._epoch = 0
+        self._global_version = 0
+        self._scope_versions: dict[Hashable, int] = {}
+        self._refreshing: set = set()
+
+        # 메트릭
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._refreshes = 0
+        self._total_stale = 0.0
+        self._max_stale = 0.0
+
+    def _version(self, scope: Hashable) -> tuple:
+        # self._lock을 잡은 상태에서 호출 (범위가 바뀐 키는 버전도 다름)
+        if scope is None:
+            return self._epoch, scope, self._global_version
+        return self._epoch, scope, self._scope_versions.get(scope, 0)
+
+    def version(self, scope: Hashable = None) -> tuple:
+        """범위의 현재 버전 (계산 전에 읽어 set()에 전달)"""
+        with self._lock:
+            return self._version(scope)
+
+    def get(self, key: Hashable, scope: Hashable = None) -> tuple[Any, bool]:
+        """항목 조회 ((값, stale 여부), 없거나 무효화되었으면 (None, False))
+
+        stale 여부가 True이면 호출한 쪽이 begin_refresh()로 재계산을 시작합니다.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == self._version(scope):
+                age = now - entry[1]
+                if age < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry[2], False
+
+                stale = age - self.ttl_seconds
+                if stale < self.stale_seconds:
+                    self._entries.move_to_end(key)
+                    self._stale_hits += 1
+                    self._total_stale += stale
+                    self._max_stale = max(self._max_stale, stale)
+                    return entry[2], True
+
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return None, False
+
+    def set(
+        self, key: Hashable, value: Any, version: tuple, scope: Hashable = None
+    ) -> bool:
+        """version이 범위의 현재 버전일 때만 저장 (저장 여부 반환)"""
+        with self._lock:
+            if version != self._version(scope):
+                return False
+            self._entries[key] = (version, time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+            return True
+
+    def begin_refresh(self, key: Hashable) -> bool:
+        """키의 백그라운드 재계산 시작 (이미 진행 중이면 False)"""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self._refreshes += 1
+            return True
+
+    def end_refresh(self, key: Hashable):
+        """키의 백그라운드 재계산 종료"""
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def bump(self, scopes: Iterable[Hashable] = ()):
+        """전체 버전과 주어진 범위들의 버전을 올림"""
+        with self._lock:
+            self._global_version += 1
+            for scope in scopes:
+                self._scope_versions[scope] = (
+                    self._scope_versions.get(scope, 0) + 1
+                )
+
+    def bump_all(self):
+        """모든 범위의 항목 무효화"""
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """캐시 메트릭 (적중률은 stale 응답 포함)"""
+        with self._lock:
+            served = self._hits + self._stale_hits
+            lookups = served + self._misses
+            return {
+                "version": self._global_version,
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "staleHits": self._stale_hits,
+                "misses": self._misses,
+                "hitRate": round(served / lookups, 4) if lookups else 0.0,
+                "avgStaleMs": (
+                    round(self._total_stale / self._stale_hits * 1000, 3)
+                    if self._stale_hits
+                    else 0.0
+                ),
+                "maxStaleMs": round(self._max_stale * 1000, 3),
+                "refreshes": self._refreshes,
+                "evictions": self._evictions,
+            }
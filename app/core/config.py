@@ -31,6 +31,80 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "duckdb:///./test_devdeck.duckdb"
     DUCKDB_FILE: str = "./test_devdeck.duckdb"
 
+    # SQLAlchemy 연결 풀 설정 (Raw SQL 커서 풀과 같은 DuckDB 인스턴스 사용)
+    # 풀 크기는 DB 스레드 풀과 백그라운드 작업이 동시에 쓸 수 있는 연결 수
+    DB_POOL_SIZE: int = 10
+    DB_POOL_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE_SECONDS: int = 3600  # -1이면 재생성 안 함
+
+    # 배포 모드
+    # - primary: 단일 프로세스가 DB 파일을 읽기/쓰기 (기본값)
+    # - writer: 쓰기 전담 프로세스, 주기적으로 스냅샷 발행
+    # - reader: 최신 스냅샷을 읽기 전용으로 열고 쓰기 요청은 writer로 전달
+    DB_ROLE: str = "primary"
+    WRITER_SOCKET_PATH: str = "./devdeck-writer.sock"
+    WRITER_FORWARD_TIMEOUT_SECONDS: float = 30.0
+    SNAPSHOT_DIR: str = "./snapshots"
+    SNAPSHOT_INTERVAL_SECONDS: float = 2.0
+    SNAPSHOT_KEEP: int = 3  # 읽는 중인 reader를 위해 남겨둘 이전 스냅샷 수
+    SNAPSHOT_WAIT_SECONDS: float = 30.0  # reader 시작 시 첫 스냅샷 대기
+    # reader -> writer 내부 API 공유 비밀 (비어 있으면 SECRET_KEY에서 파생)
+    INTERNAL_API_TOKEN: str = ""
+
+    # Raw SQL 커서 풀 설정 (최대 커서 수, 체크아웃 대기 상한)
+    DUCKDB_CURSOR_POOL_SIZE: int = 8
+    DUCKDB_CURSOR_CHECKOUT_TIMEOUT_SECONDS: float = 30.0
+
+    # DB 작업 스레드 풀 설정
+    DB_EXECUTOR_MAX_WORKERS: int = 8
+
+    # 쓰기 스레드 그룹 커밋 설정 (배치를 모으는 시간, 배치 최대 작업 수)
+    WRITE_BATCH_WINDOW_SECONDS: float = 0.002
+    WRITE_BATCH_MAX_SIZE: int = 32
+    # DuckDB 쓰기 충돌 시 작업 재제출 최대 시도 횟수 (run_write_retrying)
+    WRITE_CONFLICT_MAX_ATTEMPTS: int = 20
+
+    # 조회수 버퍼 반영 설정
+    VIEW_COUNT_FLUSH_INTERVAL_SECONDS: float = 5.0
+    VIEW_COUNT_FLUSH_THRESHOLD: int = 1000
+
+    # 인증 사용자 캐시 설정
+    AUTH_CACHE_TTL_SECONDS: float = 60.0
+    AUTH_CACHE_MAX_ENTRIES: int = 10000
+
+    # 비밀번호 해시 설정 (bcrypt cost, 전용 프로세스 풀)
+    PASSWORD_HASH_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    # 댓글 트리 최대 깊이 (더 깊은 답글은 마지막 단계에 평탄화)
+    COMMENT_MAX_DEPTH: int = 5
+
+    # 댓글 페이지네이션 설정 (글 상세 기본 댓글 수, 댓글별 답글 미리보기 수)
+    POST_DETAIL_COMMENTS_LIMIT: int = 20
+    COMMENT_REPLIES_PREVIEW_LIMIT: int = 3
+
+    # 대시보드 일별 집계 재구성 주기 (그 사이 쓰기는 증분 반영)
+    DASHBOARD_STATS_REFRESH_SECONDS: float = 300.0
+
+    # 관리자 분석 리포트 설정 (전용 스레드 수, 쿼리 시간 상한, 결과 캐시)
+    ANALYTICS_MAX_WORKERS: int = 2
+    ANALYTICS_QUERY_TIMEOUT_SECONDS: float = 10.0
+    ANALYTICS_CACHE_TTL_SECONDS: float = 60.0
+    ANALYTICS_CACHE_MAX_ENTRIES: int = 256
+
+    # 공지사항 캐시 유지 시간 (다른 워커의 변경이 반영되기까지 최대 지연)
+    ANNOUNCEMENT_CACHE_TTL_SECONDS: float = 30.0
+
+    # 글 목록 앞 페이지 응답 캐시 설정
+    # (TTL 후 stale 응답 허용 시간 동안은 이전 응답을 주고 백그라운드 재계산)
+    POST_LIST_CACHE_TTL_SECONDS: float = 10.0
+    POST_LIST_CACHE_STALE_SECONDS: float = 30.0
+    POST_LIST_CACHE_MAX_ENTRIES: int = 512
+    POST_LIST_CACHE_MAX_PAGE: int = 3
+
     # JWT 설정 (필요시 사용)
     SECRET_KEY: str = "your-secret-key-change-this-in-production"
     ALGORITHM: str = "HS256"
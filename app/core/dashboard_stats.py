@@ -0,0 +1,217 @@
+import asyncio
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, List
+
+from sqlalchemy import Date, DateTime, cast, func, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import sqlalchemy_manager
+from app.core.executor import run_db
+from app.core.writer import db_writer
+from app.models.comments import Comment
+from app.models.posts import Post
+from app.models.users import User
+
+# 집계 항목 (가입, 삭제 안 된 글, 댓글)
+DASHBOARD_METRICS = ("signups", "posts", "comments")
+
+
+class DashboardStats:
+    """관리자 대시보드 일별 집계 (프로세스 메모리)
+
+    시작 시와 주기적으로 한 번의 집계 쿼리로 일별 가입/글/댓글 수를 다시
+    읽고, 그 사이의 쓰기는 커밋 후 해당 날짜 버킷에 증분으로 반영합니다.
+    다른 프로세스의 쓰기나 하드 삭제처럼 증분으로 따라가기 어려운 변경은
+    다음 재집계에서 보정됩니다.
+
+    집계 쿼리는 잠금 밖에서 실행합니다. 스냅샷은 쓰기 배치 사이에서
+    고정하므로 스냅샷에 보이는 커밋의 증분은 이미 반영된 상태이고, 이후
+    들어온 증분만 기록해 두었다가 새 집계에 다시 더합니다. 날짜는 DB
+    타임스탬프(current_timestamp)와 같은 시간대 기준입니다.
+    """
+
+    def __init__(self, refresh_interval: float = None):
+        self.refresh_interval = (
+            refresh_interval or settings.DASHBOARD_STATS_REFRESH_SECONDS
+        )
+        self._lock = threading.Lock()
+        self._days: Dict[str, Dict[date, int]] = {
+            metric: defaultdict(int) for metric in DASHBOARD_METRICS
+        }
+        self._totals: Dict[str, int] = dict.fromkeys(DASHBOARD_METRICS, 0)
+        self._built = False
+        self._stale = False
+        # 재집계 중 들어온 증분 (진행 중인 재집계마다 하나씩, None은 무효화)
+        self._replays: List[List[tuple | None]] = []
+        # DB 타임스탬프 시간대의 UTC 오프셋 (재집계 때 DB 시각으로 보정)
+        self._utc_offset = datetime.now().astimezone().utcoffset()
+
+        # 메트릭
+        self._refreshes = 0
+        self._records = 0
+        self._last_refresh_ms = 0.0
+
+    def refresh(self, db: Session) -> int:
+        """원본 테이블에서 일별 집계 재구성 (집계된 날짜 버킷 수 반환)"""
+
+        def per_day(metric: str, created_at, *criteria):
+            day = cast(created_at, Date)
+            return (
+                select(
+                    literal(metric).label("metric"),
+                    day.label("day"),
+                    func.count().label("n"),
+                )
+                .where(*criteria)
+                .group_by(day)
+            )
+
+        stmt = union_all(
+            per_day("signups", User.created_at),
+            per_day("posts", Post.created_at, Post.deleted_at.is_(None)),
+            per_day("comments", Comment.created_at),
+        )
+
+        # 요청에서 이미 시작된 트랜잭션이면 종료하고 새 스냅샷에서 집계
+        if db.in_transaction():
+            db.commit()
+
+        started_at = time.perf_counter()
+        # 쓰기 배치 사이에서 스냅샷 고정 (이후 커밋의 증분은 따로 기록)
+        with db_writer.paused():
+            db_now = db.scalar(
+                select(cast(func.current_timestamp(), DateTime))
+            )
+            replay = []
+            with self._lock:
+                self._replays.append(replay)
+
+        try:
+            rows = db.execute(stmt).all()
+        finally:
+            with self._lock:
+                self._replays.remove(replay)
+
+        days = {metric: defaultdict(int) for metric in DASHBOARD_METRICS}
+        for metric, day, count in rows:
+            days[metric][day] = count
+
+        with self._lock:
+            for entry in replay:
+                if entry is not None:
+                    metric, day, amount = entry
+                    days[metric][day] += amount
+            self._days = days
+            self._totals = {
+                metric: sum(buckets.values())
+                for metric, buckets in days.items()
+            }
+            # 분 단위 오차를 버리고 15분 단위 시간대 오프셋으로 맞춤
+            offset_minutes = (db_now - datetime.utcnow()).total_seconds() / 60
+            self._utc_offset = timedelta(
+                minutes=round(offset_minutes / 15) * 15
+            )
+            self._built = True
+            # 스냅샷 이후 무효화되었으면 다음 조회 때 다시 집계
+            self._stale = None in replay
+            self._refreshes += 1
+            self._last_refresh_ms = round(
+                (time.perf_counter() - started_at) * 1000, 3
+            )
+            return len(rows)
+
+    def today(self) -> date:
+        """DB 타임스탬프 시간대 기준 오늘 날짜"""
+        return (datetime.utcnow() + self._utc_offset).date()
+
+    def ensure_fresh(self, db: Session):
+        """집계가 없거나 무효화되었으면 재구성"""
+        if not self._built or self._stale:
+            self.refresh(db)
+
+    def record(self, metric: str, amount: int = 1, day: date = None):
+        """커밋된 쓰기를 날짜 버킷에 반영 (기본은 오늘)"""
+        if isinstance(day, datetime):
+            day = day.date()
+        day = day or self.today()
+        with self._lock:
+            self._days[metric][day] += amount
+            self._totals[metric] += amount
+            self._records += 1
+            for replay in self._replays:
+                replay.append((metric, day, amount))
+
+    def invalidate(self):
+        """다음 조회 때 재구성하도록 표시 (증분으로 반영할 수 없는 변경)"""
+        with self._lock:
+            self._stale = True
+            for replay in self._replays:
+                replay.append(None)
+
+    def summary(self, today: date = None) -> dict:
+        """전체/오늘 집계"""
+        today = today or self.today()
+        with self._lock:
+            return {
+                "totalUsers": self._totals["signups"],
+                "todaySignups": self._days["signups"].get(today, 0),
+                "totalPosts": self._totals["posts"],
+                "todayPosts": self._days["posts"].get(today, 0),
+                "totalComments": self._totals["comments"],
+            }
+
+    def series(self, days: int, today: date = None) -> List[dict]:
+        """최근 days일의 일별 집계 (오래된 날짜부터, 빈 날짜는 0)"""
+        today = today or self.today()
+        with self._lock:
+            return [
+                {
+                    "date": day,
+                    **{
+                        metric: self._days[metric].get(day, 0)
+                        for metric in DASHBOARD_METRICS
+                    },
+                }
+                for day in (
+                    today - timedelta(days=offset)
+                    for offset in range(days - 1, -1, -1)
+                )
+            ]
+
+    def _refresh_now(self):
+        db = sqlalchemy_manager.get_session()
+        try:
+            self.refresh(db)
+        finally:
+            db.close()
+
+    async def run_periodic_refresh(self):
+        """refresh_interval마다 DB 스레드 풀에서 재집계 (lifespan 백그라운드 작업)"""
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await run_db(self._refresh_now)
+            except Exception as e:
+                print(f"Dashboard stats refresh error: {e}")
+
+    def stats(self) -> dict:
+        """집계 상태 메트릭"""
+        with self._lock:
+            return {
+                "built": self._built,
+                "stale": self._stale,
+                "days": len(
+                    set().union(*(b.keys() for b in self._days.values()))
+                ),
+                "refreshes": self._refreshes,
+                "records": self._records,
+                "lastRefreshMs": self._last_refresh_ms,
+            }
+
+
+# 전역 대시보드 집계 인스턴스
+dashboard_stats = DashboardStats()
@@ -1,75 +1,286 @@
-from typing import Generator, Optional
+import threading
+import time
+from contextlib import contextmanager
+from typing import Generator, Iterator, Optional
 
 import duckdb
-from sqlalchemy import create_engine
+from duckdb_engine import ConnectionWrapper
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
 from app.models import Base
 
+# create_all()은 기존 테이블에 컬럼을 추가하지 않으므로 신규 컬럼은 여기서 보강
+# (테이블, 컬럼, 컬럼 정의)
+SCHEMA_UPGRADES = [
+    ("posts", "comment_count", "INTEGER DEFAULT 0"),
+    ("post_likes", "created_at", "TIMESTAMP DEFAULT current_timestamp"),
+]
+
+
+class CursorPoolTimeoutError(TimeoutError):
+    """커서 풀 대기 시간 초과"""
+
 
 class DuckDBManager:
-    """DuckDB 데이터베이스 매니저 (Raw SQL용)"""
+    """DuckDB 데이터베이스 매니저 (Raw SQL용)
 
-    def __init__(self, db_path: str = None):
+    하나의 데이터베이스 연결에서 만든 커서(connection.cursor())를 풀로
+    관리합니다. 커서는 한 번에 한 스레드만 사용하도록 체크아웃/반납하며,
+    여러 스레드의 Raw SQL이 같은 데이터베이스에서 병렬로 실행됩니다.
+    """
+
+    def __init__(
+        self,
+        db_path: str = None,
+        max_cursors: int = None,
+        checkout_timeout: float = None,
+        read_only: bool = False,
+    ):
         self.db_path = db_path or settings.DUCKDB_FILE
+        self.read_only = read_only
+        self.max_cursors = max_cursors or settings.DUCKDB_CURSOR_POOL_SIZE
+        self.checkout_timeout = (
+            checkout_timeout or settings.DUCKDB_CURSOR_CHECKOUT_TIMEOUT_SECONDS
+        )
         self._connection: Optional[duckdb.DuckDBPyConnection] = None
+        self._idle: list[duckdb.DuckDBPyConnection] = []
+        self._size = 0
+        self._generation = 0  # close_connection() 시 증가
+        self._condition = threading.Condition()
 
-    def get_connection(self) -> duckdb.DuckDBPyConnection:
-        """DuckDB 연결 반환"""
+        # 메트릭
+        self._checkouts = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._discarded = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _get_connection(self) -> duckdb.DuckDBPyConnection:
+        # self._condition을 잡은 상태에서 호출
         if self._connection is None:
-            self._connection = duckdb.connect(self.db_path)
+            self._connection = duckdb.connect(
+                self.db_path, read_only=self.read_only
+            )
         return self._connection
 
-    def close_connection(self):
-        """연결 종료"""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+    def get_connection(self) -> duckdb.DuckDBPyConnection:
+        """DuckDB 연결 반환 (커서를 만드는 기준 연결)"""
+        with self._condition:
+            return self._get_connection()
+
+    def new_cursor(self) -> duckdb.DuckDBPyConnection:
+        """풀 밖에서 쓸 새 커서 생성 (같은 데이터베이스 인스턴스 공유)"""
+        return self.get_connection().cursor()
+
+    def _checkout(
+        self, timeout: float
+    ) -> tuple[duckdb.DuckDBPyConnection, int]:
+        """유휴 커서를 꺼내거나 새로 생성 (가득 차면 대기, 커서와 세대 반환)"""
+        started_at = time.perf_counter()
+        deadline = started_at + timeout
+        waited = False
+        with self._condition:
+            while not self._idle and self._size >= self.max_cursors:
+                if not waited:
+                    waited = True
+                    self._waits += 1
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise CursorPoolTimeoutError(
+                        "사용 가능한 DuckDB 커서가 없습니다."
+                    )
+                self._condition.wait(remaining)
+
+            if self._idle:
+                cursor = self._idle.pop()
+            else:
+                cursor = self._get_connection().cursor()
+                self._size += 1
+
+            wait = time.perf_counter() - started_at
+            self._checkouts += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+            return cursor, self._generation
+
+    def _release(
+        self,
+        cursor: duckdb.DuckDBPyConnection,
+        generation: int,
+        discard: bool,
+    ):
+        """커서 반납 (오류가 났거나 종료된 연결의 커서는 닫고 버림)"""
+        with self._condition:
+            if generation != self._generation:
+                # 사용 중에 close_connection()된 커서 (풀 크기는 이미 정리됨)
+                discard = True
+            elif discard:
+                self._size -= 1
+                self._discarded += 1
+            else:
+                self._idle.append(cursor)
+            self._condition.notify()
+        if discard:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+
+    @contextmanager
+    def cursor(
+        self, timeout: float = None
+    ) -> Iterator[duckdb.DuckDBPyConnection]:
+        """풀에서 커서를 빌려 with 블록 동안 사용 후 반납"""
+        cursor, generation = self._checkout(timeout or self.checkout_timeout)
+        discard = False
+        try:
+            yield cursor
+        except BaseException:
+            # 진행 중이던 트랜잭션 상태를 다음 사용자에게 넘기지 않음
+            discard = True
+            raise
+        finally:
+            self._release(cursor, generation, discard)
+
+    def close_connection(self, db_path: str = None):
+        """유휴 커서와 연결 종료 (db_path가 주어지면 다음 연결부터 그 파일 사용)
+
+        사용 중인 커서는 반납될 때 닫히므로 진행 중인 쿼리는 이전 파일에서
+        끝까지 실행됩니다.
+        """
+        with self._condition:
+            if db_path is not None:
+                self.db_path = db_path
+            idle, self._idle = self._idle, []
+            self._size = 0
+            self._generation += 1
+            connection, self._connection = self._connection, None
+            self._condition.notify_all()
+        for cursor in idle:
+            cursor.close()
+        if connection:
+            connection.close()
 
     def execute_query(self, query: str, parameters: tuple = None):
         """쿼리 실행"""
-        conn = self.get_connection()
         try:
-            if parameters:
-                return conn.execute(query, parameters).fetchall()
-            else:
-                return conn.execute(query).fetchall()
+            with self.cursor() as cursor:
+                if parameters:
+                    return cursor.execute(query, parameters).fetchall()
+                else:
+                    return cursor.execute(query).fetchall()
         except Exception as e:
             print(f"Query execution error: {e}")
             raise
 
     def execute_script(self, script: str):
         """스크립트 실행 (여러 쿼리)"""
-        conn = self.get_connection()
         try:
-            # DuckDB는 executescript가 없으므로 세미콜론으로 분할해서 실행
-            statements = [
-                stmt.strip() for stmt in script.split(";") if stmt.strip()
-            ]
-            for statement in statements:
-                if statement:
-                    conn.execute(statement)
+            with self.cursor() as cursor:
+                # DuckDB는 executescript가 없으므로 세미콜론으로 분할해서 실행
+                statements = [
+                    stmt.strip() for stmt in script.split(";") if stmt.strip()
+                ]
+                for statement in statements:
+                    if statement:
+                        cursor.execute(statement)
         except Exception as e:
             print(f"Script execution error: {e}")
             raise
 
+    def stats(self) -> dict:
+        """커서 풀 크기 및 체크아웃 대기 메트릭"""
+        with self._condition:
+            return {
+                "maxCursors": self.max_cursors,
+                "size": self._size,
+                "idle": len(self._idle),
+                "inUse": self._size - len(self._idle),
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+                "discarded": self._discarded,
+                "avgWaitMs": (
+                    round(self._total_wait / self._checkouts * 1000, 3)
+                    if self._checkouts
+                    else 0.0
+                ),
+                "maxWaitMs": round(self._max_wait * 1000, 3),
+            }
+
 
 class SQLAlchemyManager:
-    """SQLAlchemy ORM 데이터베이스 매니저"""
+    """SQLAlchemy ORM 데이터베이스 매니저
 
-    def __init__(self, db_path: str = None):
-        self.db_path = db_path or settings.DUCKDB_FILE
-        # DuckDB 엔진 URL 생성
+    엔진 연결은 DuckDBManager의 데이터베이스 연결에서 만든 커서라서
+    ORM과 Raw SQL이 하나의 DuckDB 인스턴스(버퍼 풀)를 공유합니다.
+    """
+
+    def __init__(self, db_manager: DuckDBManager = None):
+        self.db_manager = db_manager or DuckDBManager()
+        self.db_path = self.db_manager.db_path
+        # DuckDB 엔진 URL 생성 (방언/풀 선택용, 연결은 creator가 생성)
         self.database_url = f"duckdb:///{self.db_path}"
-        self.engine = create_engine(self.database_url)
+        self.engine = create_engine(
+            self.database_url,
+            creator=self._connect,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        )
         self.SessionLocal = sessionmaker(
             autocommit=False, autoflush=False, bind=self.engine
         )
 
-    def create_tables(self):
-        """SQLAlchemy 모델을 기반으로 테이블 생성"""
+    def create_tables(self) -> list[str]:
+        """SQLAlchemy 모델을 기반으로 테이블 생성 (새로 만든 테이블 목록 반환)"""
+        existing = set(inspect(self.engine).get_table_names())
         Base.metadata.create_all(bind=self.engine)
+        return [
+            table for table in Base.metadata.tables if table not in existing
+        ]
+
+    def upgrade_schema(self) -> list[str]:
+        """기존 테이블에 누락된 컬럼 추가 (추가된 컬럼 목록 반환)"""
+        added = []
+        with self.engine.begin() as conn:
+            for table, column, definition in SCHEMA_UPGRADES:
+                columns = set(
+                    conn.scalars(
+                        text(
+                            "SELECT column_name FROM information_schema.columns"
+                            " WHERE table_name = :table"
+                        ),
+                        {"table": table},
+                    )
+                )
+                # 테이블이 아직 없으면 create_all()이 생성
+                if not columns or column in columns:
+                    continue
+                conn.execute(
+                    text(
+                        f"ALTER TABLE {table} ADD COLUMN {column} {definition}"
+                    )
+                )
+                added.append(f"{table}.{column}")
+        return added
+
+    def _connect(self) -> ConnectionWrapper:
+        """연결 풀용 DBAPI 연결 생성 (공유 데이터베이스의 새 커서)"""
+        return ConnectionWrapper(self.db_manager.new_cursor())
+
+    def reopen(self, db_path: str):
+        """다른 데이터베이스 파일로 전환 (스냅샷 교체용)"""
+        self.db_manager.close_connection(db_path)
+        self.db_path = db_path
+        # 이전 파일의 커서로 만든 풀 연결 정리 (사용 중인 연결은 반납 시 닫힘)
+        self.engine.dispose()
 
     def drop_tables(self):
         """모든 테이블 삭제"""
@@ -88,9 +299,9 @@ class SQLAlchemyManager:
             db.close()
 
 
-# 전역 매니저 인스턴스들
-duckdb_manager = DuckDBManager()
-sqlalchemy_manager = SQLAlchemyManager()
+# 전역 매니저 인스턴스들 (reader 프로세스는 스냅샷을 읽기 전용으로 염)
+duckdb_manager = DuckDBManager(read_only=settings.DB_ROLE == "reader")
+sqlalchemy_manager = SQLAlchemyManager(duckdb_manager)
 
 # 편의를 위한 별칭
 get_db = sqlalchemy_manager.get_db
@@ -99,8 +310,40 @@ get_db = sqlalchemy_manager.get_db
 def init_database():
     """데이터베이스 초기화"""
     try:
-        # SQLAlchemy로 테이블 생성
-        sqlalchemy_manager.create_tables()
+        # 기존 테이블 보강 후 SQLAlchemy로 테이블 생성
+        added_columns = sqlalchemy_manager.upgrade_schema()
+        created_tables = sqlalchemy_manager.create_tables()
         print("✓ SQLAlchemy 테이블이 성공적으로 생성되었습니다.")
+
+        if "posts.comment_count" in added_columns:
+            # 새로 추가된 비정규화 컬럼은 원본 테이블 기준으로 채움
+            from app.crud.posts import repair_comment_counts
+
+            db = sqlalchemy_manager.get_session()
+            try:
+                repair_comment_counts(db)
+            finally:
+                db.close()
+            print("✓ posts.comment_count 컬럼이 추가되고 채워졌습니다.")
+
+        if "post_likes.created_at" in added_columns:
+            # 기존 좋아요는 누른 시각을 알 수 없으므로 비워 둠
+            with sqlalchemy_manager.engine.begin() as conn:
+                conn.execute(text("UPDATE post_likes SET created_at = NULL"))
+            print("✓ post_likes.created_at 컬럼이 추가되었습니다.")
+
+        if "user_stats" in created_tables:
+            # 새로 만든 집계 테이블은 원본 테이블 기준으로 채움
+            from app.crud.posts import reconcile_user_stats
+
+            db = sqlalchemy_manager.get_session()
+            try:
+                result = reconcile_user_stats(db)
+            finally:
+                db.close()
+            print(
+                f"✓ user_stats 테이블이 생성되고 {result['users']}명의 집계가"
+                " 채워졌습니다."
+            )
     except Exception as e:
         print(f"❌ 데이터베이스 초기화 실패: {str(e)}")
@@ -0,0 +1,130 @@
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+class DatabaseExecutor:
+    """동기 DB 작업 전용 스레드 풀
+
+    SQLAlchemy 세션 같은 블로킹 작업을 이벤트 루프 밖에서 실행해
+    느린 요청 하나가 다른 요청(`/health` 등)을 막지 않도록 합니다.
+    """
+
+    def __init__(
+        self, max_workers: int = None, thread_name_prefix: str = "db-worker"
+    ):
+        self.max_workers = max_workers or settings.DB_EXECUTOR_MAX_WORKERS
+        self.thread_name_prefix = thread_name_prefix
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        # 메트릭
+        self._queued = 0
+        self._active = 0
+        self._max_queue_depth = 0
+        self._completed = 0
+        self._failed = 0
+        self._total_wait = 0.0
+        self._total_run = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """스레드 풀 반환 (종료 후 재사용 시 다시 생성)"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=self.thread_name_prefix,
+                )
+            return self._executor
+
+    def _call(
+        self, func: Callable[..., T], submitted_at: float, args, kwargs
+    ) -> T:
+        """워커 스레드에서 실행되는 래퍼 (대기/실행 시간 측정)"""
+        started_at = time.perf_counter()
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+            self._total_wait += started_at - submitted_at
+
+        failed = False
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._total_run += time.perf_counter() - started_at
+                if failed:
+                    self._failed += 1
+                else:
+                    self._completed += 1
+
+    async def run(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """동기 함수를 스레드 풀에서 실행하고 결과를 기다림"""
+        executor = self._get_executor()
+        with self._lock:
+            self._queued += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queued)
+
+        call = functools.partial(
+            self._call, func, time.perf_counter(), args, kwargs
+        )
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(executor, call)
+        except RuntimeError:
+            # 종료된 풀에 제출된 경우 큐 카운터 복구
+            with self._lock:
+                self._queued -= 1
+            raise
+        return await future
+
+    def stats(self) -> dict:
+        """큐 깊이 및 처리 시간 메트릭"""
+        with self._lock:
+            finished = self._completed + self._failed
+            return {
+                "maxWorkers": self.max_workers,
+                "queueDepth": self._queued,
+                "maxQueueDepth": self._max_queue_depth,
+                "active": self._active,
+                "completed": self._completed,
+                "failed": self._failed,
+                "avgWaitMs": (
+                    round(self._total_wait / finished * 1000, 3)
+                    if finished
+                    else 0.0
+                ),
+                "avgRunMs": (
+                    round(self._total_run / finished * 1000, 3)
+                    if finished
+                    else 0.0
+                ),
+            }
+
+    def shutdown(self, wait: bool = True):
+        """스레드 풀 종료"""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor:
+            executor.shutdown(wait=wait)
+
+
+# 전역 실행기 인스턴스
+db_executor = DatabaseExecutor()
+
+# 편의를 위한 별칭
+run_db = db_executor.run
@@ -0,0 +1,167 @@
+import asyncio
+import threading
+
+import httpx
+from fastapi import Request, status
+from fastapi.responses import JSONResponse, Response
+
+from app.core.config import settings
+from app.core.security import INTERNAL_TOKEN_HEADER, internal_api_token
+from app.core.view_counter import view_count_buffer
+
+# 쓰기 요청이라도 DB를 바꾸지 않아 reader에서 직접 처리하는 경로
+LOCAL_WRITE_PATHS = {
+    f"{settings.API_PREFIX}/auth/login",
+    f"{settings.API_PREFIX}/auth/logout",
+}
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# 프록시가 그대로 전달하면 안 되는 헤더 (본문은 httpx가 이미 디코딩함)
+HOP_BY_HOP_HEADERS = {
+    "connection",
+    "keep-alive",
+    "transfer-encoding",
+    "upgrade",
+    "te",
+    "trailer",
+    "proxy-authorization",
+    "proxy-authenticate",
+    "host",
+    "content-length",
+    "content-encoding",
+}
+
+
+def _forward_headers(headers) -> dict:
+    return {
+        key: value
+        for key, value in headers.items()
+        if key.lower() not in HOP_BY_HOP_HEADERS
+    }
+
+
+class WriteForwarder:
+    """reader 프로세스의 쓰기 요청 전달기
+
+    reader는 스냅샷을 읽기 전용으로 열므로, DB를 바꾸는 요청을 유닉스
+    소켓으로 writer 프로세스에 그대로 전달하고 응답을 돌려줍니다.
+    조회수 증분도 모아 두었다가 주기적으로 writer의 내부 API로 보냅니다.
+    """
+
+    def __init__(
+        self,
+        socket_path: str = None,
+        timeout: float = None,
+        transport: httpx.AsyncBaseTransport = None,
+    ):
+        self.socket_path = socket_path or settings.WRITER_SOCKET_PATH
+        self.timeout = timeout or settings.WRITER_FORWARD_TIMEOUT_SECONDS
+        # 테스트에서는 httpx.ASGITransport로 writer 앱을 직접 연결
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._lock = threading.Lock()
+
+        # 메트릭
+        self._forwarded = 0
+        self._failed = 0
+        self._forwarded_views = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            transport = self._transport or httpx.AsyncHTTPTransport(
+                uds=self.socket_path
+            )
+            self._client = httpx.AsyncClient(
+                transport=transport,
+                base_url="http://writer",
+                timeout=self.timeout,
+            )
+        return self._client
+
+    async def forward(self, request: Request) -> Response:
+        """요청을 writer로 전달하고 응답 반환"""
+        response = await self.client.request(
+            request.method,
+            request.url.path,
+            params=request.query_params.multi_items(),
+            content=await request.body(),
+            headers=_forward_headers(request.headers),
+        )
+        with self._lock:
+            self._forwarded += 1
+        return Response(
+            content=response.content,
+            status_code=response.status_code,
+            headers=_forward_headers(response.headers),
+        )
+
+    async def middleware(self, request: Request, call_next):
+        """쓰기 요청을 writer로 전달하는 HTTP 미들웨어"""
+        path = request.url.path
+        if path.startswith("/internal"):
+            return JSONResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                content={"detail": "Not Found"},
+            )
+        if request.method in SAFE_METHODS or path in LOCAL_WRITE_PATHS:
+            return await call_next(request)
+
+        try:
+            return await self.forward(request)
+        except httpx.HTTPError:
+            with self._lock:
+                self._failed += 1
+            return JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={"detail": "쓰기 서버에 연결할 수 없습니다."},
+                headers={"Retry-After": "1"},
+            )
+
+    async def forward_view_counts(self) -> int:
+        """모인 조회수 증분을 writer로 전달 (전달한 글 수 반환)"""
+        pending = view_count_buffer.drain()
+        if not pending:
+            return 0
+        try:
+            response = await self.client.post(
+                "/internal/view-counts",
+                json={"counts": pending},
+                headers={INTERNAL_TOKEN_HEADER: internal_api_token()},
+            )
+            response.raise_for_status()
+        except Exception:
+            # 실패한 증분은 다음 전달 때 다시 시도
+            view_count_buffer.restore(pending)
+            raise
+        with self._lock:
+            self._forwarded_views += sum(pending.values())
+        return len(pending)
+
+    async def run_periodic_view_forward(self):
+        """조회수 반영 주기마다 writer로 전달 (lifespan 백그라운드 작업)"""
+        while True:
+            await asyncio.sleep(view_count_buffer.flush_interval)
+            try:
+                await self.forward_view_counts()
+            except Exception as e:
+                print(f"View count forward error: {e}")
+
+    async def close(self):
+        """writer 연결 정리"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> dict:
+        """전달 메트릭"""
+        with self._lock:
+            return {
+                "forwarded": self._forwarded,
+                "failed": self._failed,
+                "forwardedViews": self._forwarded_views,
+            }
+
+
+# 전역 쓰기 전달기 인스턴스
+write_forwarder = WriteForwarder()
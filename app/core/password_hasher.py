@@ -0,0 +1,141 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, Tuple
+
+from app.core.config import settings
+from app.core.security import get_password_hash, verify_password
+
+
+class PasswordHasherBusyError(Exception):
+    """해시 대기열이 가득 참 (429)"""
+
+
+class PasswordHasherUnavailableError(Exception):
+    """해시 프로세스 풀을 사용할 수 없음 (503)"""
+
+
+def _timed(func: Callable[..., Any], *args: Any) -> Tuple[Any, float]:
+    """워커 프로세스에서 실행되는 래퍼 (해시 시간 측정)"""
+    started_at = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started_at
+
+
+class PasswordHasher:
+    """bcrypt 해싱/검증 전용 프로세스 풀
+
+    bcrypt는 요청당 수백 ms의 CPU 작업이라 스레드 풀에서도 GIL과 DB 작업
+    슬롯을 점유합니다. 별도 프로세스에서 실행하고, 처리 중인 작업이
+    max_pending을 넘으면 대기열에 쌓지 않고 즉시 거절합니다.
+    """
+
+    def __init__(self, max_workers: int = None, max_pending: int = None):
+        self.max_workers = max_workers or settings.PASSWORD_HASH_WORKERS
+        self.max_pending = max_pending or settings.PASSWORD_HASH_MAX_PENDING
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        # 메트릭
+        self._pending = 0
+        self._max_pending_seen = 0
+        self._completed = 0
+        self._rejected = 0
+        self._failed = 0
+        self._total_wait = 0.0
+        self._total_hash = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """프로세스 풀 반환 (종료/손상 후 재사용 시 다시 생성)"""
+        with self._lock:
+            if self._executor is None:
+                # DB 스레드가 있는 프로세스를 fork하지 않도록 spawn 사용
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """워커 프로세스에서 실행하고 대기/해시 시간 기록"""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise PasswordHasherBusyError(
+                    "비밀번호 처리 요청이 많습니다. 잠시 후 다시 시도해주세요."
+                )
+            self._pending += 1
+            self._max_pending_seen = max(self._max_pending_seen, self._pending)
+
+        submitted_at = time.perf_counter()
+        try:
+            executor = self._get_executor()
+            loop = asyncio.get_running_loop()
+            result, hash_seconds = await loop.run_in_executor(
+                executor, _timed, func, *args
+            )
+        except (BrokenProcessPool, RuntimeError) as e:
+            with self._lock:
+                self._failed += 1
+                # 손상된 풀은 다음 요청에서 다시 생성
+                if self._executor is executor:
+                    self._executor = None
+            raise PasswordHasherUnavailableError(
+                "비밀번호 처리 서비스를 사용할 수 없습니다."
+            ) from e
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+        elapsed = time.perf_counter() - submitted_at
+        with self._lock:
+            self._completed += 1
+            self._total_hash += hash_seconds
+            self._total_wait += max(elapsed - hash_seconds, 0.0)
+        return result
+
+    async def hash(self, password: str) -> str:
+        """비밀번호 해싱"""
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """비밀번호 검증"""
+        return await self._run(verify_password, password, hashed_password)
+
+    def stats(self) -> dict:
+        """대기열 및 대기/해시 시간 메트릭"""
+        with self._lock:
+            return {
+                "maxWorkers": self.max_workers,
+                "maxPending": self.max_pending,
+                "pending": self._pending,
+                "maxPendingSeen": self._max_pending_seen,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "failed": self._failed,
+                "avgWaitMs": (
+                    round(self._total_wait / self._completed * 1000, 3)
+                    if self._completed
+                    else 0.0
+                ),
+                "avgHashMs": (
+                    round(self._total_hash / self._completed * 1000, 3)
+                    if self._completed
+                    else 0.0
+                ),
+            }
+
+    def shutdown(self, wait: bool = True):
+        """프로세스 풀 종료"""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor:
+            executor.shutdown(wait=wait)
+
+
+# 전역 비밀번호 해시 서비스 인스턴스
+password_hasher = PasswordHasher()
@@ -0,0 +1,256 @@
+import bisect
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+from datetime import timedelta
+from typing import Dict, List, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.posts import Post
+
+# 띄어쓰기로 단어를 나누기 어려운 음절 문자 (한글, 가나, 한자)
+_SYLLABIC = "가-힣\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff"
+# 음절 문자 연속 구간 또는 그 밖의 문자/숫자 단어 (라틴, 키릴 문자 등)
+_TOKEN_PATTERN = re.compile(rf"[{_SYLLABIC}]+|[^\W_{_SYLLABIC}]+")
+_SYLLABIC_PATTERN = re.compile(rf"[{_SYLLABIC}]")
+
+# 제목 단어는 본문보다 가중치를 높게 반영
+TITLE_WEIGHT = 2
+
+# 검색어 단어 하나가 접두사로 확장될 최대 색인 단어 수
+PREFIX_EXPANSION_LIMIT = 64
+
+# sync 때 기준 시각 이전에서 다시 읽을 구간 (updated_at은 트랜잭션 시작
+# 시각이므로 먼저 시작한 트랜잭션이 나중에 커밋될 수 있음)
+SYNC_OVERLAP = timedelta(seconds=30)
+
+
+def _is_syllabic(token: str) -> bool:
+    return _SYLLABIC_PATTERN.match(token) is not None
+
+
+def tokenize(text: str, for_query: bool = False) -> List[str]:
+    """검색용 토큰 분리
+
+    단어 문자(영문/숫자, 키릴 문자 등)는 단어 단위, 음절 문자(한글/가나/
+    한자)는 조사가 붙어도 검색되도록 음절 bigram으로 분리합니다. 문서에는
+    한 글자 검색을 위해 음절 unigram도 함께 색인합니다.
+    """
+    tokens = []
+    for word in _TOKEN_PATTERN.findall(text.lower()):
+        if not _is_syllabic(word):
+            tokens.append(word)
+            continue
+        if len(word) == 1 or not for_query:
+            tokens.extend(word)
+        tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+class PostSearchIndex:
+    """게시글 제목/본문 BM25 역색인 (프로세스 메모리)
+
+    글 작성/수정/삭제 시 증분 갱신되며, 검색 비용은 전체 글 수가 아니라
+    검색어가 등장하는 글 수(posting 길이)에 비례합니다.
+
+    단어 단위 검색어는 색인 단어의 접두사로 확장되어 "fast"로 "fastapi"를
+    찾습니다. 단어 중간 일치("api"로 "fastapi")는 지원하지 않으며, 음절
+    문자는 bigram이므로 단어 중간도 검색됩니다.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+        self._postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self._doc_terms: Dict[int, Counter] = {}
+        self._doc_lengths: Dict[int, int] = {}
+        # 접두사 확장용 단어 단위 색인어 정렬 목록
+        self._words: List[str] = []
+        self._total_length = 0
+        self._built = False
+        # 색인에 반영된 글의 마지막 수정 시각 (sync 기준점)
+        self._synced_at = None
+
+    def _add(
+        self, post_id: int, title: str, content: str, index_words: bool = True
+    ):
+        terms = Counter(tokenize(content))
+        for term, count in Counter(tokenize(title)).items():
+            terms[term] += count * TITLE_WEIGHT
+
+        for term, count in terms.items():
+            if (
+                index_words
+                and term not in self._postings
+                and not _is_syllabic(term)
+            ):
+                bisect.insort(self._words, term)
+            self._postings[term][post_id] = count
+        length = sum(terms.values())
+        self._doc_terms[post_id] = terms
+        self._doc_lengths[post_id] = length
+        self._total_length += length
+
+    def _remove(self, post_id: int):
+        terms = self._doc_terms.pop(post_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(post_id, None)
+                if not postings:
+                    del self._postings[term]
+                    if not _is_syllabic(term):
+                        index = bisect.bisect_left(self._words, term)
+                        del self._words[index]
+        self._total_length -= self._doc_lengths.pop(post_id)
+
+    def add(self, post_id: int, title: str, content: str):
+        """글 색인 (이미 있으면 교체)"""
+        with self._lock:
+            self._remove(post_id)
+            self._add(post_id, title, content)
+
+    def remove(self, post_id: int):
+        """글 색인 제거"""
+        with self._lock:
+            self._remove(post_id)
+
+    def rebuild(self, db: Session) -> int:
+        """삭제되지 않은 모든 글로 색인 재구성 (색인된 글 수 반환)"""
+        # 조회 중 들어오는 증분 갱신이 유실되지 않도록 잠금 안에서 조회
+        with self._lock:
+            rows = db.execute(
+                select(Post.id, Post.title, Post.content).where(
+                    Post.deleted_at.is_(None)
+                )
+            ).all()
+
+            self._postings = defaultdict(dict)
+            self._doc_terms = {}
+            self._doc_lengths = {}
+            self._total_length = 0
+            for post_id, title, content in rows:
+                self._add(post_id, title, content, index_words=False)
+            # 단어마다 insort하지 않고 모은 뒤 한 번에 정렬
+            self._words = sorted(
+                term for term in self._postings if not _is_syllabic(term)
+            )
+            self._synced_at = db.scalar(select(func.max(Post.updated_at)))
+            self._built = True
+            return len(rows)
+
+    def sync(self, db: Session) -> int:
+        """마지막 반영 이후 바뀐 글만 색인에 반영 (반영한 글 수 반환)
+
+        다른 프로세스의 쓰기를 따라가는 reader용입니다. 작성/수정/소프트
+        삭제는 updated_at이 바뀌므로 그 이후 글만 다시 읽고, 하드 삭제된
+        글은 삭제되지 않은 글 id 목록과 비교해 제거합니다. 색인이 아직
+        없으면 재구성합니다.
+        """
+        with self._lock:
+            if not self._built:
+                return self.rebuild(db)
+            synced_at = self._synced_at
+
+        stmt = select(
+            Post.id, Post.title, Post.content, Post.deleted_at, Post.updated_at
+        )
+        if synced_at is not None:
+            stmt = stmt.where(Post.updated_at >= synced_at - SYNC_OVERLAP)
+        rows = db.execute(stmt).all()
+        live_ids = set(
+            db.scalars(select(Post.id).where(Post.deleted_at.is_(None)))
+        )
+
+        with self._lock:
+            for post_id, title, content, deleted_at, updated_at in rows:
+                self._remove(post_id)
+                if deleted_at is None:
+                    self._add(post_id, title, content)
+                if synced_at is None or updated_at > synced_at:
+                    synced_at = updated_at
+            for post_id in set(self._doc_terms) - live_ids:
+                self._remove(post_id)
+            self._synced_at = synced_at
+        return len(rows)
+
+    def _posting(self, term: str) -> Dict[int, int] | None:
+        """검색어의 posting (단어 단위 검색어는 접두사가 같은 색인어 합산)"""
+        # self._lock을 잡은 상태에서 호출
+        if _is_syllabic(term):
+            return self._postings.get(term)
+
+        start = bisect.bisect_left(self._words, term)
+        expanded = []
+        for word in self._words[start : start + PREFIX_EXPANSION_LIMIT]:
+            if not word.startswith(term):
+                break
+            expanded.append(self._postings[word])
+        if len(expanded) <= 1:
+            return expanded[0] if expanded else None
+
+        posting = Counter()
+        for word_posting in expanded:
+            posting.update(word_posting)
+        return posting
+
+    def search(self, query: str) -> List[Tuple[int, float]]:
+        """모든 검색어를 포함하는 글을 BM25 점수순으로 반환
+
+        (글 id, 점수) 목록, 점수 내림차순 / 동점이면 id 내림차순
+        """
+        terms = list(dict.fromkeys(tokenize(query, for_query=True)))
+        if not terms:
+            return []
+
+        with self._lock:
+            postings = [self._posting(term) for term in terms]
+            if not all(postings):
+                return []
+
+            # 가장 짧은 posting부터 교집합 계산
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates.intersection_update(posting)
+                if not candidates:
+                    return []
+
+            doc_count = len(self._doc_lengths)
+            avg_length = self._total_length / doc_count if doc_count else 0
+            scores = {}
+            for posting in postings:
+                df = len(posting)
+                idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+                for post_id in candidates:
+                    tf = posting[post_id]
+                    norm = self.k1 * (
+                        1
+                        - self.b
+                        + self.b * self._doc_lengths[post_id] / avg_length
+                    )
+                    scores[post_id] = scores.get(post_id, 0.0) + idf * (
+                        tf * (self.k1 + 1) / (tf + norm)
+                    )
+
+        return sorted(scores.items(), key=lambda item: (-item[1], -item[0]))
+
+    def stats(self) -> dict:
+        """색인 크기 메트릭"""
+        with self._lock:
+            return {
+                "built": self._built,
+                "documents": len(self._doc_lengths),
+                "terms": len(self._postings),
+                "words": len(self._words),
+            }
+
+
+# 전역 검색 색인 인스턴스
+post_search_index = PostSearchIndex()
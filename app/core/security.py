@@ -1,3 +1,5 @@
+import hashlib
+import hmac
 from datetime import datetime, timedelta
 from typing import Any, Union
 
@@ -7,7 +9,11 @@ from passlib.context import CryptContext
 from app.core.config import settings
 
 # 비밀번호 해싱 컨텍스트
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.PASSWORD_HASH_ROUNDS,
+)
 
 
 def create_access_token(
@@ -44,17 +50,47 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
-def verify_token(token: str) -> Union[str, None]:
+def decode_token(token: str) -> Union[dict, None]:
     """
-    JWT 토큰 검증
+    JWT 토큰 디코딩 (서명/만료 검증 실패 시 None)
     """
     try:
-        payload = jwt.decode(
+        return jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
-        email: str = payload.get("sub")
-        if email is None:
-            return None
-        return email
     except jwt.JWTError:
         return None
+
+
+def verify_token(token: str) -> Union[str, None]:
+    """
+    JWT 토큰 검증
+    """
+    payload = decode_token(token)
+    if payload is None:
+        return None
+    return payload.get("sub")
+
+
+# reader -> writer 내부 API 토큰 헤더
+INTERNAL_TOKEN_HEADER = "X-Internal-Token"
+
+
+def internal_api_token() -> str:
+    """
+    reader -> writer 내부 API 토큰 (설정이 없으면 SECRET_KEY에서 파생)
+    """
+    if settings.INTERNAL_API_TOKEN:
+        return settings.INTERNAL_API_TOKEN
+    return hmac.new(
+        settings.SECRET_KEY.encode(), b"devdeck-internal-api", hashlib.sha256
+    ).hexdigest()
+
+
+def verify_internal_token(token: Union[str, None]) -> bool:
+    """
+    내부 API 토큰 검증 (상수 시간 비교)
+    """
+    if not token:
+        return False
+    return hmac.compare_digest(token, internal_api_token())
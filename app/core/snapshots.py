@@ -0,0 +1,267 @@
+import asyncio
+import os
+import shutil
+import threading
+import time
+from typing import Optional
+
+from app.core.auth_cache import auth_cache
+from app.core.config import settings
+from app.core.dashboard_stats import dashboard_stats
+from app.core.database import SQLAlchemyManager, sqlalchemy_manager
+from app.core.executor import run_db
+from app.core.search import post_search_index
+from app.core.tag_cache import tag_dictionary
+from app.core.writer import run_write
+from app.crud.announcements import announcement_cache
+from app.crud.posts import post_list_cache
+
+# 최신 스냅샷 파일 이름을 담는 포인터 파일
+SNAPSHOT_POINTER = "CURRENT"
+SNAPSHOT_PREFIX = "devdeck-"
+SNAPSHOT_SUFFIX = ".duckdb"
+
+
+def _file_signature(path: str) -> tuple:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class SnapshotPublisher:
+    """writer 프로세스의 DB 스냅샷 발행기
+
+    체크포인트로 WAL을 DB 파일에 반영한 뒤 파일을 새 이름으로 복사하고,
+    포인터 파일(CURRENT)을 원자적으로 교체합니다. 체크포인트만 쓰기
+    스레드에서 실행하고, 복사는 DB 스레드 풀에서 실행해 복사 중에도 쓰기가
+    계속 처리됩니다. 자동 체크포인트를 끄므로 그 사이의 커밋은 WAL에만
+    기록되고 DB 파일은 다음 발행의 체크포인트 전까지 바뀌지 않습니다.
+    마지막 발행 이후 DB/WAL 파일이 바뀌지 않았으면 건너뜁니다.
+    """
+
+    def __init__(
+        self,
+        snapshot_dir: str = None,
+        interval: float = None,
+        keep: int = None,
+        manager: SQLAlchemyManager = None,
+    ):
+        self.snapshot_dir = snapshot_dir or settings.SNAPSHOT_DIR
+        self.interval = interval or settings.SNAPSHOT_INTERVAL_SECONDS
+        self.keep = keep or settings.SNAPSHOT_KEEP
+        self.manager = manager or sqlalchemy_manager
+        self._lock = threading.Lock()
+        # 체크포인트부터 복사까지 한 번에 하나의 발행만 진행
+        self._publishing = asyncio.Lock()
+        self._signature = None
+        self._auto_checkpoint_disabled = False
+
+        # 메트릭
+        self._published = 0
+        self._skipped = 0
+        self._last_checkpoint_ms = 0.0
+        self._last_publish_ms = 0.0
+        self._last_snapshot: Optional[str] = None
+
+    def _db_signature(self) -> tuple:
+        db_path = self.manager.db_path
+        return _file_signature(db_path), _file_signature(f"{db_path}.wal")
+
+    def checkpoint(self, force: bool = False) -> bool:
+        """WAL을 DB 파일에 반영 (쓰기 스레드에서 실행, 발행할 변경이 있으면 True)"""
+        if not force and self._db_signature() == self._signature:
+            with self._lock:
+                self._skipped += 1
+            return False
+
+        started_at = time.perf_counter()
+        with self.manager.db_manager.cursor() as cursor:
+            if not self._auto_checkpoint_disabled:
+                # 복사 중 DB 파일이 바뀌지 않도록 발행 때만 체크포인트
+                cursor.execute("SET checkpoint_threshold = '1TB'")
+                self._auto_checkpoint_disabled = True
+            cursor.execute("CHECKPOINT")
+        self._signature = self._db_signature()
+
+        with self._lock:
+            self._last_checkpoint_ms = round(
+                (time.perf_counter() - started_at) * 1000, 3
+            )
+        return True
+
+    def copy(self) -> str:
+        """체크포인트된 DB 파일을 스냅샷으로 복사하고 포인터 교체 (경로 반환)"""
+        started_at = time.perf_counter()
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        name = f"{SNAPSHOT_PREFIX}{time.time_ns()}{SNAPSHOT_SUFFIX}"
+        path = os.path.join(self.snapshot_dir, name)
+        shutil.copyfile(self.manager.db_path, f"{path}.tmp")
+        os.replace(f"{path}.tmp", path)
+
+        pointer = os.path.join(self.snapshot_dir, SNAPSHOT_POINTER)
+        with open(f"{pointer}.tmp", "w") as f:
+            f.write(name)
+        os.replace(f"{pointer}.tmp", pointer)
+        self._prune()
+
+        with self._lock:
+            self._published += 1
+            self._last_snapshot = name
+            self._last_publish_ms = round(
+                (time.perf_counter() - started_at) * 1000, 3
+            )
+        return path
+
+    def publish(self, force: bool = False) -> Optional[str]:
+        """스냅샷 발행 (이 프로세스에 다른 쓰기가 없을 때, 발행한 파일 경로 반환)"""
+        if not self.checkpoint(force):
+            return None
+        return self.copy()
+
+    async def publish_async(self, force: bool = False) -> Optional[str]:
+        """체크포인트는 쓰기 스레드, 복사는 DB 스레드 풀에서 실행해 발행"""
+        async with self._publishing:
+            if not await run_write(self.checkpoint, force):
+                return None
+            return await run_db(self.copy)
+
+    def _prune(self):
+        """최근 keep개를 제외한 이전 스냅샷 삭제
+
+        삭제된 파일을 아직 열고 있는 reader는 다음 교체 전까지 계속 읽을 수
+        있습니다 (열린 파일은 닫힐 때까지 유지됨).
+        """
+        snapshots = sorted(
+            name
+            for name in os.listdir(self.snapshot_dir)
+            if name.startswith(SNAPSHOT_PREFIX)
+            and name.endswith(SNAPSHOT_SUFFIX)
+        )
+        for name in snapshots[: -self.keep]:
+            try:
+                os.remove(os.path.join(self.snapshot_dir, name))
+            except FileNotFoundError:
+                pass
+
+    async def run_periodic_publish(self):
+        """interval마다 변경이 있으면 발행 (lifespan 백그라운드 작업)"""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.publish_async()
+            except Exception as e:
+                print(f"Snapshot publish error: {e}")
+
+    def stats(self) -> dict:
+        """발행 메트릭"""
+        with self._lock:
+            return {
+                "published": self._published,
+                "skipped": self._skipped,
+                "lastSnapshot": self._last_snapshot,
+                "lastCheckpointMs": self._last_checkpoint_ms,
+                "lastPublishMs": self._last_publish_ms,
+            }
+
+
+class SnapshotFollower:
+    """reader 프로세스의 스냅샷 추적기
+
+    포인터 파일이 가리키는 최신 스냅샷을 읽기 전용으로 열고, 바뀌면 연결을
+    새 파일로 교체한 뒤 프로세스 메모리의 색인/캐시를 새 스냅샷에 맞춥니다.
+    검색 색인과 태그 사전은 바뀐 글/새 태그만 반영하고, 대시보드 집계는
+    다음 조회 때 다시 집계합니다. 응답은 최대 발행 주기 + 확인 주기만큼
+    늦을 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        snapshot_dir: str = None,
+        interval: float = None,
+        manager: SQLAlchemyManager = None,
+    ):
+        self.snapshot_dir = snapshot_dir or settings.SNAPSHOT_DIR
+        self.interval = interval or settings.SNAPSHOT_INTERVAL_SECONDS
+        self.manager = manager or sqlalchemy_manager
+        self._lock = threading.Lock()
+        self.path: Optional[str] = None
+
+        # 메트릭
+        self._swaps = 0
+        self._last_swap_ms = 0.0
+
+    def latest(self) -> Optional[str]:
+        """포인터 파일이 가리키는 최신 스냅샷 경로 (없으면 None)"""
+        try:
+            with open(os.path.join(self.snapshot_dir, SNAPSHOT_POINTER)) as f:
+                name = f.read().strip()
+        except FileNotFoundError:
+            return None
+        return os.path.join(self.snapshot_dir, name) if name else None
+
+    def refresh(self) -> bool:
+        """새 스냅샷이 있으면 교체 (교체 여부 반환)"""
+        path = self.latest()
+        if path is None or path == self.path:
+            return False
+
+        started_at = time.perf_counter()
+        self.manager.reopen(path)
+        self.path = path
+
+        db = self.manager.get_session()
+        try:
+            post_search_index.sync(db)
+            tag_dictionary.sync(db)
+        finally:
+            db.close()
+        dashboard_stats.invalidate()
+        announcement_cache.bump()
+        post_list_cache.bump_all()
+        auth_cache.invalidate_users()
+
+        with self._lock:
+            self._swaps += 1
+            self._last_swap_ms = round(
+                (time.perf_counter() - started_at) * 1000, 3
+            )
+        return True
+
+    def wait_for_snapshot(self, timeout: float = None):
+        """첫 스냅샷이 발행될 때까지 대기 후 열기 (reader 시작 시)"""
+        deadline = time.monotonic() + (
+            timeout or settings.SNAPSHOT_WAIT_SECONDS
+        )
+        while not self.refresh():
+            if time.monotonic() >= deadline:
+                raise RuntimeError(
+                    f"스냅샷을 찾을 수 없습니다: {self.snapshot_dir}"
+                )
+            time.sleep(0.2)
+
+    async def run_periodic_refresh(self):
+        """interval마다 새 스냅샷 확인 (lifespan 백그라운드 작업)"""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await run_db(self.refresh)
+            except Exception as e:
+                print(f"Snapshot refresh error: {e}")
+
+    def stats(self) -> dict:
+        """교체 메트릭"""
+        with self._lock:
+            return {
+                "snapshot": (
+                    os.path.basename(self.path) if self.path else None
+                ),
+                "swaps": self._swaps,
+                "lastSwapMs": self._last_swap_ms,
+            }
+
+
+# 전역 스냅샷 발행기/추적기 인스턴스 (DB_ROLE에 따라 하나만 사용)
+snapshot_publisher = SnapshotPublisher()
+snapshot_follower = SnapshotFollower()
@@ -0,0 +1,107 @@
+import threading
+from typing import Dict, Iterable, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.tags import Tag
+
+
+class TagDictionary:
+    """태그 이름 ↔ id 양방향 사전 (프로세스 메모리)
+
+    태그는 수가 적고 추가 위주이므로 시작 시 전체를 읽어 두고, 새 태그는
+    생성한 트랜잭션이 커밋된 뒤 추가합니다. 사전에 없는 이름은 DB에서
+    조회해 채우므로 다른 프로세스가 만든 태그도 찾을 수 있습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids: Dict[str, int] = {}
+        self._names: Dict[int, str] = {}
+        self._built = False
+        # 재구성/sync로 읽은 마지막 태그 id (resolve로 채운 태그는 제외)
+        self._synced_id = 0
+
+        # 메트릭
+        self._hits = 0
+        self._misses = 0
+
+    def rebuild(self, db: Session) -> int:
+        """모든 태그로 사전 재구성 (태그 수 반환)"""
+        rows = db.execute(select(Tag.name, Tag.id)).all()
+        with self._lock:
+            self._ids = {name: tag_id for name, tag_id in rows}
+            self._names = {tag_id: name for name, tag_id in rows}
+            self._synced_id = max(self._names, default=0)
+            self._built = True
+            return len(rows)
+
+    def sync(self, db: Session) -> int:
+        """마지막으로 읽은 이후 생긴 태그만 추가 (추가한 태그 수 반환)
+
+        태그는 삭제되지 않고 id가 증가하므로 마지막으로 읽은 id 이후만
+        읽습니다. 사전이 아직 없으면 재구성합니다.
+        """
+        with self._lock:
+            built, synced_id = self._built, self._synced_id
+        if not built:
+            return self.rebuild(db)
+
+        rows = db.execute(
+            select(Tag.name, Tag.id).where(Tag.id > synced_id)
+        ).all()
+        with self._lock:
+            for name, tag_id in rows:
+                self._ids[name] = tag_id
+                self._names[tag_id] = name
+                self._synced_id = max(self._synced_id, tag_id)
+        return len(rows)
+
+    def add_many(self, pairs: Iterable[Tuple[str, int]]):
+        """커밋된 태그 (이름, id) 추가"""
+        with self._lock:
+            for name, tag_id in pairs:
+                self._ids[name] = tag_id
+                self._names[tag_id] = name
+
+    def lookup(self, names: Iterable[str]) -> Dict[str, int]:
+        """사전에 있는 태그만 {이름: id}로 반환"""
+        found = {}
+        with self._lock:
+            for name in names:
+                tag_id = self._ids.get(name)
+                if tag_id is None:
+                    self._misses += 1
+                else:
+                    self._hits += 1
+                    found[name] = tag_id
+        return found
+
+    def resolve(self, db: Session, name: str) -> int | None:
+        """태그 이름을 id로 변환 (사전에 없으면 DB 조회, 없는 태그는 None)"""
+        tag_id = self.lookup([name]).get(name)
+        if tag_id is None:
+            tag_id = db.scalar(select(Tag.id).where(Tag.name == name))
+            if tag_id is not None:
+                self.add_many([(name, tag_id)])
+        return tag_id
+
+    def get_name(self, tag_id: int) -> str | None:
+        """태그 id를 이름으로 변환"""
+        with self._lock:
+            return self._names.get(tag_id)
+
+    def stats(self) -> dict:
+        """사전 크기 및 적중률 메트릭"""
+        with self._lock:
+            return {
+                "built": self._built,
+                "tags": len(self._ids),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+# 전역 태그 사전 인스턴스
+tag_dictionary = TagDictionary()
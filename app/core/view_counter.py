@@ -0,0 +1,189 @@
+import asyncio
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import Integer, column, update, values
+
+from app.core.config import settings
+from app.core.database import sqlalchemy_manager
+from app.core.writer import run_write
+from app.models.posts import Post
+
+
+class ViewCountBuffer:
+    """게시글 조회수 증분 버퍼
+
+    조회마다 커밋하는 대신 글별 증분을 메모리에 모았다가, 주기적으로 또는
+    임계치를 넘으면 한 번의 `UPDATE ... FROM (VALUES ...)`로 반영합니다.
+    반영은 주기 작업(run_periodic_flush)이 쓰기 스레드에서 실행하며, 임계치
+    도달은 주기 작업을 바로 깨울 뿐이므로 조회 요청은 반영 실패로 실패하지
+    않습니다.
+    응답의 조회수는 저장된 값에 아직 반영되지 않은 증분을 더한 근사치입니다.
+
+    reader 프로세스(forwarding=True)는 DB에 직접 반영하지 않고, 모인 증분을
+    주기적으로 writer에 전달합니다 (app.core.forwarding).
+    """
+
+    def __init__(
+        self, flush_threshold: int = None, flush_interval: float = None
+    ):
+        self.flush_threshold = (
+            flush_threshold or settings.VIEW_COUNT_FLUSH_THRESHOLD
+        )
+        self.flush_interval = (
+            flush_interval or settings.VIEW_COUNT_FLUSH_INTERVAL_SECONDS
+        )
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Dict[int, int] = {}
+        self._pending_total = 0
+        self.forwarding = False
+        # 주기 작업의 이벤트 루프와 즉시 반영 신호 (주기 작업 실행 중에만 설정)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._due: asyncio.Event | None = None
+
+        # 메트릭
+        self._flushes = 0
+        self._flushed_views = 0
+        self._last_flush_rows = 0
+        self._last_flush_ms = 0.0
+
+    def increment(self, post_id: int, amount: int = 1):
+        """조회수 증분 기록 (임계치 도달 시 주기 작업에 반영 요청)"""
+        self.increment_many({post_id: amount})
+
+    def increment_many(self, counts: Dict[int, int]):
+        """여러 글의 조회수 증분 기록 (reader에서 전달받은 증분 포함)"""
+        with self._lock:
+            for post_id, amount in counts.items():
+                self._pending[post_id] = self._pending.get(post_id, 0) + amount
+                self._pending_total += amount
+            # 임계치 이상이면 매번 요청 (반영 실패로 증분이 되돌아온 경우 포함)
+            due = (
+                not self.forwarding
+                and self._pending_total >= self.flush_threshold
+            )
+
+        if due:
+            self._mark_due()
+
+    def _mark_due(self):
+        """주기 작업을 깨워 바로 반영하도록 요청 (어느 스레드에서나 호출 가능)"""
+        loop, event = self._loop, self._due
+        if loop is None or event is None or event.is_set():
+            # 주기 작업이 없거나 이미 요청됨
+            return
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫힘 (종료 중)
+            pass
+
+    def drain(self) -> Dict[int, int]:
+        """모인 증분을 꺼내고 버퍼 비우기"""
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+            self._pending_total = 0
+            return pending
+
+    def restore(self, pending: Dict[int, int]):
+        """반영/전달에 실패한 증분을 버퍼에 되돌림 (다음 번에 다시 시도)"""
+        with self._lock:
+            for post_id, delta in pending.items():
+                self._pending[post_id] = self._pending.get(post_id, 0) + delta
+                self._pending_total += delta
+
+    def pending(self, post_id: int) -> int:
+        """아직 반영되지 않은 글의 조회수 증분"""
+        with self._lock:
+            return self._pending.get(post_id, 0)
+
+    def approximate(self, post: Post) -> int:
+        """저장된 조회수 + 미반영 증분"""
+        return post.view_count + self.pending(post.id)
+
+    def flush(self) -> int:
+        """모인 증분을 한 번의 UPDATE로 반영 (반영한 글 수 반환)"""
+        with self._flush_lock:
+            pending = self.drain()
+            if not pending:
+                return 0
+
+            started_at = time.perf_counter()
+            increments = values(
+                column("id", Integer), column("delta", Integer), name="v"
+            ).data(list(pending.items()))
+            stmt = (
+                update(Post)
+                .where(Post.id == increments.c.id)
+                .values(
+                    view_count=Post.view_count + increments.c.delta,
+                    # 조회는 글 수정이 아니므로 수정 시각 유지
+                    updated_at=Post.updated_at,
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+            db = sqlalchemy_manager.get_session()
+            try:
+                db.execute(stmt)
+                db.commit()
+            except Exception:
+                db.rollback()
+                # 실패한 증분은 다음 반영 때 다시 시도
+                self.restore(pending)
+                raise
+            finally:
+                db.close()
+
+            with self._lock:
+                self._flushes += 1
+                self._flushed_views += sum(pending.values())
+                self._last_flush_rows = len(pending)
+                self._last_flush_ms = round(
+                    (time.perf_counter() - started_at) * 1000, 3
+                )
+            return len(pending)
+
+    async def run_periodic_flush(self):
+        """flush_interval마다 또는 임계치 도달 시 쓰기 스레드에서 반영
+
+        lifespan 백그라운드 작업으로, 반영에 실패한 증분은 버퍼에 남아 다음
+        반영 때 다시 시도됩니다.
+        """
+        self._due = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(
+                        self._due.wait(), timeout=self.flush_interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._due.clear()
+                try:
+                    await run_write(self.flush)
+                except Exception as e:
+                    print(f"View count flush error: {e}")
+        finally:
+            self._loop = None
+            self._due = None
+
+    def stats(self) -> dict:
+        """버퍼 메트릭"""
+        with self._lock:
+            return {
+                "pendingPosts": len(self._pending),
+                "pendingViews": self._pending_total,
+                "flushes": self._flushes,
+                "flushedViews": self._flushed_views,
+                "lastFlushRows": self._last_flush_rows,
+                "lastFlushMs": self._last_flush_ms,
+            }
+
+
+# 전역 조회수 버퍼 인스턴스
+view_count_buffer = ViewCountBuffer()
@@ -0,0 +1,448 @@
+import asyncio
+import atexit
+import queue
+import random
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Callable, List, Optional, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import (
+    Session,
+    make_transient,
+    make_transient_to_detached,
+)
+
+from app.core.config import settings
+from app.core.database import sqlalchemy_manager
+
+T = TypeVar("T")
+
+# 그룹 커밋 중인 세션의 커밋 후 작업 목록 (Session.info 키)
+_AFTER_COMMIT_KEY = "after_commit"
+
+
+def after_commit(db: Session, callback: Callable[[], Any]):
+    """커밋 후 실행할 작업 (캐시/색인 갱신 등) 등록
+
+    그룹 커밋 중인 세션이면 배치가 실제로 커밋된 뒤로 미루고,
+    아니면(이미 커밋한 뒤 호출되므로) 바로 실행합니다.
+    """
+    callbacks = db.info.get(_AFTER_COMMIT_KEY)
+    if callbacks is None:
+        callback()
+    else:
+        callbacks.append(callback)
+
+
+def is_write_conflict(error: BaseException) -> bool:
+    """DuckDB 쓰기 충돌 여부 (다시 실행하면 성공할 수 있는 오류)
+
+    쓰기는 쓰기 스레드에서 직렬화되지만, DuckDB는 커밋된 삭제의 인덱스
+    항목을 그보다 먼저 시작한 읽기 트랜잭션이 끝날 때까지 남겨 두므로 같은
+    키를 다시 추가하면 Duplicate key로 실패할 수 있습니다.
+    """
+    if not isinstance(error, DBAPIError):
+        return False
+    message = str(error.orig)
+    return "Conflict on" in message or "Duplicate key" in message
+
+
+class _BatchAborted(Exception):
+    """그룹 커밋 중 작업이 롤백을 요청함 (배치 중단 후 단독 재실행)"""
+
+
+def _abort_batch(session, previous_transaction=None):
+    raise _BatchAborted()
+
+
+class _WriteJob:
+    __slots__ = (
+        "func",
+        "args",
+        "kwargs",
+        "db",
+        "future",
+        "submitted_at",
+        "created",
+        "deleted",
+    )
+
+    def __init__(self, func, args, kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        # 첫 번째 인자 또는 db 키워드 인자로 받은 세션 (없으면 단독 실행)
+        db = kwargs.get("db", args[0] if args else None)
+        self.db: Optional[Session] = db if isinstance(db, Session) else None
+        self.future: Future = Future()
+        self.submitted_at = time.perf_counter()
+        # 배치 중 세션에서 저장/삭제된 객체 (배치 롤백 시 세션 상태 복구용)
+        self.created = []
+        self.deleted = []
+
+    def __call__(self):
+        return self.func(*self.args, **self.kwargs)
+
+    def _on_created(self, session, instance):
+        self.created.append(instance)
+
+    def _on_deleted(self, session, instance):
+        self.deleted.append(instance)
+
+    def reset_session(self):
+        """롤백된 배치에서 바뀐 세션 상태를 DB 기준으로 되돌림"""
+        db = self.db
+        for instance in self.created:
+            if instance in db:
+                db.expunge(instance)
+        for instance in self.deleted:
+            if instance not in db:
+                make_transient(instance)
+                make_transient_to_detached(instance)
+                db.add(instance)
+        self.created = []
+        self.deleted = []
+        db.expire_all()
+
+
+class WriteExecutor:
+    """모든 쓰기 작업을 직렬화하는 단일 쓰기 스레드 (그룹 커밋)
+
+    DuckDB는 쓰기 트랜잭션이 동시에 같은 행을 바꾸면 한쪽을 중단시키므로,
+    쓰기 작업을 전용 스레드 하나에서 차례로 실행합니다. batch_window 동안
+    함께 들어온 작업(최대 max_batch_size개)은 요청 세션을 배치 연결에 묶어
+    한 트랜잭션으로 실행하고 한 번에 커밋합니다. CRUD 함수의 commit()은
+    배치 트랜잭션에 합류할 뿐이며, 커밋 후 작업은 after_commit()으로 배치
+    커밋 뒤에 실행됩니다.
+
+    DuckDB는 SAVEPOINT가 없어 작업 하나만 되돌릴 수 없으므로, 배치 중
+    작업이 실패하거나 롤백하면 배치를 롤백하고 그 작업은 단독 트랜잭션으로
+    다시 실행해 결과/오류를 확정한 뒤 나머지를 다시 배치로 실행합니다.
+    """
+
+    def __init__(self, batch_window: float = None, max_batch_size: int = None):
+        self.batch_window = (
+            settings.WRITE_BATCH_WINDOW_SECONDS
+            if batch_window is None
+            else batch_window
+        )
+        self.max_batch_size = max_batch_size or settings.WRITE_BATCH_MAX_SIZE
+        self._queue: "queue.Queue[_WriteJob | None]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        # 배치 실행(작업, 커밋, 커밋 후 작업)을 감싸는 잠금 (paused() 참고)
+        self._batch_lock = threading.RLock()
+        self._atexit_registered = False
+
+        # 메트릭
+        self._jobs = 0
+        self._failed = 0
+        self._batches = 0
+        self._max_batch = 0
+        self._aborted = 0
+        self._retried = 0
+        self._total_wait = 0.0
+        self._total_commit = 0.0
+
+    def _ensure_thread(self):
+        """쓰기 스레드 시작 (종료 후 재사용 시 다시 시작)"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="db-writer", daemon=True
+                )
+                self._thread.start()
+                # lifespan 밖(스크립트, 테스트)에서 시작된 경우에도 종료 시 정리
+                if not self._atexit_registered:
+                    atexit.register(self.shutdown)
+                    self._atexit_registered = True
+
+    async def run(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """쓰기 함수를 쓰기 스레드에서 실행하고 결과를 기다림"""
+        self._ensure_thread()
+        job = _WriteJob(func, args, kwargs)
+        self._queue.put(job)
+        return await asyncio.wrap_future(job.future)
+
+    async def run_retrying(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """run()과 같되 쓰기 충돌로 실패하면 잠시 뒤 작업을 다시 제출
+
+        대기는 이벤트 루프에서 하므로 쓰기 스레드는 다른 작업을 계속
+        처리합니다. 실패한 작업의 세션은 롤백된 상태로 돌아옵니다.
+        """
+        attempts = settings.WRITE_CONFLICT_MAX_ATTEMPTS
+        for attempt in range(attempts):
+            try:
+                return await self.run(func, *args, **kwargs)
+            except Exception as e:
+                if not is_write_conflict(e) or attempt == attempts - 1:
+                    raise
+                with self._lock:
+                    self._retried += 1
+            await asyncio.sleep(random.uniform(0, 0.002 * (attempt + 1)))
+
+    def _run(self):
+        """쓰기 스레드 루프 (종료 신호를 받을 때까지 배치 단위로 처리)"""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+
+            batch = [job]
+            deadline = time.perf_counter() + self.batch_window
+            stop = False
+            while len(batch) < self.max_batch_size:
+                try:
+                    # 이미 쌓인 작업은 바로, 그 외에는 배치 창이 끝날 때까지
+                    job = self._queue.get(
+                        timeout=max(deadline - time.perf_counter(), 0)
+                    )
+                except queue.Empty:
+                    break
+                if job is None:
+                    stop = True
+                    break
+                batch.append(job)
+
+            try:
+                with self._batch_lock:
+                    self._run_batch(batch)
+            except BaseException as e:
+                # 배치 연결 획득 실패 등 작업 밖의 오류는 남은 요청 모두에 전달
+                for job in batch:
+                    if not job.future.done():
+                        job.future.set_exception(e)
+            if stop:
+                return
+
+    @contextmanager
+    def paused(self):
+        """진행 중인 배치가 끝나길 기다린 뒤 with 블록 동안 다음 배치를 막음
+
+        블록 안에서 시작한 읽기 트랜잭션은 지금까지 커밋된 쓰기를 모두 보고,
+        그 쓰기들의 커밋 후 작업도 이미 실행된 상태입니다.
+        """
+        with self._batch_lock:
+            yield
+
+    def _run_batch(self, batch: List[_WriteJob]):
+        """작업 묶음 실행 (세션이 없는 작업은 단독 실행)"""
+        started_at = time.perf_counter()
+        with self._lock:
+            for job in batch:
+                self._total_wait += started_at - job.submitted_at
+
+        pending = []
+        for job in batch:
+            if job.db is None:
+                self._run_single(job)
+            elif self._end_read_transaction(job):
+                pending.append(job)
+
+        while pending:
+            if len(pending) == 1:
+                self._run_single(pending[0])
+                break
+            failed = self._try_group_commit(pending)
+            if failed is None:
+                break
+            # 실패한 작업만 단독으로 결과/오류를 확정하고 나머지는 다시 배치로
+            with self._lock:
+                self._aborted += 1
+            self._run_single(pending.pop(failed))
+
+    def _end_read_transaction(self, job: _WriteJob) -> bool:
+        """요청에서 읽기로 시작된 트랜잭션을 객체를 만료시키지 않고 종료
+
+        세션이 잡고 있던 풀 연결을 배치 연결보다 먼저 반납하고, 작업은
+        이전 스냅샷이 아닌 새 트랜잭션에서 실행됩니다. 종료에 실패하면
+        작업의 오류로 확정하고 False를 반환합니다.
+        """
+        db = job.db
+        if not db.in_transaction():
+            return True
+        started_at = time.perf_counter()
+        expire_on_commit = db.expire_on_commit
+        db.expire_on_commit = False
+        try:
+            db.commit()
+        except BaseException as e:
+            db.rollback()
+            self._finish([job], started_at)
+            with self._lock:
+                self._failed += 1
+            job.future.set_exception(e)
+            return False
+        finally:
+            db.expire_on_commit = expire_on_commit
+        return True
+
+    def _run_single(self, job: _WriteJob):
+        """작업 하나를 자체 트랜잭션으로 실행 (작업이 직접 커밋)"""
+        if job.db is not None and not self._end_read_transaction(job):
+            return
+        started_at = time.perf_counter()
+        try:
+            result = job()
+        except BaseException as e:
+            # 실패한 트랜잭션을 되돌려 세션을 재사용/재제출할 수 있게 함
+            if job.db is not None:
+                job.db.rollback()
+            self._finish([job], started_at)
+            with self._lock:
+                self._failed += 1
+            job.future.set_exception(e)
+        else:
+            self._finish([job], started_at)
+            job.future.set_result(result)
+
+    def _try_group_commit(self, jobs: List[_WriteJob]) -> Optional[int]:
+        """작업들을 한 트랜잭션으로 실행 후 커밋 (실패한 작업 위치 반환)"""
+        started_at = time.perf_counter()
+        callbacks = []
+        results = []
+        with sqlalchemy_manager.engine.connect() as conn:
+            transaction = conn.begin()
+            failed = None
+            for index, job in enumerate(jobs):
+                try:
+                    with self._joined(job, conn, callbacks):
+                        results.append(job())
+                except BaseException:
+                    failed = index
+                    break
+            else:
+                try:
+                    transaction.commit()
+                except Exception:
+                    # 커밋 실패 시 모두 되돌리고 첫 작업부터 단독으로 확정
+                    failed = 0
+
+            if failed is not None:
+                if transaction.is_active:
+                    transaction.rollback()
+                # 실행된 작업(실패한 작업 포함)의 세션 상태 복구
+                for job in jobs[: len(results) + 1]:
+                    job.reset_session()
+                return failed
+
+        self._finish(jobs, started_at)
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"After-commit callback error: {e}")
+        for job, result in zip(jobs, results):
+            job.future.set_result(result)
+        return None
+
+    @staticmethod
+    @contextmanager
+    def _joined(job: _WriteJob, conn: Connection, callbacks: list):
+        """요청 세션을 배치 연결의 트랜잭션에 합류시킴
+
+        세션의 commit()은 배치 트랜잭션을 커밋하지 않고, rollback()은
+        배치를 중단시킵니다. 작업 후에는 원래 엔진 연결로 되돌립니다.
+        """
+        db = job.db
+        listeners = (
+            ("after_rollback", _abort_batch),
+            ("pending_to_persistent", job._on_created),
+            ("persistent_to_deleted", job._on_deleted),
+        )
+        expire_on_commit = db.expire_on_commit
+        bind = db.bind
+        join_transaction_mode = db.join_transaction_mode
+
+        # 요청에서 읽기로 시작된 트랜잭션은 배치 전에 종료됨
+        # (_end_read_transaction), 재실행 중 다시 읽은 트랜잭션만 남음
+        db.expire_on_commit = False
+        if db.in_transaction():
+            db.commit()
+        db.expire_on_commit = expire_on_commit
+
+        db.bind = conn
+        db.join_transaction_mode = "rollback_only"
+        db.info[_AFTER_COMMIT_KEY] = callbacks
+        for name, listener in listeners:
+            event.listen(db, name, listener)
+        try:
+            yield
+            db.expire_on_commit = False
+            if db.in_transaction():
+                db.commit()
+        except BaseException:
+            event.remove(db, "after_rollback", _abort_batch)
+            db.rollback()
+            raise
+        finally:
+            for name, listener in listeners:
+                if event.contains(db, name, listener):
+                    event.remove(db, name, listener)
+            db.info.pop(_AFTER_COMMIT_KEY, None)
+            db.expire_on_commit = expire_on_commit
+            db.join_transaction_mode = join_transaction_mode
+            db.bind = bind
+
+    def _finish(self, jobs: List[_WriteJob], started_at: float):
+        """처리한 작업/배치 메트릭 반영"""
+        elapsed = time.perf_counter() - started_at
+        with self._lock:
+            self._jobs += len(jobs)
+            self._batches += 1
+            self._max_batch = max(self._max_batch, len(jobs))
+            self._total_commit += elapsed
+
+    def stats(self) -> dict:
+        """배치 크기 및 커밋 지연 메트릭"""
+        with self._lock:
+            return {
+                "queueDepth": self._queue.qsize(),
+                "jobs": self._jobs,
+                "batches": self._batches,
+                "avgBatchSize": (
+                    round(self._jobs / self._batches, 3)
+                    if self._batches
+                    else 0.0
+                ),
+                "maxBatchSize": self._max_batch,
+                "failed": self._failed,
+                "abortedBatches": self._aborted,
+                "retriedJobs": self._retried,
+                "avgWaitMs": (
+                    round(self._total_wait / self._jobs * 1000, 3)
+                    if self._jobs
+                    else 0.0
+                ),
+                "avgCommitMs": (
+                    round(self._total_commit / self._batches * 1000, 3)
+                    if self._batches
+                    else 0.0
+                ),
+            }
+
+    def shutdown(self):
+        """대기 중인 작업을 마친 뒤 쓰기 스레드 종료"""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread:
+            self._queue.put(None)
+            thread.join()
+
+
+# 전역 쓰기 실행기 인스턴스
+db_writer = WriteExecutor()
+
+# 편의를 위한 별칭
+run_write = db_writer.run
+run_write_retrying = db_writer.run_retrying
@@ -0,0 +1,87 @@
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.cache import VersionedCache
+from app.core.config import settings
+from app.core.writer import after_commit
+from app.models.announcements import Announcement
+
+# 활성 공지사항 목록 캐시 키
+ACTIVE_ANNOUNCEMENTS_KEY = "active"
+
+# 전역 공지사항 캐시 인스턴스 (공지 작성/수정 시 버전 증가로 무효화)
+announcement_cache = VersionedCache(
+    max_entries=1, ttl_seconds=settings.ANNOUNCEMENT_CACHE_TTL_SECONDS
+)
+
+
+def _announcement_to_dict(announcement: Announcement) -> dict:
+    return {
+        "id": announcement.id,
+        "title": announcement.title,
+        "content": announcement.content,
+        "isActive": announcement.is_active,
+        "createdAt": announcement.created_at,
+    }
+
+
+def create_announcement(
+    db: Session, title: str, content: str, is_active: bool = True
+) -> dict:
+    """공지사항 작성"""
+    announcement = Announcement(
+        title=title, content=content, is_active=is_active
+    )
+    db.add(announcement)
+    db.commit()
+    after_commit(db, announcement_cache.bump)
+    db.refresh(announcement)
+    return _announcement_to_dict(announcement)
+
+
+def update_announcement(
+    db: Session,
+    announcement_id: int,
+    title: str = None,
+    content: str = None,
+    is_active: bool = None,
+) -> dict | None:
+    """공지사항 수정 (전달된 항목만, 없으면 None)"""
+    announcement = db.get(Announcement, announcement_id)
+    if announcement is None:
+        return None
+
+    if title is not None:
+        announcement.title = title
+    if content is not None:
+        announcement.content = content
+    if is_active is not None:
+        announcement.is_active = is_active
+    db.commit()
+    after_commit(db, announcement_cache.bump)
+    db.refresh(announcement)
+    return _announcement_to_dict(announcement)
+
+
+def get_cached_active_announcements() -> List[dict] | None:
+    """캐시된 활성 공지사항 목록 (없으면 None)"""
+    return announcement_cache.get(ACTIVE_ANNOUNCEMENTS_KEY)
+
+
+def get_active_announcements(db: Session) -> List[dict]:
+    """활성 공지사항 목록 조회 후 캐시 (최신순)"""
+    # 조회 중 작성/수정이 커밋되면 이전 버전이라 캐시되지 않음
+    version = announcement_cache.version
+    stmt = (
+        select(Announcement)
+        .where(Announcement.is_active.is_(True))
+        .order_by(Announcement.created_at.desc(), Announcement.id.desc())
+    )
+    announcements = [
+        _announcement_to_dict(announcement)
+        for announcement in db.scalars(stmt)
+    ]
+    announcement_cache.set(ACTIVE_ANNOUNCEMENTS_KEY, announcements, version)
+    return announcements
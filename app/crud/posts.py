@@ -1,69 +1,271 @@
-from datetime import date, datetime
-from typing import List
-
-from sqlalchemy import and_, desc, func, or_, select
-from sqlalchemy.orm import Session, joinedload
-
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List
+
+from sqlalchemy import (
+    Integer,
+    and_,
+    bindparam,
+    delete,
+    desc,
+    false,
+    func,
+    literal,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.types import ARRAY
+
+from app.core.cache import ScopedVersionedCache
+from app.core.config import settings
+from app.core.dashboard_stats import dashboard_stats
+from app.core.search import post_search_index
+from app.core.tag_cache import tag_dictionary
+from app.core.view_counter import view_count_buffer
+from app.core.writer import after_commit
 from app.models.comments import Comment
 from app.models.post_likes import PostLike
 from app.models.post_tags import PostTag
 from app.models.posts import Post
 from app.models.tags import Tag
+from app.models.user_stats import UserStats
 from app.models.users import User
 
+# 전역 글 목록 응답 캐시 인스턴스 (범위: None=전체 목록, 태그 id=태그 목록)
+# 글 목록에 보이는 내용(글, 좋아요 수, 댓글 수)을 바꾸는 쓰기는 커밋 후
+# 전체 버전과 그 글의 태그 버전을 올림
+post_list_cache = ScopedVersionedCache(
+    max_entries=settings.POST_LIST_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.POST_LIST_CACHE_TTL_SECONDS,
+    stale_seconds=settings.POST_LIST_CACHE_STALE_SECONDS,
+)
+
+
+def _resolve_tag_ids(
+    db: Session, tag_names: List[str]
+) -> tuple[List[int], Dict[str, int]]:
+    """태그 이름 목록을 id 목록으로 변환 (없는 태그는 일괄 생성)
+
+    중복 이름은 먼저 제거하고, 태그 사전에 없는 이름만 조회 1회 + 누락 태그
+    INSERT 1회로 처리합니다. 커밋은 호출한 쪽 트랜잭션에 맡기므로, 반환된
+    새 태그 {이름: id}는 커밋 후 tag_dictionary에 추가해야 합니다.
+    (같은 그룹 커밋 배치의 다른 작업이 만든 태그도 조회되므로, 조회한 태그도
+    커밋 후에 추가합니다.)
+    """
+    names = list(dict.fromkeys(tag_names))
+    if not names:
+        return [], {}
+
+    tag_ids = tag_dictionary.lookup(names)
+    created = {}
+    unknown = [name for name in names if name not in tag_ids]
+    if unknown:
+        existing = dict(
+            db.execute(
+                select(Tag.name, Tag.id).where(Tag.name.in_(unknown))
+            ).all()
+        )
+        after_commit(db, lambda: tag_dictionary.add_many(existing.items()))
+        tag_ids.update(existing)
+
+        missing = [name for name in unknown if name not in tag_ids]
+        if missing:
+            created = dict(
+                db.execute(
+                    insert(Tag)
+                    .values([{"name": name} for name in missing])
+                    .on_conflict_do_nothing()
+                    .returning(Tag.name, Tag.id)
+                ).all()
+            )
+            tag_ids.update(created)
+
+            # 동시에 다른 요청이 만든 태그는 다시 조회
+            conflicted = [name for name in missing if name not in tag_ids]
+            if conflicted:
+                tag_ids.update(
+                    db.execute(
+                        select(Tag.name, Tag.id).where(
+                            Tag.name.in_(conflicted)
+                        )
+                    ).all()
+                )
+
+    return [tag_ids[name] for name in names], created
+
+
+def _post_tag_ids(db: Session, post_id: int) -> List[int]:
+    """글에 연결된 태그 id 목록 (글 목록 캐시 무효화 범위)"""
+    return list(
+        db.scalars(select(PostTag.tag_id).where(PostTag.post_id == post_id))
+    )
+
+
+def _link_post_tags(db: Session, post_id: int, tag_ids: List[int]):
+    """글-태그 연결 일괄 추가"""
+    if tag_ids:
+        db.execute(
+            insert(PostTag).values(
+                [{"post_id": post_id, "tag_id": tag_id} for tag_id in tag_ids]
+            )
+        )
+
 
 def create_post(
     db: Session, title: str, content: str, user_id: int, tags: List[str] = None
 ) -> Post:
-    """새 글 생성"""
+    """새 글 생성 (글과 태그를 한 트랜잭션에서 저장)"""
     db_post = Post(title=title, content=content, user_id=user_id)
     db.add(db_post)
-    db.commit()
-    db.refresh(db_post)
+    db.flush()
 
     # 태그 처리
+    tag_ids, created_tags = [], {}
     if tags:
-        for tag_name in tags:
-            # 태그가 존재하지 않으면 생성
-            tag = db.scalar(select(Tag).where(Tag.name == tag_name))
-            if not tag:
-                tag = Tag(name=tag_name)
-                db.add(tag)
-                db.commit()
-                db.refresh(tag)
-
-            # 글과 태그 연결
-            post_tag = PostTag(post_id=db_post.id, tag_id=tag.id)
-            db.add(post_tag)
+        tag_ids, created_tags = _resolve_tag_ids(db, tags)
+        _link_post_tags(db, db_post.id, tag_ids)
 
+    post_id = db_post.id
+    _bump_user_stats(db, user_id, post_count=1)
     db.commit()
+    after_commit(db, lambda: tag_dictionary.add_many(created_tags.items()))
+    after_commit(db, lambda: dashboard_stats.record("posts"))
+    after_commit(db, lambda: post_list_cache.bump(tag_ids))
+
+    # 검색 색인 증분 갱신
+    after_commit(db, lambda: post_search_index.add(post_id, title, content))
     return db_post
 
 
 def get_post_by_id(
-    db: Session, post_id: int, increment_view: bool = False
+    db: Session,
+    post_id: int,
+    increment_view: bool = False,
+    load_comments: bool = True,
 ) -> Post | None:
-    """ID로 글 조회"""
+    """ID로 글 조회 (조회수 증가는 버퍼에 모았다가 일괄 반영)
+
+    댓글은 get_comments_page로 나눠 읽는 경우 load_comments=False로 생략
+    컬렉션(태그, 댓글)은 selectinload로 각각 한 번씩 따로 읽어, 한 쿼리에
+    조인할 때 생기는 댓글 수 x 태그 수 행 중복을 피합니다.
+    """
+    options = [
+        joinedload(Post.author),
+        selectinload(Post.post_tags).joinedload(PostTag.tag),
+    ]
+    if load_comments:
+        options.append(selectinload(Post.comments).joinedload(Comment.author))
+
     stmt = (
         select(Post)
-        .options(
-            joinedload(Post.author),
-            joinedload(Post.comments).joinedload(Comment.author),
-            joinedload(Post.post_tags).joinedload(PostTag.tag),
-        )
+        .options(*options)
         .where(and_(Post.id == post_id, Post.deleted_at.is_(None)))
     )
 
-    post = db.scalars(stmt).unique().first()
+    post = db.scalar(stmt)
 
     if post and increment_view:
-        post.view_count += 1
-        db.commit()
-        db.refresh(post)
+        view_count_buffer.increment(post.id)
 
     return post
 
 
+# 커서 페이지네이션 정렬 키 (정렬 방식 -> 키 컬럼, 동률은 id로 구분)
+CURSOR_SORT_KEYS = {
+    "latest": Post.created_at,
+    "popular": Post.like_count,
+    "discussed": Post.comment_count,
+}
+
+# 댓글 목록 커서 정렬 표시 (작성순)
+COMMENT_CURSOR_SORT = "comments"
+
+# 사용자 집계 컬럼 (user_stats)
+USER_STATS_COLUMNS = (
+    "post_count",
+    "comment_count",
+    "likes_given",
+    "likes_received",
+)
+
+# 글 목록 요약 길이 (본문 첫 N자)
+POST_SUMMARY_LENGTH = 100
+
+
+def post_summary_columns(summary_length: int = POST_SUMMARY_LENGTH) -> tuple:
+    """글 목록용 컬럼 투영 (posts와 작성자 조인 필요)
+
+    본문 전체 대신 요약 길이 + 1자만 잘라 읽어 잘림 여부를 판단하고,
+    ORM 엔티티 대신 행으로 받아 identity map 비용을 피합니다.
+    """
+    return (
+        Post.id,
+        Post.title,
+        func.substr(Post.content, 1, summary_length + 1).label("summary"),
+        Post.like_count,
+        Post.comment_count,
+        Post.created_at,
+        Post.updated_at,
+        User.id.label("author_id"),
+        User.nickname.label("author_nickname"),
+    )
+
+
+def _encode_cursor(sort: str, key: Any, post_id: int) -> str:
+    """정렬 키와 id를 담은 불투명 커서 문자열 생성"""
+    if isinstance(key, datetime):
+        key = key.isoformat()
+    payload = json.dumps(
+        {"s": sort, "k": key, "id": post_id}, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def encode_post_cursor(post: Post | Row, sort: str = "latest") -> str:
+    """글 목록 커서 생성 (글 엔티티 또는 목록 행)"""
+    return _encode_cursor(
+        sort, getattr(post, CURSOR_SORT_KEYS[sort].key), post.id
+    )
+
+
+def decode_post_cursor(cursor: str, sort: str = "latest") -> tuple[Any, int]:
+    """글 목록 커서 해석 (잘못된 커서면 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        if payload["s"] != sort:
+            raise ValueError("cursor sort mismatch")
+        key = payload["k"]
+        if sort in ("latest", COMMENT_CURSOR_SORT):
+            key = datetime.fromisoformat(key)
+        elif sort == "relevance":
+            key = float(key)
+        else:
+            key = int(key)
+        return key, int(payload["id"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("잘못된 커서입니다.") from e
+
+
+def apply_post_cursor(stmt, cursor: str = None, sort: str = "latest"):
+    """글 목록 쿼리에 키셋 정렬과 커서 조건 적용"""
+    key_column = CURSOR_SORT_KEYS[sort]
+    if cursor:
+        key, post_id = decode_post_cursor(cursor, sort)
+        stmt = stmt.where(
+            or_(
+                key_column < key,
+                and_(key_column == key, Post.id < post_id),
+            )
+        )
+    return stmt.order_by(desc(key_column), desc(Post.id))
+
+
 def get_posts(
     db: Session,
     page: int = 1,
@@ -72,52 +274,133 @@ def get_posts(
     query: str = None,
     tag: str = None,
     user_id: int = None,
-) -> tuple[List[Post], int]:
-    """글 목록 조회 (페이징, 검색, 필터링)"""
-
+    cursor: str = None,
+    include_total: bool = True,
+    summary_length: int = POST_SUMMARY_LENGTH,
+) -> tuple[List[Row], int | None, str | None]:
+    """글 목록 조회 (페이징, 검색, 필터링)
+
+    cursor가 주어지면 OFFSET 대신 (정렬 키, id) 기준 키셋 페이지네이션을 사용
+    글은 post_summary_columns(summary_length) 컬럼의 행으로 반환
+    (글 행 목록, 전체 개수 또는 None, 다음 페이지 커서 또는 None) 반환
+    """
     stmt = (
-        select(Post)
-        .options(
-            joinedload(Post.author),
-            joinedload(Post.post_tags).joinedload(PostTag.tag),
-        )
+        select(*post_summary_columns(summary_length))
+        .join(Post.author)
         .where(Post.deleted_at.is_(None))
     )
 
-    # 검색어 필터
+    # 검색어 필터 (전문 검색 색인으로 후보 글 id 조회, 색인은 시작 시 구성)
+    matches = None
     if query:
-        stmt = stmt.where(
-            or_(
-                Post.title.ilike(f"%{query}%"),
-                Post.content.ilike(f"%{query}%"),
-            )
-        )
+        matches = post_search_index.search(query)
+        match_ids = _id_list([post_id for post_id, _ in matches])
+        stmt = stmt.join(match_ids, match_ids.c.id == Post.id)
 
-    # 태그 필터
+    # 태그 필터 (태그 사전으로 id를 찾아 tags 조인 없이 필터링)
     if tag:
-        stmt = stmt.join(PostTag).join(Tag).where(Tag.name == tag)
+        tag_id = tag_dictionary.resolve(db, tag)
+        if tag_id is None:
+            stmt = stmt.where(false())
+        else:
+            stmt = stmt.join(PostTag, PostTag.post_id == Post.id).where(
+                PostTag.tag_id == tag_id
+            )
 
     # 사용자 필터
     if user_id:
         stmt = stmt.where(Post.user_id == user_id)
 
-    # 정렬
-    if sort == "popular":
-        stmt = stmt.order_by(desc(Post.like_count))
-    else:  # latest
-        stmt = stmt.order_by(desc(Post.created_at))
+    if sort == "relevance" and matches is not None:
+        return _get_posts_by_relevance(
+            db,
+            stmt,
+            matches,
+            page,
+            limit,
+            cursor,
+            include_total,
+            summary_length,
+        )
+    if sort not in CURSOR_SORT_KEYS:
+        sort = "latest"
+
+    # 총 개수 계산 (무한 스크롤에서는 생략)
+    total_count = None
+    if include_total:
+        count_stmt = select(func.count()).select_from(stmt.subquery())
+        total_count = db.scalar(count_stmt)
+
+    # 정렬 및 커서 조건
+    stmt = apply_post_cursor(stmt, cursor, sort)
+
+    # 페이징 (다음 페이지 존재 여부 확인을 위해 하나 더 조회)
+    if not cursor:
+        stmt = stmt.offset((page - 1) * limit)
+    stmt = stmt.limit(limit + 1)
+
+    posts = db.execute(stmt).all()
+
+    next_cursor = None
+    if len(posts) > limit:
+        posts = posts[:limit]
+        next_cursor = encode_post_cursor(posts[-1], sort)
 
-    # 총 개수 계산
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total_count = db.scalar(count_stmt)
+    return posts, total_count, next_cursor
 
-    # 페이징
-    offset = (page - 1) * limit
-    stmt = stmt.offset(offset).limit(limit)
 
-    posts = db.scalars(stmt).unique().all()
+def _id_list(ids: List[int]):
+    """id 목록을 조인할 서브쿼리 (LIST 파라미터 하나를 unnest)
 
-    return posts, total_count
+    흔한 검색어는 후보가 수천 개이므로 IN 목록처럼 id마다 파라미터를
+    바인딩하고 매번 다른 SQL을 만드는 대신 파라미터 하나로 전달합니다.
+    """
+    return select(
+        func.unnest(bindparam("ids", ids, type_=ARRAY(Integer))).label("id")
+    ).subquery("match_ids")
+
+
+def _get_posts_by_relevance(
+    db: Session,
+    stmt,
+    matches: List[tuple[int, float]],
+    page: int,
+    limit: int,
+    cursor: str = None,
+    include_total: bool = True,
+    summary_length: int = POST_SUMMARY_LENGTH,
+) -> tuple[List[Row], int | None, str | None]:
+    """검색 점수순 글 목록 (필터 통과한 id만 남긴 뒤 페이지 단위로 로드)"""
+    visible_ids = set(db.scalars(stmt.with_only_columns(Post.id)).all())
+    ranked = [(pid, score) for pid, score in matches if pid in visible_ids]
+    total_count = len(ranked) if include_total else None
+
+    if cursor:
+        key, last_id = decode_post_cursor(cursor, "relevance")
+        ranked = [
+            (pid, score)
+            for pid, score in ranked
+            if score < key or (score == key and pid < last_id)
+        ]
+    else:
+        ranked = ranked[(page - 1) * limit :]
+
+    page_items = ranked[:limit]
+    next_cursor = None
+    if len(ranked) > limit:
+        last_id, last_score = page_items[-1]
+        next_cursor = _encode_cursor("relevance", last_score, last_id)
+
+    page_ids = [pid for pid, _ in page_items]
+    loaded = db.execute(
+        select(*post_summary_columns(summary_length))
+        .join(Post.author)
+        .where(Post.id.in_(page_ids))
+    )
+    posts_by_id = {post.id: post for post in loaded}
+    posts = [posts_by_id[pid] for pid in page_ids if pid in posts_by_id]
+
+    return posts, total_count, next_cursor
 
 
 def update_post(
@@ -133,69 +416,163 @@ def update_post(
     if content is not None:
         post.content = content
 
-    # 태그 업데이트
+    # 태그 업데이트 (바뀐 연결만 삭제/추가)
+    created_tags = {}
+    current_ids = set(_post_tag_ids(db, post.id))
+    scopes = set(current_ids)
     if tags is not None:
-        # 기존 태그 연결 삭제
-        db.query(PostTag).filter(PostTag.post_id == post.id).delete()
-
-        # 새 태그 연결
-        for tag_name in tags:
-            tag = db.scalar(select(Tag).where(Tag.name == tag_name))
-            if not tag:
-                tag = Tag(name=tag_name)
-                db.add(tag)
-                db.commit()
-                db.refresh(tag)
-
-            post_tag = PostTag(post_id=post.id, tag_id=tag.id)
-            db.add(post_tag)
+        tag_ids, created_tags = _resolve_tag_ids(db, tags)
+        scopes.update(tag_ids)
+
+        removed_ids = current_ids.difference(tag_ids)
+        if removed_ids:
+            db.execute(
+                delete(PostTag).where(
+                    PostTag.post_id == post.id,
+                    PostTag.tag_id.in_(removed_ids),
+                )
+            )
+        _link_post_tags(
+            db,
+            post.id,
+            [tag_id for tag_id in tag_ids if tag_id not in current_ids],
+        )
 
     db.commit()
+    after_commit(db, lambda: tag_dictionary.add_many(created_tags.items()))
+    after_commit(db, lambda: post_list_cache.bump(scopes))
     db.refresh(post)
+
+    indexed = (post.id, post.title, post.content)
+    after_commit(db, lambda: post_search_index.add(*indexed))
     return post
 
 
 def delete_post(db: Session, post: Post, soft_delete: bool = True):
     """글 삭제 (소프트/하드 삭제)"""
+    post_id = post.id
+    tag_ids = _post_tag_ids(db, post_id)
     if soft_delete:
+        was_visible = post.deleted_at is None
+        created_at = post.created_at
+        if was_visible:
+            like_count = db.scalar(
+                select(func.count())
+                .select_from(PostLike)
+                .where(PostLike.post_id == post_id)
+            )
+            _bump_user_stats(
+                db,
+                post.user_id,
+                post_count=-1,
+                likes_received=-like_count,
+            )
         post.deleted_at = datetime.utcnow()
         db.commit()
+        if was_visible:
+            after_commit(
+                db,
+                lambda: dashboard_stats.record("posts", -1, day=created_at),
+            )
     else:
+        # 댓글/좋아요가 함께 지워지므로 관련 사용자 집계는 삭제 후 재계산
+        affected_user_ids = {post.user_id}
+        affected_user_ids.update(
+            db.scalars(
+                select(Comment.user_id).where(Comment.post_id == post_id)
+            )
+        )
+        affected_user_ids.update(
+            db.scalars(
+                select(PostLike.user_id).where(PostLike.post_id == post_id)
+            )
+        )
         db.delete(post)
+        db.flush()
+        _reconcile_user_stats(db, affected_user_ids)
         db.commit()
+        after_commit(db, dashboard_stats.invalidate)
+
+    after_commit(db, lambda: post_search_index.remove(post_id))
+    after_commit(db, lambda: post_list_cache.bump(tag_ids))
 
 
 def toggle_post_like(
     db: Session, post_id: int, user_id: int
-) -> tuple[int, bool]:
-    """글 좋아요 토글"""
-    # 기존 좋아요 확인
-    like = db.scalar(
-        select(PostLike).where(
-            and_(PostLike.post_id == post_id, PostLike.user_id == user_id)
+) -> tuple[int, bool] | None:
+    """글 좋아요 토글 (글이 없으면 None)
+
+    좋아요 행 삭제/추가와 `like_count` 상대값 갱신을 한
+    트랜잭션에서 처리하므로 좋아요 수가 유실되지 않습니다. 쓰기 스레드에서
+    실행되므로 다른 쓰기와는 직렬화되며, DuckDB 쓰기 충돌은 작업을 다시
+    제출해 재시도합니다 (run_write_retrying).
+    """
+    tag_ids = _post_tag_ids(db, post_id)
+
+    # 기존 좋아요가 있으면 취소
+    # DuckDB의 DELETE ... RETURNING은 같은 트랜잭션(그룹 커밋 배치)에서
+    # 추가된 행을 반환하지 않으므로 존재 여부는 따로 조회
+    liked = db.scalar(
+        select(literal(True)).where(
+            PostLike.post_id == post_id, PostLike.user_id == user_id
         )
     )
 
-    post = db.scalar(select(Post).where(Post.id == post_id))
-    if not post:
-        return 0, False
-
-    if like:
-        # 좋아요 취소
-        db.delete(like)
-        post.like_count = max(0, post.like_count - 1)
-        user_liked = False
+    if liked:
+        db.execute(
+            delete(PostLike).where(
+                PostLike.post_id == post_id, PostLike.user_id == user_id
+            )
+        )
+        delta, user_liked = -1, False
     else:
-        # 좋아요 추가
-        new_like = PostLike(post_id=post_id, user_id=user_id)
-        db.add(new_like)
-        post.like_count += 1
-        user_liked = True
-
+        # 삭제되지 않은 글일 때만 좋아요 추가 (글 존재 확인 겸용)
+        # DuckDB는 커밋된 삭제의 인덱스 항목을 이전 트랜잭션이 끝날 때까지
+        # 남겨 두므로, 충돌을 무시하지 않고 Duplicate key로 다시 시도
+        added = db.execute(
+            insert(PostLike)
+            .from_select(
+                ["user_id", "post_id"],
+                select(literal(user_id), Post.id).where(
+                    Post.id == post_id, Post.deleted_at.is_(None)
+                ),
+            )
+            .returning(PostLike.post_id)
+        ).first()
+        if not added:
+            db.rollback()
+            return None
+        delta, user_liked = 1, True
+
+    # 참조 중인 글 행의 UPDATE ... RETURNING은 DuckDB 외래 키 제약에 걸리므로
+    # 상대값 갱신 후 같은 트랜잭션에서 결과를 읽음
+    db.execute(
+        update(Post)
+        .where(Post.id == post_id, Post.deleted_at.is_(None))
+        .values(
+            like_count=func.greatest(Post.like_count + delta, 0),
+            # 좋아요는 글 수정이 아니므로 수정 시각 유지
+            updated_at=Post.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    counts = db.execute(
+        select(Post.like_count, Post.user_id).where(
+            Post.id == post_id, Post.deleted_at.is_(None)
+        )
+    ).first()
+    if counts is None:
+        # 삭제된 글의 좋아요 취소는 반영하지 않음
+        db.rollback()
+        return None
+    like_count, author_id = counts
+
+    _bump_user_stats(db, user_id, likes_given=delta)
+    _bump_user_stats(db, author_id, likes_received=delta)
     db.commit()
-    db.refresh(post)
+    after_commit(db, lambda: post_list_cache.bump(tag_ids))
 
-    return post.like_count, user_liked
+    return like_count, user_liked
 
 
 def get_comment_count(db: Session, post_id: int) -> int:
@@ -223,11 +600,108 @@ def create_comment(
         parent_comment_id=parent_comment_id,
     )
     db.add(db_comment)
+    # 댓글 수는 같은 트랜잭션에서 상대값으로 갱신
+    db.execute(
+        update(Post)
+        .where(Post.id == post_id)
+        .values(
+            comment_count=Post.comment_count + 1,
+            # 댓글은 글 수정이 아니므로 수정 시각 유지
+            updated_at=Post.updated_at,
+        )
+    )
+    tag_ids = _post_tag_ids(db, post_id)
+    _bump_user_stats(db, user_id, comment_count=1)
     db.commit()
+    after_commit(db, lambda: dashboard_stats.record("comments"))
+    after_commit(db, lambda: post_list_cache.bump(tag_ids))
     db.refresh(db_comment)
     return db_comment
 
 
+def get_comments_page(
+    db: Session,
+    post_id: int,
+    limit: int = 20,
+    cursor: str = None,
+    parent_comment_id: int = None,
+    replies_limit: int = 3,
+) -> tuple[List[Comment], Dict[int, int], str | None]:
+    """댓글 목록 페이지 조회 (작성순 키셋 페이지네이션)
+
+    parent_comment_id가 없으면 최상위 댓글을, 있으면 그 댓글의 답글을
+    limit개씩 조회하고, 페이지의 각 댓글에 달린 답글은 replies_limit개까지
+    미리보기로 함께 읽습니다.
+    (페이지 댓글 + 답글 미리보기, 댓글별 답글 수, 다음 페이지 커서) 반환
+    """
+    stmt = (
+        select(Comment)
+        .options(joinedload(Comment.author))
+        .where(Comment.post_id == post_id)
+    )
+    if parent_comment_id is None:
+        stmt = stmt.where(Comment.parent_comment_id.is_(None))
+    else:
+        stmt = stmt.where(Comment.parent_comment_id == parent_comment_id)
+
+    if cursor:
+        key, comment_id = decode_post_cursor(cursor, COMMENT_CURSOR_SORT)
+        stmt = stmt.where(
+            or_(
+                Comment.created_at > key,
+                and_(Comment.created_at == key, Comment.id > comment_id),
+            )
+        )
+
+    # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+    stmt = stmt.order_by(Comment.created_at, Comment.id).limit(limit + 1)
+    comments = db.scalars(stmt).all()
+
+    next_cursor = None
+    if len(comments) > limit:
+        comments = comments[:limit]
+        next_cursor = _encode_cursor(
+            COMMENT_CURSOR_SORT, comments[-1].created_at, comments[-1].id
+        )
+
+    page_ids = [comment.id for comment in comments]
+    if not page_ids:
+        return [], {}, next_cursor
+
+    reply_counts = dict(
+        db.execute(
+            select(Comment.parent_comment_id, func.count())
+            .where(Comment.parent_comment_id.in_(page_ids))
+            .group_by(Comment.parent_comment_id)
+        ).all()
+    )
+
+    previews = []
+    if replies_limit > 0 and reply_counts:
+        # 댓글별 앞쪽 답글만 남기도록 부모 단위로 순번 부여
+        ranked = (
+            select(
+                Comment.id,
+                func.row_number()
+                .over(
+                    partition_by=Comment.parent_comment_id,
+                    order_by=(Comment.created_at, Comment.id),
+                )
+                .label("rn"),
+            )
+            .where(Comment.parent_comment_id.in_(page_ids))
+            .subquery()
+        )
+        previews = db.scalars(
+            select(Comment)
+            .options(joinedload(Comment.author))
+            .join(ranked, Comment.id == ranked.c.id)
+            .where(ranked.c.rn <= replies_limit)
+        ).all()
+
+    return list(comments) + list(previews), reply_counts, next_cursor
+
+
 def get_comment_by_id(db: Session, comment_id: int) -> Comment | None:
     """ID로 댓글 조회"""
     return db.scalar(
@@ -247,47 +721,184 @@ def update_comment(db: Session, comment: Comment, content: str) -> Comment:
 
 def delete_comment(db: Session, comment: Comment):
     """댓글 삭제"""
+    created_at = comment.created_at
+    tag_ids = _post_tag_ids(db, comment.post_id)
     db.delete(comment)
+    db.execute(
+        update(Post)
+        .where(Post.id == comment.post_id)
+        .values(
+            comment_count=func.greatest(Post.comment_count - 1, 0),
+            updated_at=Post.updated_at,
+        )
+    )
+    _bump_user_stats(db, comment.user_id, comment_count=-1)
     db.commit()
+    after_commit(
+        db, lambda: dashboard_stats.record("comments", -1, day=created_at)
+    )
+    after_commit(db, lambda: post_list_cache.bump(tag_ids))
 
 
-# Admin 관련 함수들
-def get_dashboard_stats(db: Session) -> dict:
-    """관리자 대시보드 통계"""
-    today = date.today()
+def repair_comment_counts(db: Session) -> int:
+    """comments 테이블 기준으로 posts.comment_count 재계산 (수정된 글 수 반환)"""
+    actual_count = (
+        select(func.count(Comment.id))
+        .where(Comment.post_id == Post.id)
+        .scalar_subquery()
+    )
+    drifted = db.scalars(
+        select(Post.id).where(
+            Post.comment_count.is_distinct_from(actual_count)
+        )
+    ).all()
+
+    if drifted:
+        db.execute(
+            update(Post)
+            .where(Post.id.in_(drifted))
+            .values(comment_count=actual_count, updated_at=Post.updated_at),
+            execution_options={"synchronize_session": False},
+        )
+        db.commit()
+        after_commit(db, post_list_cache.bump_all)
 
-    total_users = db.scalar(select(func.count(User.id))) or 0
-    today_signups = (
-        db.scalar(
-            select(func.count(User.id)).where(
-                func.date(User.created_at) == today
-            )
+    return len(drifted)
+
+
+def _bump_user_stats(db: Session, user_id: int, **deltas: int):
+    """사용자 집계 상대값 갱신 (행이 없으면 생성, 커밋은 호출자가 수행)"""
+    values = {
+        column: max(deltas.get(column, 0), 0) for column in USER_STATS_COLUMNS
+    }
+    stmt = insert(UserStats).values(user_id=user_id, **values)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[UserStats.user_id],
+            set_={
+                column: func.greatest(getattr(UserStats, column) + delta, 0)
+                for column, delta in deltas.items()
+            },
         )
-        or 0
     )
 
-    total_posts = (
-        db.scalar(select(func.count(Post.id)).where(Post.deleted_at.is_(None)))
-        or 0
+
+def get_user_stats(db: Session, user_id: int) -> dict:
+    """사용자 집계 조회 (집계 행이 없으면 모두 0)"""
+    row = db.execute(
+        select(*(getattr(UserStats, c) for c in USER_STATS_COLUMNS)).where(
+            UserStats.user_id == user_id
+        )
+    ).first()
+    if row is None:
+        return dict.fromkeys(USER_STATS_COLUMNS, 0)
+    return row._asdict()
+
+
+def _actual_user_stats():
+    """원본 테이블 기준 사용자별 집계 (사용자 id + USER_STATS_COLUMNS)"""
+
+    def count_by(user_column, *criteria, join=None):
+        stmt = select(user_column.label("user_id"), func.count().label("n"))
+        if join is not None:
+            stmt = stmt.join(*join)
+        return stmt.where(*criteria).group_by(user_column).subquery()
+
+    posts = count_by(Post.user_id, Post.deleted_at.is_(None))
+    comments = count_by(Comment.user_id)
+    likes_given = count_by(PostLike.user_id)
+    likes_received = count_by(
+        Post.user_id,
+        Post.deleted_at.is_(None),
+        join=(PostLike, PostLike.post_id == Post.id),
     )
-    today_posts = (
-        db.scalar(
-            select(func.count(Post.id)).where(
-                and_(
-                    func.date(Post.created_at) == today,
-                    Post.deleted_at.is_(None),
-                )
+
+    sources = {
+        "post_count": posts,
+        "comment_count": comments,
+        "likes_given": likes_given,
+        "likes_received": likes_received,
+    }
+    stmt = select(
+        User.id.label("user_id"),
+        *(
+            func.coalesce(source.c.n, 0).label(column)
+            for column, source in sources.items()
+        ),
+    )
+    for source in sources.values():
+        stmt = stmt.outerjoin(source, source.c.user_id == User.id)
+    return stmt.subquery()
+
+
+def _reconcile_user_stats(db: Session, user_ids=None) -> dict:
+    """집계 재계산 및 보정 (커밋은 호출자가 수행, 컬럼별 차이 난 사용자 수 반환)"""
+    actual = _actual_user_stats()
+
+    # 저장된 값과 다른 사용자만 한 번의 집계 쿼리로 조회 (행이 없으면 0으로 간주)
+    stmt = select(
+        actual,
+        *(
+            func.coalesce(getattr(UserStats, c), 0).label(f"stored_{c}")
+            for c in USER_STATS_COLUMNS
+        ),
+    ).outerjoin(UserStats, UserStats.user_id == actual.c.user_id)
+    stmt = stmt.where(
+        or_(
+            *(
+                func.coalesce(getattr(UserStats, c), 0) != actual.c[c]
+                for c in USER_STATS_COLUMNS
             )
         )
-        or 0
     )
+    if user_ids is not None:
+        stmt = stmt.where(actual.c.user_id.in_(list(user_ids)))
+    drifted = db.execute(stmt).all()
+
+    drift = dict.fromkeys(USER_STATS_COLUMNS, 0)
+    for row in drifted:
+        for column in USER_STATS_COLUMNS:
+            if getattr(row, column) != getattr(row, f"stored_{column}"):
+                drift[column] += 1
+
+    if drifted:
+        upsert = insert(UserStats).values(
+            [
+                {
+                    "user_id": row.user_id,
+                    **{c: getattr(row, c) for c in USER_STATS_COLUMNS},
+                }
+                for row in drifted
+            ]
+        )
+        db.execute(
+            upsert.on_conflict_do_update(
+                index_elements=[UserStats.user_id],
+                set_={c: upsert.excluded[c] for c in USER_STATS_COLUMNS},
+            )
+        )
 
-    total_comments = db.scalar(select(func.count(Comment.id))) or 0
+    return {"users": len(drifted), "columns": drift}
 
-    return {
-        "totalUsers": total_users,
-        "todaySignups": today_signups,
-        "totalPosts": total_posts,
-        "todayPosts": today_posts,
-        "totalComments": total_comments,
-    }
+
+def reconcile_user_stats(db: Session) -> dict:
+    """원본 테이블 기준으로 user_stats 재계산
+
+    {"users": 보정한 사용자 수, "columns": {컬럼: 차이 난 사용자 수}} 반환
+    """
+    result = _reconcile_user_stats(db)
+    db.commit()
+    return result
+
+
+# Admin 관련 함수들
+def get_dashboard_stats(db: Session) -> dict:
+    """관리자 대시보드 통계 (메모리 일별 집계에서 조회)"""
+    dashboard_stats.ensure_fresh(db)
+    return dashboard_stats.summary()
+
+
+def get_dashboard_series(db: Session, days: int = 30) -> List[dict]:
+    """최근 days일의 일별 가입/글/댓글 수"""
+    dashboard_stats.ensure_fresh(db)
+    return dashboard_stats.series(days)
@@ -1,7 +1,11 @@
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.core.auth_cache import auth_cache
+from app.core.dashboard_stats import dashboard_stats
 from app.core.security import get_password_hash, verify_password
+from app.core.writer import after_commit
+from app.crud.posts import post_list_cache
 from app.models.users import User
 
 
@@ -41,29 +45,48 @@ def authenticate_user(db: Session, email: str, password: str) -> User | None:
     return user
 
 
-def create_user(db: Session, email: str, password: str, nickname: str) -> User:
+def create_user(
+    db: Session,
+    email: str,
+    password: str,
+    nickname: str,
+    hashed_password: str = None,
+) -> User:
     """
-    새 사용자 생성
+    새 사용자 생성 (hashed_password가 주어지면 해싱 생략)
     """
-    hashed_password = get_password_hash(password)
+    if hashed_password is None:
+        hashed_password = get_password_hash(password)
     db_user = User(email=email, password=hashed_password, nickname=nickname)
     db.add(db_user)
     db.commit()
+    after_commit(db, lambda: dashboard_stats.record("signups"))
     db.refresh(db_user)
     return db_user
 
 
 def update_user(
-    db: Session, user: User, nickname: str = None, password: str = None
+    db: Session,
+    user: User,
+    nickname: str = None,
+    password: str = None,
+    hashed_password: str = None,
 ) -> User:
     """
-    사용자 정보 수정
+    사용자 정보 수정 (hashed_password가 주어지면 해싱 생략)
     """
     if nickname is not None:
         user.nickname = nickname
-    if password is not None:
+    if hashed_password is not None:
+        user.password = hashed_password
+    elif password is not None:
         user.password = get_password_hash(password)
 
+    email = user.email
     db.commit()
+    after_commit(db, lambda: auth_cache.invalidate_user(email))
+    if nickname is not None:
+        # 작성자 닉네임은 모든 글 목록 응답에 포함됨
+        after_commit(db, post_list_cache.bump_all)
     db.refresh(user)
     return user
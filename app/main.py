@@ -1,30 +1,148 @@
+import asyncio
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from app.api.api import api_router
+from app.api.endpoints import internal
+from app.core.analytics import analytics_reporter
+from app.core.auth_cache import auth_cache
 from app.core.config import settings
-from app.core.database import init_database
+from app.core.dashboard_stats import dashboard_stats
+from app.core.database import (
+    duckdb_manager,
+    init_database,
+    sqlalchemy_manager,
+)
+from app.core.executor import db_executor, run_db
+from app.core.forwarding import WriteForwarder, write_forwarder
+from app.core.password_hasher import (
+    PasswordHasherBusyError,
+    PasswordHasherUnavailableError,
+    password_hasher,
+)
+from app.core.search import post_search_index
+from app.core.snapshots import snapshot_follower, snapshot_publisher
+from app.core.tag_cache import tag_dictionary
+from app.core.view_counter import view_count_buffer
+from app.core.writer import db_writer
+from app.crud.announcements import announcement_cache
+from app.crud.posts import post_list_cache
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 라이프사이클 관리"""
+    if app.state.role == "reader":
+        async with reader_lifespan(app):
+            yield
+        return
+
     # 시작 시 데이터베이스 초기화
     init_database()
+
+    # 게시글 검색 색인, 태그 사전, 대시보드 집계 구성
+    db = sqlalchemy_manager.get_session()
+    try:
+        post_search_index.rebuild(db)
+        tag_dictionary.rebuild(db)
+        dashboard_stats.refresh(db)
+    finally:
+        db.close()
+
+    # 조회수 버퍼 주기적 반영 및 대시보드 주기적 재집계
+    flush_task = asyncio.create_task(view_count_buffer.run_periodic_flush())
+    refresh_task = asyncio.create_task(dashboard_stats.run_periodic_refresh())
+    tasks = [flush_task, refresh_task]
+
+    # writer는 첫 스냅샷을 발행한 뒤 변경이 있을 때마다 주기적으로 발행
+    if app.state.role == "writer":
+        await snapshot_publisher.publish_async(force=True)
+        tasks.append(
+            asyncio.create_task(snapshot_publisher.run_periodic_publish())
+        )
+
+    yield
+
+    # 종료 시 대기 중인 쓰기와 남은 조회수 반영 후 작업 풀 정리
+    for task in tasks:
+        task.cancel()
+    db_writer.shutdown()
+    view_count_buffer.flush()
+    db_executor.shutdown()
+    analytics_reporter.shutdown()
+    password_hasher.shutdown()
+
+
+@asynccontextmanager
+async def reader_lifespan(app: FastAPI):
+    """reader 프로세스 라이프사이클 (스냅샷 읽기 전용, 쓰기는 writer로 전달)"""
+    forwarder: WriteForwarder = app.state.forwarder
+
+    # writer가 발행한 최신 스냅샷을 열고 색인/캐시 구성
+    await run_db(snapshot_follower.wait_for_snapshot)
+    view_count_buffer.forwarding = True
+
+    # 스냅샷 교체 확인, 조회수 증분 전달, 대시보드 주기적 재집계
+    tasks = [
+        asyncio.create_task(snapshot_follower.run_periodic_refresh()),
+        asyncio.create_task(forwarder.run_periodic_view_forward()),
+        asyncio.create_task(dashboard_stats.run_periodic_refresh()),
+    ]
+
     yield
-    # 종료 시 정리 작업 (필요시)
+
+    # 종료 시 남은 조회수 전달 후 작업 풀 정리
+    for task in tasks:
+        task.cancel()
+    try:
+        await forwarder.forward_view_counts()
+    except Exception as e:
+        print(f"View count forward error: {e}")
+    await forwarder.close()
+    db_executor.shutdown()
+    analytics_reporter.shutdown()
+    password_hasher.shutdown()
 
 
-def create_app() -> FastAPI:
-    """FastAPI 애플리케이션 팩토리"""
+async def password_hasher_busy_handler(
+    request: Request, exc: PasswordHasherBusyError
+):
+    """비밀번호 해시 대기열 포화 시 429 응답"""
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"},
+    )
+
+
+async def password_hasher_unavailable_handler(
+    request: Request, exc: PasswordHasherUnavailableError
+):
+    """비밀번호 해시 프로세스 풀 장애 시 503 응답"""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+    )
+
+
+def create_app(role: str = None, forwarder: WriteForwarder = None) -> FastAPI:
+    """FastAPI 애플리케이션 팩토리
+
+    role(기본값 settings.DB_ROLE)이 reader이면 쓰기 요청을 forwarder로
+    writer에 전달하고, writer이면 reader용 내부 API를 추가합니다.
+    """
+    role = role or settings.DB_ROLE
     app = FastAPI(
         title=settings.PROJECT_NAME,
         description=settings.PROJECT_DESCRIPTION,
         version=settings.VERSION,
         lifespan=lifespan,
     )
+    app.state.role = role
+    app.state.forwarder = forwarder or write_forwarder
 
     # CORS 미들웨어 설정
     app.add_middleware(
@@ -35,8 +153,22 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # 비밀번호 해시 과부하/장애 응답
+    app.add_exception_handler(
+        PasswordHasherBusyError, password_hasher_busy_handler
+    )
+    app.add_exception_handler(
+        PasswordHasherUnavailableError, password_hasher_unavailable_handler
+    )
+
+    # reader는 쓰기 요청을 writer로 전달
+    if role == "reader":
+        app.middleware("http")(app.state.forwarder.middleware)
+
     # API 라우터 포함
     app.include_router(api_router, prefix=settings.API_PREFIX)
+    if role == "writer":
+        app.include_router(internal.router)
 
     return app
 
@@ -54,3 +186,32 @@ async def root():
 async def health_check():
     """헬스 체크 엔드포인트"""
     return {"status": "healthy"}
+
+
+@app.get(
+    "/metrics",
+    include_in_schema=False,
+    dependencies=[Depends(internal.verify_internal_request)],
+)
+async def metrics():
+    """내부 실행 상태 메트릭 엔드포인트 (내부 API 토큰 필요)"""
+    return {
+        "dbExecutor": db_executor.stats(),
+        "dbWriter": db_writer.stats(),
+        "duckdbCursors": duckdb_manager.stats(),
+        "searchIndex": post_search_index.stats(),
+        "tagDictionary": tag_dictionary.stats(),
+        "viewCounts": view_count_buffer.stats(),
+        "dashboardStats": dashboard_stats.stats(),
+        "authCache": auth_cache.stats(),
+        "passwordHasher": password_hasher.stats(),
+        "analytics": analytics_reporter.stats(),
+        "announcementCache": announcement_cache.stats(),
+        "postListCache": post_list_cache.stats(),
+        "snapshots": (
+            snapshot_follower.stats()
+            if app.state.role == "reader"
+            else snapshot_publisher.stats()
+        ),
+        "writeForwarder": app.state.forwarder.stats(),
+    }
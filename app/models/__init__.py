@@ -1,13 +1,25 @@
 # SQLAlchemy Base 클래스
+from .announcements import Announcement
 from .comments import Comment
 from .database_models import Base
 from .post_likes import PostLike
 from .post_tags import PostTag
 from .posts import Post
 from .tags import Tag
+from .user_stats import UserStats
 
 # 모든 모델 클래스들
 from .users import User
 
 # 모든 모델을 export하여 Base.metadata.create_all()이 작동하도록 함
-__all__ = ["Base", "User", "Post", "Comment", "Tag", "PostTag", "PostLike"]
+__all__ = [
+    "Base",
+    "User",
+    "Post",
+    "Comment",
+    "Tag",
+    "PostTag",
+    "PostLike",
+    "UserStats",
+    "Announcement",
+]
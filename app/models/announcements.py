@@ -0,0 +1,34 @@
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Integer,
+    Sequence,
+    String,
+    Text,
+)
+from sqlalchemy.sql import func
+
+from app.models.database_models import Base
+
+
+class Announcement(Base):
+    """공지사항 테이블"""
+
+    __tablename__ = "announcements"
+
+    id = Column(Integer, Sequence("announcements_id_seq"), primary_key=True)
+    title = Column(String(255), nullable=False)
+    content = Column(Text, nullable=False)
+    is_active = Column(Boolean, nullable=False, default=True)
+    created_at = Column(
+        DateTime,
+        nullable=False,
+        server_default=func.current_timestamp(),
+    )
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        server_default=func.current_timestamp(),
+        onupdate=func.current_timestamp(),
+    )
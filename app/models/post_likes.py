@@ -1,17 +1,23 @@
 from app.models.database_models import Base
 
 
-from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy import Column, DateTime, ForeignKey, Integer
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
 
 class PostLike(Base):
     """게시글 좋아요 테이블 (다대다 관계)"""
+
     __tablename__ = "post_likes"
 
     user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
     post_id = Column(Integer, ForeignKey("posts.id"), primary_key=True)
+    # 컬럼 추가 이전의 좋아요는 NULL
+    created_at = Column(
+        DateTime, nullable=True, server_default=func.current_timestamp()
+    )
 
     # 관계 설정
     user = relationship("User", back_populates="post_likes")
-    post = relationship("Post", back_populates="post_likes")
\ No newline at end of file
+    post = relationship("Post", back_populates="post_likes")
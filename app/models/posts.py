@@ -25,6 +25,7 @@ class Post(Base):
     content = Column(Text, nullable=False)
     view_count = Column(Integer, nullable=False, default=0)
     like_count = Column(Integer, nullable=False, default=0)
+    comment_count = Column(Integer, nullable=False, default=0)
     created_at = Column(
         DateTime,
         nullable=False,
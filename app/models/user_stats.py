@@ -0,0 +1,25 @@
+from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy.orm import relationship
+
+from app.models.database_models import Base
+
+
+class UserStats(Base):
+    """사용자별 활동 집계 테이블 (글/댓글/좋아요 수)
+
+    글/댓글/좋아요 CRUD가 같은 트랜잭션에서 상대값으로 갱신하고,
+    reconcile_user_stats()가 원본 테이블 기준으로 재계산합니다.
+    """
+
+    __tablename__ = "user_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    post_count = Column(Integer, nullable=False, default=0)  # 삭제 안 된 글
+    comment_count = Column(Integer, nullable=False, default=0)
+    likes_given = Column(Integer, nullable=False, default=0)
+    likes_received = Column(
+        Integer, nullable=False, default=0
+    )  # 삭제 안 된 글
+
+    # 관계 설정
+    user = relationship("User", back_populates="stats")
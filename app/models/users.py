@@ -36,3 +36,9 @@ class User(Base):
     post_likes = relationship(
         "PostLike", back_populates="user", cascade="all, delete-orphan"
     )
+    stats = relationship(
+        "UserStats",
+        back_populates="user",
+        uselist=False,
+        cascade="all, delete-orphan",
+    )
@@ -1,5 +1,5 @@
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -54,11 +54,19 @@ class CommentResponse(BaseModel):
     createdAt: datetime
     parentCommentId: Optional[int] = None
     replies: List["CommentResponse"] = []
+    replyCount: Optional[int] = None  # 답글 미리보기 시 전체 답글 수
 
     class Config:
         from_attributes = True
 
 
+class CommentListResponse(BaseModel):
+    """댓글 목록 응답 스키마"""
+
+    comments: List[CommentResponse]
+    nextCursor: Optional[str] = None  # 마지막 페이지면 None
+
+
 class PostDetailResponse(BaseModel):
     """글 상세 응답 스키마"""
 
@@ -71,6 +79,7 @@ class PostDetailResponse(BaseModel):
     author: AuthorResponse
     tags: List[str] = []
     comments: List[CommentResponse] = []
+    commentsNextCursor: Optional[str] = None  # 다음 댓글 페이지 커서
 
     class Config:
         from_attributes = True
@@ -80,8 +89,9 @@ class PostListResponse(BaseModel):
     """글 목록 응답 스키마"""
 
     posts: List[PostSummaryResponse]
-    totalPages: int
+    totalPages: Optional[int] = None  # includeTotal=true일 때만 계산
     currentPage: int
+    nextCursor: Optional[str] = None  # 마지막 페이지면 None
 
     class Config:
         from_attributes = True
@@ -128,12 +138,93 @@ class AdminDashboardResponse(BaseModel):
     totalComments: int
 
 
+class DailyStatsPoint(BaseModel):
+    """일별 집계 항목 스키마"""
+
+    date: date
+    signups: int
+    posts: int
+    comments: int
+
+
+class AdminDashboardSeriesResponse(BaseModel):
+    """관리자 대시보드 일별 추이 응답 스키마"""
+
+    series: List[DailyStatsPoint]  # 오래된 날짜부터
+
+
+class ActivityBucketResponse(BaseModel):
+    """단위 시간별 활동 집계 스키마"""
+
+    bucketStart: datetime
+    signups: int
+    posts: int
+    comments: int
+    likes: int
+
+
+class AnalyticsActivityResponse(BaseModel):
+    """활동 추이 분석 응답 스키마"""
+
+    bucket: str
+    days: int
+    series: List[ActivityBucketResponse]  # 활동이 있는 구간만, 시간순
+
+
+class TopAuthorResponse(BaseModel):
+    """상위 작성자 스키마"""
+
+    rank: int
+    id: int
+    nickname: str
+    posts: int
+    likes: int
+    comments: int
+
+
+class AnalyticsTopAuthorsResponse(BaseModel):
+    """상위 작성자 분석 응답 스키마"""
+
+    days: int
+    authors: List[TopAuthorResponse]
+
+
+class TopTagResponse(BaseModel):
+    """상위 태그 스키마"""
+
+    rank: int
+    id: int
+    name: str
+    posts: int
+    likes: int
+
+
+class AnalyticsTopTagsResponse(BaseModel):
+    """상위 태그 분석 응답 스키마"""
+
+    days: int
+    tags: List[TopTagResponse]
+
+
 class AdminDeleteRequest(BaseModel):
     """관리자 삭제 요청 스키마"""
 
     deleteType: str = "soft"  # 'soft' or 'hard'
 
 
+class SearchReindexResponse(BaseModel):
+    """검색 색인 재구성 응답 스키마"""
+
+    indexedPosts: int
+
+
+class UserStatsReconcileResponse(BaseModel):
+    """사용자 집계 재계산 응답 스키마"""
+
+    reconciledUsers: int  # 값이 달라 보정한 사용자 수
+    driftedColumns: Dict[str, int]  # 컬럼별 차이 난 사용자 수
+
+
 class AnnouncementCreateRequest(BaseModel):
     """공지사항 작성 요청 스키마"""
 
@@ -142,6 +233,14 @@ class AnnouncementCreateRequest(BaseModel):
     isActive: bool = True
 
 
+class AnnouncementUpdateRequest(BaseModel):
+    """공지사항 수정 요청 스키마 (전달된 항목만 수정)"""
+
+    title: Optional[str] = None
+    content: Optional[str] = None
+    isActive: Optional[bool] = None
+
+
 class AnnouncementResponse(BaseModel):
     """공지사항 응답 스키마"""
 
@@ -153,3 +252,9 @@ class AnnouncementResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class ViewCountsRequest(BaseModel):
+    """reader가 전달하는 조회수 증분 스키마 (내부용)"""
+
+    counts: Dict[int, int]  # 글 ID별 조회수 증분
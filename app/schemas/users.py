@@ -30,12 +30,22 @@ class UserUpdateRequest(BaseModel):
     password: str | None = None
 
 
+class UserStatsResponse(BaseModel):
+    """사용자 활동 집계 응답 스키마"""
+
+    postCount: int
+    commentCount: int
+    likesGiven: int
+    likesReceived: int
+
+
 class UserPublicResponse(BaseModel):
     """공개 사용자 정보 응답 스키마 (다른 사용자 조회용)"""
 
     id: int
     nickname: str
     createdAt: datetime
+    stats: UserStatsResponse | None = None
 
     class Config:
         from_attributes = True
@@ -1,9 +1,11 @@
 import hashlib
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import and_, func
+from sqlalchemy import and_, func, update
 from sqlalchemy.orm import Session
 
+from app.core.auth_cache import auth_cache
+from app.core.tag_cache import tag_dictionary
 from app.models import Comment, Post, PostLike, PostTag, Tag, User
 from app.schemas.database_schemas import (
     CommentCreate,
@@ -81,6 +83,7 @@ class UserService:
 
         db_user.updated_at = func.now()
         db.commit()
+        auth_cache.invalidate_user(db_user.email)
         db.refresh(db_user)
         return db_user
 
@@ -91,8 +94,10 @@ class UserService:
         if not db_user:
             return False
 
+        email = db_user.email
         db.delete(db_user)
         db.commit()
+        auth_cache.invalidate_user(email)
         return True
 
     @staticmethod
@@ -119,15 +124,10 @@ class PostService:
         if post_data.tag_names:
             for tag_name in post_data.tag_names:
                 # 태그 존재 확인 또는 생성
-                tag = db.query(Tag).filter(Tag.name == tag_name).first()
-                if not tag:
-                    tag = Tag(name=tag_name)
-                    db.add(tag)
-                    db.commit()
-                    db.refresh(tag)
+                tag_id = TagService.get_or_create_tag_id(db, tag_name)
 
                 # 게시글-태그 연결
-                post_tag = PostTag(post_id=db_post.id, tag_id=tag.id)
+                post_tag = PostTag(post_id=db_post.id, tag_id=tag_id)
                 db.add(post_tag)
 
         db.commit()
@@ -203,14 +203,9 @@ class PostService:
 
             # 새 태그 연결
             for tag_name in update_data["tag_names"]:
-                tag = db.query(Tag).filter(Tag.name == tag_name).first()
-                if not tag:
-                    tag = Tag(name=tag_name)
-                    db.add(tag)
-                    db.commit()
-                    db.refresh(tag)
-
-                post_tag = PostTag(post_id=post_id, tag_id=tag.id)
+                tag_id = TagService.get_or_create_tag_id(db, tag_name)
+
+                post_tag = PostTag(post_id=post_id, tag_id=tag_id)
                 db.add(post_tag)
 
         db.commit()
@@ -272,6 +267,15 @@ class CommentService:
         )
 
         db.add(db_comment)
+        db.execute(
+            update(Post)
+            .where(Post.id == comment_data.post_id)
+            .values(
+                comment_count=Post.comment_count + 1,
+                # 댓글은 글 수정이 아니므로 수정 시각 유지
+                updated_at=Post.updated_at,
+            )
+        )
         db.commit()
         db.refresh(db_comment)
         return db_comment
@@ -325,6 +329,14 @@ class CommentService:
             return False
 
         db.delete(db_comment)
+        db.execute(
+            update(Post)
+            .where(Post.id == db_comment.post_id)
+            .values(
+                comment_count=func.greatest(Post.comment_count - 1, 0),
+                updated_at=Post.updated_at,
+            )
+        )
         db.commit()
         return True
 
@@ -339,8 +351,17 @@ class TagService:
         db.add(db_tag)
         db.commit()
         db.refresh(db_tag)
+        tag_dictionary.add_many([(db_tag.name, db_tag.id)])
         return db_tag
 
+    @staticmethod
+    def get_or_create_tag_id(db: Session, name: str) -> int:
+        """태그 사전으로 태그 id 조회 (없으면 생성)"""
+        tag_id = tag_dictionary.resolve(db, name)
+        if tag_id is None:
+            tag_id = TagService.create_tag(db, TagCreate(name=name)).id
+        return tag_id
+
     @staticmethod
     def get_tags(db: Session, skip: int = 0, limit: int = 100) -> List[Tag]:
         """태그 목록 조회"""
@@ -0,0 +1,188 @@
+"""
+글 상세/목록 즉시 로딩 전략 벤치마크 스크립트
+
+임시 DuckDB 파일에 댓글/태그가 많은 글을 만들고, 컬렉션을 한 쿼리에
+joinedload 하던 이전 방식과 현재 crud 함수(selectinload)의 쿼리 수,
+DB가 돌려준 행 수, 지연 시간(중앙값)을 비교합니다.
+
+사용법: python scripts/benchmark_post_loading.py [--comments 5000] [--tags 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event, insert, select
+from sqlalchemy.orm import Session, joinedload
+
+from app.crud.posts import get_post_by_id, get_posts
+from app.models import Base, Comment, Post, PostTag, Tag, User
+
+
+def seed(engine, comments: int, tags: int, posts: int) -> int:
+    """벤치마크 데이터 생성 (댓글/태그가 많은 글 id 반환)"""
+    with Session(engine) as db:
+        user = User(email="bench@example.com", password="-", nickname="bench")
+        db.add(user)
+        db.flush()
+
+        tag_ids = db.scalars(
+            insert(Tag)
+            .values([{"name": f"tag{i}"} for i in range(tags)])
+            .returning(Tag.id)
+        ).all()
+
+        post_ids = db.scalars(
+            insert(Post)
+            .values(
+                [
+                    {"user_id": user.id, "title": f"글 {i}", "content": "본문"}
+                    for i in range(posts)
+                ]
+            )
+            .returning(Post.id)
+        ).all()
+
+        db.execute(
+            insert(PostTag).values(
+                [
+                    {"post_id": post_id, "tag_id": tag_id}
+                    for post_id in post_ids
+                    for tag_id in tag_ids
+                ]
+            )
+        )
+        db.execute(
+            insert(Comment).values(
+                [
+                    {
+                        "post_id": post_ids[0],
+                        "user_id": user.id,
+                        "content": f"댓글 {i}",
+                    }
+                    for i in range(comments)
+                ]
+            )
+        )
+        db.commit()
+        return post_ids[0]
+
+
+def legacy_get_post(db: Session, post_id: int):
+    """이전 방식: 작성자/댓글/태그를 한 쿼리에 joinedload"""
+    return (
+        db.scalars(
+            select(Post)
+            .options(
+                joinedload(Post.author),
+                joinedload(Post.comments).joinedload(Comment.author),
+                joinedload(Post.post_tags).joinedload(PostTag.tag),
+            )
+            .where(Post.id == post_id)
+        )
+        .unique()
+        .first()
+    )
+
+
+def legacy_get_posts(db: Session, limit: int):
+    """이전 방식: 목록에서도 글마다 태그를 joinedload"""
+    return (
+        db.scalars(
+            select(Post)
+            .options(
+                joinedload(Post.author),
+                joinedload(Post.post_tags).joinedload(PostTag.tag),
+            )
+            .order_by(Post.created_at.desc(), Post.id.desc())
+            .limit(limit + 1)
+        )
+        .unique()
+        .all()
+    )
+
+
+def measure(engine, func, runs: int) -> dict:
+    """쿼리 수/반환 행 수/지연 시간 중앙값 측정"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "after_cursor_execute", record)
+    try:
+        with Session(engine) as db:
+            func(db)
+    finally:
+        event.remove(engine, "after_cursor_execute", record)
+
+    # 기록한 쿼리를 다시 실행해 DB가 돌려준 행 수 집계
+    rows = 0
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            rows += len(conn.exec_driver_sql(statement, parameters).all())
+
+    timings = []
+    for _ in range(runs):
+        with Session(engine) as db:
+            started_at = time.perf_counter()
+            func(db)
+            timings.append((time.perf_counter() - started_at) * 1000)
+
+    return {
+        "queries": len(statements),
+        "rows": rows,
+        "median_ms": statistics.median(timings),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--comments", type=int, default=5000)
+    parser.add_argument("--tags", type=int, default=20)
+    parser.add_argument("--posts", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_engine(f"duckdb:///{tmpdir}/benchmark.duckdb")
+        Base.metadata.create_all(engine)
+        post_id = seed(engine, args.comments, args.tags, args.posts)
+        print(
+            f"댓글 {args.comments}개, 태그 {args.tags}개 글 / "
+            f"글 {args.posts}개 목록 ({args.runs}회 중앙값)\n"
+        )
+
+        cases = [
+            ("상세 joinedload", lambda db: legacy_get_post(db, post_id)),
+            ("상세 selectinload", lambda db: get_post_by_id(db, post_id)),
+            (
+                "상세 댓글 제외",
+                lambda db: get_post_by_id(db, post_id, load_comments=False),
+            ),
+            ("목록 joinedload", lambda db: legacy_get_posts(db, 20)),
+            (
+                "목록 컬럼 투영",
+                lambda db: get_posts(db, limit=20, include_total=False),
+            ),
+        ]
+
+        print(f"{'전략':<16}{'쿼리':>6}{'행':>10}{'ms':>10}")
+        for name, func in cases:
+            result = measure(engine, func, args.runs)
+            print(
+                f"{name:<16}{result['queries']:>6}{result['rows']:>10}"
+                f"{result['median_ms']:>10.2f}"
+            )
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
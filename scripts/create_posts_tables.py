@@ -49,6 +49,7 @@ def create_posts_tables():
                 content TEXT NOT NULL,
                 view_count INTEGER DEFAULT 0,
                 like_count INTEGER DEFAULT 0,
+                comment_count INTEGER DEFAULT 0,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 deleted_at TIMESTAMP,
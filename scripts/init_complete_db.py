@@ -69,6 +69,7 @@ def create_complete_database():
                 content TEXT NOT NULL,
                 view_count INTEGER DEFAULT 0,
                 like_count INTEGER DEFAULT 0,
+                comment_count INTEGER DEFAULT 0,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 deleted_at TIMESTAMP,
@@ -202,6 +203,17 @@ def create_complete_database():
         """
         )
 
+        # Denormalized comment counts
+        conn.execute(
+            """
+            UPDATE posts SET comment_count = c.cnt
+            FROM (
+                SELECT post_id, COUNT(*) AS cnt FROM comments GROUP BY post_id
+            ) AS c
+            WHERE posts.id = c.post_id
+        """
+        )
+
         print("✓ Test data inserted successfully")
 
         # Verify data
@@ -0,0 +1,41 @@
+"""
+사용자 집계(user_stats) 재계산 스크립트
+
+글/댓글/좋아요 원본 테이블 기준으로 사용자별 집계를 다시 계산하고,
+저장된 값과 차이가 난 컬럼별 사용자 수를 출력합니다.
+"""
+
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.database import init_database, sqlalchemy_manager
+from app.crud.posts import reconcile_user_stats
+
+
+def reconcile():
+    """원본 테이블 기준으로 모든 사용자의 집계 재계산"""
+    init_database()  # 누락된 테이블 생성
+
+    db = sqlalchemy_manager.get_session()
+    try:
+        result = reconcile_user_stats(db)
+        if result["users"]:
+            print(f"✓ {result['users']}명의 집계를 보정했습니다.")
+            for column, count in result["columns"].items():
+                if count:
+                    print(f"  - {column}: {count}명")
+        else:
+            print("✓ 모든 사용자의 집계가 정확합니다.")
+
+    except Exception as e:
+        print(f"사용자 집계 재계산 중 오류: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    reconcile()
@@ -0,0 +1,35 @@
+"""
+게시글 댓글 수(posts.comment_count) 백필/복구 스크립트
+"""
+
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.database import init_database, sqlalchemy_manager
+from app.crud.posts import repair_comment_counts
+
+
+def repair():
+    """comments 테이블 기준으로 모든 글의 댓글 수 재계산"""
+    init_database()  # 누락된 컬럼 추가
+
+    db = sqlalchemy_manager.get_session()
+    try:
+        repaired = repair_comment_counts(db)
+        if repaired:
+            print(f"✓ {repaired}개 글의 댓글 수를 복구했습니다.")
+        else:
+            print("✓ 모든 글의 댓글 수가 정확합니다.")
+
+    except Exception as e:
+        print(f"댓글 수 복구 중 오류: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    repair()
@@ -0,0 +1,122 @@
+"""
+관리자 분석 리포트 pytest 테스트
+
+This module contains pytest-based tests for the admin analytics reports
+run on the raw SQL cursor pool.
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.analytics import AnalyticsReporter, AnalyticsTimeoutError
+from app.main import app
+
+client = TestClient(app)
+
+
+class TestAnalyticsReporter:
+    """분석 리포트 실행기 테스트 클래스"""
+
+    def test_results_are_cached_per_window(self):
+        """같은 기간/인자의 리포트는 한 번만 실행되는지 테스트"""
+        reporter = AnalyticsReporter(max_workers=1)
+        try:
+
+            async def run():
+                await reporter.top_authors(days=7, limit=5)
+                await reporter.top_authors(days=7, limit=5)
+                await reporter.top_authors(days=30, limit=5)
+
+            asyncio.run(run())
+            stats = reporter.stats()
+            assert stats["queries"] == 2
+            assert stats["cache"]["hits"] == 1
+        finally:
+            reporter.shutdown()
+
+    def test_query_timeout_interrupts(self):
+        """시간 상한을 넘는 쿼리가 중단되는지 테스트"""
+        reporter = AnalyticsReporter(max_workers=1, query_timeout=0.05)
+        try:
+            with pytest.raises(AnalyticsTimeoutError):
+                reporter._query(
+                    "SELECT count(*) FROM range(100000000) a, range(100) b",
+                    {},
+                )
+            assert reporter.stats()["timeouts"] == 1
+
+            # 중단된 연결도 다음 쿼리에 다시 사용 가능
+            assert reporter._query("SELECT 1 AS one", {}) == [{"one": 1}]
+        finally:
+            reporter.shutdown()
+
+
+class TestAnalyticsAPI:
+    """분석 API 테스트 클래스"""
+
+    def test_reports_include_new_activity(self, auth_headers):
+        """새 글/태그/좋아요가 분석 리포트에 반영되는지 테스트"""
+        if not auth_headers.get("Authorization"):
+            pytest.skip("Authentication token not available")
+
+        response = client.post(
+            "/api/v1/posts",
+            json={
+                "title": "분석 테스트",
+                "content": "집계",
+                "tags": ["analytics-test"],
+            },
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+        post_id = response.json()["id"]
+        client.post(f"/api/v1/posts/{post_id}/like", headers=auth_headers)
+
+        response = client.get(
+            "/api/v1/admin/analytics/activity?bucket=hour&days=1",
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        series = response.json()["series"]
+        assert series[-1]["posts"] >= 1
+        assert series[-1]["likes"] >= 1
+
+        response = client.get(
+            "/api/v1/admin/analytics/top-authors?days=1&limit=100",
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        authors = response.json()["authors"]
+        assert authors and authors[0]["rank"] == 1
+
+        response = client.get(
+            "/api/v1/admin/analytics/top-tags?days=1&limit=100",
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        tags = {tag["name"] for tag in response.json()["tags"]}
+        assert "analytics-test" in tags
+
+    def test_invalid_bucket(self, auth_headers):
+        """지원하지 않는 집계 단위 요청 테스트"""
+        if not auth_headers.get("Authorization"):
+            pytest.skip("Authentication token not available")
+
+        response = client.get(
+            "/api/v1/admin/analytics/activity?bucket=month",
+            headers=auth_headers,
+        )
+        assert response.status_code == 422
+
+
+@pytest.fixture
+def auth_headers():
+    """인증 헤더를 제공하는 픽스처"""
+    login_data = {"email": "user@example.com", "password": "password123"}
+    response = client.post("/api/v1/auth/login", json=login_data)
+
+    if response.status_code == 200:
+        return {"Authorization": f"Bearer {response.json()['accessToken']}"}
+    return {}
@@ -0,0 +1,130 @@
+"""
+공지사항 pytest 테스트
+
+This module contains pytest-based tests for the persisted announcements
+store and its versioned in-process cache.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.core.cache import VersionedCache
+from app.core.database import sqlalchemy_manager
+from app.crud.announcements import announcement_cache
+from app.main import app
+from app.models.announcements import Announcement
+
+client = TestClient(app)
+
+PUBLIC_URL = "/api/v1/announcements/admin/announcements"
+
+
+class TestVersionedCache:
+    """버전 캐시 테스트 클래스"""
+
+    def test_bump_invalidates(self):
+        """버전 증가 후 이전 항목이 조회되지 않는지 테스트"""
+        cache = VersionedCache(max_entries=4, ttl_seconds=60)
+        assert cache.set("key", "value", cache.version)
+        assert cache.get("key") == "value"
+
+        cache.bump()
+        assert cache.get("key") is None
+
+    def test_stale_load_not_stored(self):
+        """조회 중 무효화된 결과는 저장하지 않는지 테스트"""
+        cache = VersionedCache(max_entries=4, ttl_seconds=60)
+        version = cache.version
+        cache.bump()
+
+        assert not cache.set("key", "stale", version)
+        assert cache.get("key") is None
+
+
+class TestAnnouncementsAPI:
+    """공지사항 API 테스트 클래스"""
+
+    def test_create_persists_and_invalidates(self, auth_headers):
+        """작성한 공지가 테이블에 저장되고 목록에 바로 보이는지 테스트"""
+        if not auth_headers.get("Authorization"):
+            pytest.skip("Authentication token not available")
+
+        client.get(PUBLIC_URL)
+        response = client.post(
+            "/api/v1/admin/announcements",
+            json={"title": "점검 안내", "content": "새벽 2시 점검"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+        announcement_id = response.json()["id"]
+
+        db = sqlalchemy_manager.get_session()
+        try:
+            stored = db.scalar(
+                select(Announcement).where(Announcement.id == announcement_id)
+            )
+            assert stored is not None
+            assert stored.title == "점검 안내"
+        finally:
+            db.close()
+
+        response = client.get(PUBLIC_URL)
+        assert response.status_code == 200
+        assert announcement_id in [ann["id"] for ann in response.json()]
+
+    def test_list_served_from_cache(self):
+        """두 번째 조회는 캐시에서 응답하는지 테스트"""
+        client.get(PUBLIC_URL)
+        hits = announcement_cache.stats()["hits"]
+
+        response = client.get(PUBLIC_URL)
+        assert response.status_code == 200
+        assert announcement_cache.stats()["hits"] == hits + 1
+
+    def test_deactivate_hides_announcement(self, auth_headers):
+        """비활성화한 공지가 목록에서 빠지는지 테스트"""
+        if not auth_headers.get("Authorization"):
+            pytest.skip("Authentication token not available")
+
+        response = client.post(
+            "/api/v1/admin/announcements",
+            json={"title": "임시 공지", "content": "곧 내립니다"},
+            headers=auth_headers,
+        )
+        announcement_id = response.json()["id"]
+        client.get(PUBLIC_URL)
+
+        response = client.patch(
+            f"/api/v1/admin/announcements/{announcement_id}",
+            json={"isActive": False},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["isActive"] is False
+
+        response = client.get(PUBLIC_URL)
+        assert announcement_id not in [ann["id"] for ann in response.json()]
+
+    def test_update_missing_announcement(self, auth_headers):
+        """존재하지 않는 공지 수정 테스트"""
+        if not auth_headers.get("Authorization"):
+            pytest.skip("Authentication token not available")
+
+        response = client.patch(
+            "/api/v1/admin/announcements/999999",
+            json={"isActive": False},
+            headers=auth_headers,
+        )
+        assert response.status_code == 404
+
+
+@pytest.fixture
+def auth_headers():
+    """인증 헤더를 제공하는 픽스처"""
+    login_data = {"email": "user@example.com", "password": "password123"}
+    response = client.post("/api/v1/auth/login", json=login_data)
+
+    if response.status_code == 200:
+        return {"Authorization": f"Bearer {response.json()['accessToken']}"}
+    return {}
@@ -0,0 +1,146 @@
+"""
+인증 캐시 pytest 테스트
+
+This module contains pytest-based tests for the current-user auth cache.
+"""
+
+import time
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+
+from app.core.auth_cache import AuthCache, auth_cache
+from app.core.cache import TTLCache
+from app.main import app
+from app.models.users import User
+
+client = TestClient(app)
+
+
+class TestTTLCache:
+    """TTL/LRU 캐시 단위 테스트 클래스"""
+
+    def test_hit_and_miss_counters(self):
+        """적중/실패 횟수 집계 테스트"""
+        cache = TTLCache(max_entries=10, ttl_seconds=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    def test_expired_entry_is_dropped(self):
+        """만료된 항목은 조회되지 않는지 테스트"""
+        cache = TTLCache(max_entries=10, ttl_seconds=60)
+        cache.set("a", 1, ttl_seconds=0.01)
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_least_recently_used_is_evicted(self):
+        """최대 항목 수 초과 시 가장 오래 사용하지 않은 항목 제거 테스트"""
+        cache = TTLCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+
+def _user(email: str) -> User:
+    return User(email=email, password="hashed", nickname=email)
+
+
+class TestAuthCache:
+    """인증 캐시 무효화 경쟁 테스트 클래스"""
+
+    def test_load_racing_invalidation_not_cached(self):
+        """조회 도중 무효화된 사용자의 이전 값은 캐시되지 않는지 테스트"""
+        cache = AuthCache(max_entries=10, ttl_seconds=60)
+        version = cache.user_version()
+        cache.invalidate_user("a@example.com")
+
+        assert cache.set_user(_user("a@example.com"), version) is False
+        assert cache.users.get("a@example.com") is None
+
+        # 무효화 이후 시작한 조회는 캐시됨
+        version = cache.user_version()
+        assert cache.set_user(_user("a@example.com"), version) is True
+
+    def test_other_user_invalidation_keeps_load(self):
+        """다른 사용자의 무효화는 조회 결과 캐시를 막지 않는지 테스트"""
+        cache = AuthCache(max_entries=10, ttl_seconds=60)
+        version = cache.user_version()
+        cache.invalidate_user("b@example.com")
+
+        assert cache.set_user(_user("a@example.com"), version) is True
+
+    def test_evicted_invalidation_still_drops_stale_load(self):
+        """무효화 기록이 밀려나도 그 이전 조회는 캐시되지 않는지 테스트"""
+        cache = AuthCache(max_entries=1, ttl_seconds=60)
+        version = cache.user_version()
+        cache.invalidate_user("a@example.com")
+        cache.invalidate_user("b@example.com")
+
+        assert cache.set_user(_user("a@example.com"), version) is False
+
+    def test_invalidate_users_drops_inflight_loads(self):
+        """전체 무효화 이전에 시작한 조회는 캐시되지 않는지 테스트"""
+        cache = AuthCache(max_entries=10, ttl_seconds=60)
+        version = cache.user_version()
+        cache.invalidate_users()
+
+        assert cache.set_user(_user("a@example.com"), version) is False
+
+
+class TestAuthCacheAPI:
+    """인증 캐시 API 테스트 클래스"""
+
+    def test_profile_update_invalidates_cached_user(self):
+        """정보 수정 후 캐시된 사용자가 갱신되는지 테스트"""
+        timestamp = datetime.now().strftime("%H%M%S%f")
+        signup_data = {
+            "email": f"cache_user_{timestamp}@example.com",
+            "password": "pytest123",
+            "nickname": f"cache_user_{timestamp}",
+        }
+        response = client.post("/api/v1/users/signup", json=signup_data)
+        assert response.status_code == 201
+
+        response = client.post(
+            "/api/v1/auth/login",
+            json={
+                "email": signup_data["email"],
+                "password": signup_data["password"],
+            },
+        )
+        assert response.status_code == 200
+        headers = {"Authorization": f"Bearer {response.json()['accessToken']}"}
+
+        client.get("/api/v1/me", headers=headers)
+        hits = auth_cache.users.stats()["hits"]
+        response = client.get("/api/v1/me", headers=headers)
+        assert response.status_code == 200
+        assert auth_cache.users.stats()["hits"] == hits + 1
+
+        new_nickname = f"cache_renamed_{timestamp}"
+        response = client.patch(
+            "/api/v1/me", json={"nickname": new_nickname}, headers=headers
+        )
+        assert response.status_code == 200
+
+        response = client.get("/api/v1/me", headers=headers)
+        assert response.json()["nickname"] == new_nickname
+
+    def test_invalid_token_rejected(self):
+        """잘못된 토큰은 캐시와 무관하게 거부되는지 테스트"""
+        response = client.get(
+            "/api/v1/me", headers={"Authorization": "Bearer invalid"}
+        )
+
+        assert response.status_code == 401
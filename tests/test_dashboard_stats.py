@@ -0,0 +1,186 @@
+"""
+대시보드 집계 pytest 테스트
+
+This module contains pytest-based tests for the in-memory daily dashboard
+stats and the admin dashboard endpoints.
+"""
+
+import threading
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Date, cast, func, select
+
+from app.core.dashboard_stats import DashboardStats, dashboard_stats
+from app.core.database import sqlalchemy_manager
+from app.crud.posts import create_post, delete_post
+from app.main import app
+from app.models.comments import Comment
+from app.models.posts import Post
+from app.models.users import User
+
+client = TestClient(app)
+
+
+class TestDashboardStats:
+    """일별 집계 테스트 클래스"""
+
+    def test_refresh_matches_source_counts(self):
+        """재집계 결과가 원본 테이블 개수와 같은지 테스트"""
+        stats = DashboardStats()
+        db = sqlalchemy_manager.get_session()
+        try:
+            stats.refresh(db)
+            summary = stats.summary()
+
+            assert summary["totalUsers"] == db.scalar(
+                select(func.count(User.id))
+            )
+            assert summary["totalPosts"] == db.scalar(
+                select(func.count(Post.id)).where(Post.deleted_at.is_(None))
+            )
+            assert summary["totalComments"] == db.scalar(
+                select(func.count(Comment.id))
+            )
+        finally:
+            db.close()
+
+    def test_record_and_series(self):
+        """증분 반영과 빈 날짜를 0으로 채운 추이 테스트"""
+        stats = DashboardStats()
+        today = date(2024, 3, 10)
+        stats.record("posts", day=today)
+        stats.record("posts", day=today)
+        stats.record("comments", day=today - timedelta(days=2))
+        stats.record("posts", -1, day=today)
+
+        assert stats.summary(today)["todayPosts"] == 1
+        assert stats.summary(today)["totalComments"] == 1
+        assert stats.series(3, today) == [
+            {
+                "date": today - timedelta(days=2),
+                "signups": 0,
+                "posts": 0,
+                "comments": 1,
+            },
+            {
+                "date": today - timedelta(days=1),
+                "signups": 0,
+                "posts": 0,
+                "comments": 0,
+            },
+            {"date": today, "signups": 0, "posts": 1, "comments": 0},
+        ]
+
+    def test_invalidate_triggers_refresh(self):
+        """무효화 후 다음 조회에서 재집계하는지 테스트"""
+        stats = DashboardStats()
+        db = sqlalchemy_manager.get_session()
+        try:
+            stats.ensure_fresh(db)
+            stats.record("posts", 100)
+            stats.invalidate()
+            stats.ensure_fresh(db)
+
+            assert stats.stats()["refreshes"] == 2
+            assert stats.summary()["totalPosts"] == db.scalar(
+                select(func.count(Post.id)).where(Post.deleted_at.is_(None))
+            )
+        finally:
+            db.close()
+
+    def test_commit_during_refresh_counted_once(self):
+        """재집계 쿼리 중 커밋된 쓰기가 막히지 않고 한 번만 반영되는지 테스트"""
+        stats = DashboardStats()
+        db = sqlalchemy_manager.get_session()
+        other = sqlalchemy_manager.get_session()
+        execute = db.execute
+        created = []
+
+        def execute_with_commit(*args, **kwargs):
+            # 스냅샷 고정 후 다른 세션이 글을 쓰고 커밋 후 증분 반영
+            user_id = other.scalar(select(User.id))
+            created.append(create_post(other, "재집계 중 글", "집계", user_id))
+            recorder = threading.Thread(target=stats.record, args=("posts",))
+            recorder.start()
+            recorder.join(timeout=5)
+            assert not recorder.is_alive()
+            return execute(*args, **kwargs)
+
+        try:
+            db.execute = execute_with_commit
+            stats.refresh(db)
+            db.execute = execute
+            db.commit()
+
+            assert stats.summary()["totalPosts"] == db.scalar(
+                select(func.count(Post.id)).where(Post.deleted_at.is_(None))
+            )
+        finally:
+            # 다른 테스트의 글 목록에 남지 않도록 정리
+            for post in created:
+                delete_post(other, post)
+            db.close()
+            other.close()
+
+    def test_today_follows_db_timezone(self):
+        """오늘 날짜가 DB 타임스탬프 기준 날짜와 같은지 테스트"""
+        stats = DashboardStats()
+        db = sqlalchemy_manager.get_session()
+        try:
+            stats.refresh(db)
+            assert stats.today() == db.scalar(
+                select(cast(func.current_timestamp(), Date))
+            )
+        finally:
+            db.close()
+
+
+class TestDashboardAPI:
+    """관리자 대시보드 API 테스트 클래스"""
+
+    def test_dashboard_counts_new_post(self, auth_headers):
+        """글 작성이 재집계 없이 대시보드에 반영되는지 테스트"""
+        if not auth_headers.get("Authorization"):
+            pytest.skip("Authentication token not available")
+
+        response = client.get("/api/v1/admin/dashboard", headers=auth_headers)
+        assert response.status_code == 200
+        before = response.json()
+
+        response = client.post(
+            "/api/v1/posts",
+            json={"title": "대시보드 테스트", "content": "집계"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+
+        response = client.get("/api/v1/admin/dashboard", headers=auth_headers)
+        after = response.json()
+        assert after["totalPosts"] == before["totalPosts"] + 1
+        assert after["todayPosts"] == before["todayPosts"] + 1
+
+    def test_dashboard_series(self, auth_headers):
+        """일별 추이 API 테스트"""
+        if not auth_headers.get("Authorization"):
+            pytest.skip("Authentication token not available")
+
+        response = client.get(
+            "/api/v1/admin/dashboard/series?days=7", headers=auth_headers
+        )
+        assert response.status_code == 200
+        series = response.json()["series"]
+        assert len(series) == 7
+        assert series[-1]["date"] == dashboard_stats.today().isoformat()
+
+
+@pytest.fixture
+def auth_headers():
+    """인증 헤더를 제공하는 픽스처"""
+    login_data = {"email": "user@example.com", "password": "password123"}
+    response = client.post("/api/v1/auth/login", json=login_data)
+
+    if response.status_code == 200:
+        return {"Authorization": f"Bearer {response.json()['accessToken']}"}
+    return {}
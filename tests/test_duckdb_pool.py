@@ -0,0 +1,125 @@
+"""
+DuckDB 커서 풀 pytest 테스트
+
+This module contains pytest-based tests for the DuckDBManager cursor pool
+used by raw SQL queries.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import (
+    CursorPoolTimeoutError,
+    DuckDBManager,
+    duckdb_manager,
+    sqlalchemy_manager,
+)
+
+
+@pytest.fixture
+def manager():
+    """메모리 DB를 쓰는 커서 풀 픽스처"""
+    manager = DuckDBManager(":memory:", max_cursors=2, checkout_timeout=5)
+    manager.execute_script(
+        "CREATE TABLE numbers (n INTEGER);"
+        "INSERT INTO numbers SELECT * FROM range(1000)"
+    )
+    yield manager
+    manager.close_connection()
+
+
+class TestDuckDBCursorPool:
+    """커서 풀 테스트 클래스"""
+
+    def test_cursors_share_database(self, manager):
+        """풀의 커서들이 같은 데이터베이스를 보는지 테스트"""
+        with manager.cursor() as first, manager.cursor() as second:
+            assert first is not second
+            first.execute("INSERT INTO numbers VALUES (1000)")
+            assert second.execute(
+                "SELECT count(*) FROM numbers"
+            ).fetchone() == (1001,)
+
+    def test_cursors_are_reused(self, manager):
+        """반납한 커서를 다시 사용하는지 테스트"""
+        for _ in range(5):
+            assert manager.execute_query("SELECT 1") == [(1,)]
+
+        stats = manager.stats()
+        assert stats["size"] == 1
+        assert stats["checkouts"] == 6
+
+    def test_parallel_queries_bounded_by_pool(self, manager):
+        """여러 스레드의 쿼리가 풀 크기 안에서 실행되는지 테스트"""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def query(_):
+            with manager.cursor() as cursor:
+                with lock:
+                    active.append(1)
+                    peak.append(len(active))
+                result = cursor.execute(
+                    "SELECT sum(n) FROM numbers"
+                ).fetchone()
+                with lock:
+                    active.pop()
+                return result
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            results = list(executor.map(query, range(30)))
+
+        assert results == [(499500,)] * 30
+        assert max(peak) <= 2
+        assert manager.stats()["size"] <= 2
+
+    def test_checkout_timeout(self, manager):
+        """풀이 가득 찬 상태에서 대기 상한을 넘으면 예외가 나는지 테스트"""
+        with manager.cursor(), manager.cursor():
+            with pytest.raises(CursorPoolTimeoutError):
+                with manager.cursor(timeout=0.05):
+                    pass
+
+        stats = manager.stats()
+        assert stats["timeouts"] == 1
+        assert stats["waits"] == 1
+
+    def test_failed_cursor_discarded(self, manager):
+        """오류가 난 커서는 풀에 반납하지 않는지 테스트"""
+        with pytest.raises(Exception):
+            manager.execute_query("SELECT * FROM missing_table")
+
+        stats = manager.stats()
+        assert stats["discarded"] == 1
+        assert stats["size"] == 0
+        assert manager.execute_query("SELECT count(*) FROM numbers") == [
+            (1000,)
+        ]
+
+
+class TestSharedDatabaseInstance:
+    """ORM/Raw SQL 공유 인스턴스 테스트 클래스"""
+
+    def test_orm_writes_visible_to_raw_sql(self):
+        """ORM 엔진의 커밋이 Raw SQL 커서에 바로 보이는지 테스트"""
+        with sqlalchemy_manager.engine.begin() as conn:
+            conn.execute(text("CREATE TABLE shared_probe (n INTEGER)"))
+            conn.execute(text("INSERT INTO shared_probe VALUES (42)"))
+        try:
+            assert duckdb_manager.execute_query(
+                "SELECT n FROM shared_probe"
+            ) == [(42,)]
+        finally:
+            duckdb_manager.execute_script("DROP TABLE shared_probe")
+
+    def test_pool_settings_applied(self):
+        """연결 풀 설정이 엔진에 적용되는지 테스트"""
+        pool = sqlalchemy_manager.engine.pool
+        assert pool.size() == settings.DB_POOL_SIZE
+        assert pool._max_overflow == settings.DB_POOL_MAX_OVERFLOW
+        assert pool._pre_ping == settings.DB_POOL_PRE_PING
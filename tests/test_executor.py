@@ -0,0 +1,114 @@
+"""
+DB 실행기 pytest 테스트
+
+This module contains pytest-based tests for the database thread pool.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.executor import DatabaseExecutor
+from app.core.security import INTERNAL_TOKEN_HEADER, internal_api_token
+from app.main import app
+
+client = TestClient(app)
+
+
+class TestDatabaseExecutor:
+    """DB 실행기 테스트 클래스"""
+
+    def test_run_returns_result_off_event_loop(self):
+        """동기 함수가 워커 스레드에서 실행되어 결과를 반환하는지 테스트"""
+        executor = DatabaseExecutor(max_workers=2)
+
+        async def main():
+            return await executor.run(lambda: threading.current_thread().name)
+
+        try:
+            thread_name = asyncio.run(main())
+            assert thread_name.startswith("db-worker")
+        finally:
+            executor.shutdown()
+
+    def test_slow_work_does_not_block_event_loop(self):
+        """느린 DB 작업 중에도 이벤트 루프가 응답하는지 테스트"""
+        executor = DatabaseExecutor(max_workers=1)
+
+        async def main():
+            slow = asyncio.ensure_future(executor.run(time.sleep, 0.3))
+            started = time.perf_counter()
+            await asyncio.sleep(0.01)
+            elapsed = time.perf_counter() - started
+            await slow
+            return elapsed
+
+        try:
+            assert asyncio.run(main()) < 0.2
+        finally:
+            executor.shutdown()
+
+    def test_queue_depth_metrics(self):
+        """풀 크기를 넘는 작업이 큐 깊이 메트릭에 반영되는지 테스트"""
+        executor = DatabaseExecutor(max_workers=1)
+
+        async def main():
+            await asyncio.gather(
+                *[executor.run(time.sleep, 0.02) for _ in range(3)]
+            )
+
+        try:
+            asyncio.run(main())
+            stats = executor.stats()
+            assert stats["maxWorkers"] == 1
+            assert stats["completed"] == 3
+            assert stats["maxQueueDepth"] >= 2
+            assert stats["queueDepth"] == 0
+            assert stats["active"] == 0
+        finally:
+            executor.shutdown()
+
+    def test_errors_are_propagated(self):
+        """워커 스레드의 예외가 호출자에게 전달되는지 테스트"""
+        executor = DatabaseExecutor(max_workers=1)
+
+        def fail():
+            raise ValueError("boom")
+
+        try:
+            with pytest.raises(ValueError):
+                asyncio.run(executor.run(fail))
+            assert executor.stats()["failed"] == 1
+        finally:
+            executor.shutdown()
+
+    def test_executor_recreated_after_shutdown(self):
+        """종료 후에도 다시 사용할 수 있는지 테스트"""
+        executor = DatabaseExecutor(max_workers=1)
+        executor.shutdown()
+
+        try:
+            assert asyncio.run(executor.run(lambda: 42)) == 42
+        finally:
+            executor.shutdown()
+
+    def test_metrics_endpoint(self):
+        """메트릭 엔드포인트 테스트"""
+        response = client.get(
+            "/metrics", headers={INTERNAL_TOKEN_HEADER: internal_api_token()}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "dbExecutor" in data
+        assert "queueDepth" in data["dbExecutor"]
+
+    def test_metrics_endpoint_requires_internal_token(self):
+        """내부 API 토큰 없이는 메트릭을 조회할 수 없는지 테스트"""
+        for headers in ({}, {INTERNAL_TOKEN_HEADER: "wrong-token"}):
+            response = client.get("/metrics", headers=headers)
+
+            assert response.status_code == 403
@@ -0,0 +1,59 @@
+"""
+비밀번호 해시 서비스 pytest 테스트
+
+This module contains pytest-based tests for the process-pool password hasher.
+"""
+
+import asyncio
+
+from app.core.password_hasher import PasswordHasher, PasswordHasherBusyError
+
+
+class TestPasswordHasher:
+    """비밀번호 해시 서비스 테스트 클래스"""
+
+    def test_hash_and_verify(self):
+        """프로세스 풀 해싱/검증 테스트"""
+        hasher = PasswordHasher(max_workers=1, max_pending=4)
+
+        async def scenario():
+            hashed = await hasher.hash("pytest123")
+            return (
+                hashed,
+                await hasher.verify("pytest123", hashed),
+                await hasher.verify("wrong-password", hashed),
+            )
+
+        try:
+            hashed, valid, invalid = asyncio.run(scenario())
+        finally:
+            hasher.shutdown()
+
+        assert hashed.startswith("$2")
+        assert valid is True
+        assert invalid is False
+
+        stats = hasher.stats()
+        assert stats["completed"] == 3
+        assert stats["avgHashMs"] > 0
+
+    def test_rejects_when_saturated(self):
+        """처리 중 작업이 한도를 넘으면 즉시 거절하는지 테스트"""
+        hasher = PasswordHasher(max_workers=1, max_pending=1)
+
+        async def scenario():
+            return await asyncio.gather(
+                *(hasher.hash("pytest123") for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        try:
+            results = asyncio.run(scenario())
+        finally:
+            hasher.shutdown()
+
+        rejected = [
+            r for r in results if isinstance(r, PasswordHasherBusyError)
+        ]
+        assert len(rejected) == 2
+        assert hasher.stats()["rejected"] == 2
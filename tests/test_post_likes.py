@@ -0,0 +1,151 @@
+"""
+좋아요 토글 pytest 테스트
+
+This module contains pytest-based tests for the atomic post like toggle.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+
+from app.core.database import sqlalchemy_manager
+from app.core.writer import WriteExecutor
+from app.crud.posts import create_post, toggle_post_like
+from app.main import app
+from app.models.post_likes import PostLike
+from app.models.posts import Post
+from app.models.users import User
+
+client = TestClient(app)
+
+
+class TestPostLikeToggle:
+    """좋아요 토글 테스트 클래스"""
+
+    def test_toggle_on_and_off(self):
+        """좋아요 추가/취소가 번갈아 반영되는지 테스트"""
+        db = sqlalchemy_manager.get_session()
+        try:
+            user = db.query(User).first()
+            post = create_post(db, "좋아요 테스트", "토글", user.id)
+
+            assert toggle_post_like(db, post.id, user.id) == (1, True)
+            assert toggle_post_like(db, post.id, user.id) == (0, False)
+        finally:
+            db.close()
+
+    def test_toggle_missing_post(self):
+        """없는 글의 좋아요는 None을 반환하는지 테스트"""
+        db = sqlalchemy_manager.get_session()
+        try:
+            user = db.query(User).first()
+            assert toggle_post_like(db, 99999, user.id) is None
+        finally:
+            db.close()
+
+    @pytest.mark.slow
+    def test_concurrent_toggles_keep_count_consistent(self):
+        """쓰기 스레드로 몰린 토글 후 like_count가 post_likes 행 수와 같은지 테스트"""
+        db = sqlalchemy_manager.get_session()
+        try:
+            user_ids = db.scalars(select(User.id)).all()
+            post_ids = [
+                create_post(db, f"동시 좋아요 {i}", "토글", user_ids[0]).id
+                for i in range(2)
+            ]
+        finally:
+            db.close()
+
+        # (글, 사용자)별 토글 횟수가 홀수면 최종적으로 좋아요 상태
+        toggles = [
+            (post_ids[i % 2], user_ids[i % len(user_ids)])
+            for i in range(2000 + len(user_ids))
+        ]
+        writer = WriteExecutor()
+        done = threading.Event()
+
+        def read():
+            # 요청처럼 읽기 트랜잭션을 열어 둔 채 토글과 겹치게 함
+            while not done.is_set():
+                session = sqlalchemy_manager.get_session()
+                try:
+                    session.execute(select(func.count()).select_from(PostLike))
+                    time.sleep(0.005)
+                finally:
+                    session.close()
+                time.sleep(0.005)
+
+        async def run():
+            sessions = [sqlalchemy_manager.get_session() for _ in toggles]
+            try:
+                return await asyncio.gather(
+                    *(
+                        writer.run_retrying(toggle_post_like, session, *args)
+                        for session, args in zip(sessions, toggles)
+                    )
+                )
+            finally:
+                for session in sessions:
+                    session.close()
+
+        readers = [threading.Thread(target=read) for _ in range(2)]
+        for reader in readers:
+            reader.start()
+        try:
+            results = asyncio.run(run())
+        finally:
+            done.set()
+            for reader in readers:
+                reader.join()
+            writer.shutdown()
+        assert all(result is not None for result in results)
+
+        db = sqlalchemy_manager.get_session()
+        try:
+            for post_id in post_ids:
+                like_count = db.scalar(
+                    select(Post.like_count).where(Post.id == post_id)
+                )
+                likes = db.scalar(
+                    select(func.count())
+                    .select_from(PostLike)
+                    .where(PostLike.post_id == post_id)
+                )
+                expected = sum(
+                    1
+                    for user_id in user_ids
+                    if toggles.count((post_id, user_id)) % 2
+                )
+                assert like_count == likes == expected
+        finally:
+            db.close()
+
+
+class TestPostLikeAPI:
+    """좋아요 API 테스트 클래스"""
+
+    def test_like_missing_post(self, auth_headers):
+        """없는 글 좋아요 요청 테스트"""
+        if not auth_headers.get("Authorization"):
+            pytest.skip("Authentication token not available")
+
+        response = client.post(
+            "/api/v1/posts/99999/like", headers=auth_headers
+        )
+
+        assert response.status_code == 404
+
+
+@pytest.fixture
+def auth_headers():
+    """인증 헤더를 제공하는 픽스처"""
+    login_data = {"email": "user@example.com", "password": "password123"}
+    response = client.post("/api/v1/auth/login", json=login_data)
+
+    if response.status_code == 200:
+        return {"Authorization": f"Bearer {response.json()['accessToken']}"}
+    return {}
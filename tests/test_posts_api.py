@@ -4,17 +4,31 @@ Posts API pytest 테스트
 This module contains pytest-based tests for posts endpoints.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
+from types import SimpleNamespace
 
 import pytest
 from fastapi.testclient import TestClient
 
+from app.api.endpoints.posts import _build_comment_tree
+from app.core.database import sqlalchemy_manager
+
 # Import your FastAPI app
 from app.main import app
+from app.models.posts import Post
 
 client = TestClient(app)
 
 
+def _post_updated_at(post_id):
+    """DB에 저장된 글 수정 시각"""
+    db = sqlalchemy_manager.get_session()
+    try:
+        return db.get(Post, post_id).updated_at
+    finally:
+        db.close()
+
+
 class TestPostsAPI:
     """Posts API 테스트 클래스"""
 
@@ -160,6 +174,251 @@ class TestPostsAPI:
             data = response.json()
             assert "like_count" in data or "likeCount" in data
 
+    def test_comment_count_maintained(self, auth_headers):
+        """댓글 작성/삭제 시 글 목록의 댓글 수 갱신 테스트"""
+        if not auth_headers.get("Authorization"):
+            pytest.skip("Authentication token not available")
+
+        post_data = {"title": "댓글 수 테스트 글", "content": "댓글 수 확인"}
+        create_response = client.post(
+            "/api/v1/posts", json=post_data, headers=auth_headers
+        )
+        assert create_response.status_code == 201
+        post_id = create_response.json()["id"]
+        updated_at = _post_updated_at(post_id)
+
+        comment_ids = []
+        for content in ["첫 댓글", "두 번째 댓글"]:
+            response = client.post(
+                f"/api/v1/posts/{post_id}/comments",
+                json={"content": content},
+                headers=auth_headers,
+            )
+            assert response.status_code == 201
+            comment_ids.append(response.json()["id"])
+
+        response = client.delete(
+            f"/api/v1/comments/{comment_ids[0]}", headers=auth_headers
+        )
+        assert response.status_code == 204
+
+        response = client.get(
+            "/api/v1/me/posts?limit=50", headers=auth_headers
+        )
+        assert response.status_code == 200
+        summaries = {p["id"]: p for p in response.json()["posts"]}
+        assert summaries[post_id]["commentCount"] == 1
+        # 댓글 작성/삭제는 글 수정 시각을 바꾸지 않음
+        assert _post_updated_at(post_id) == updated_at
+
+        response = client.get("/api/v1/posts?sort=discussed")
+        assert response.status_code == 200
+
+    def test_cursor_pagination(self, auth_headers):
+        """커서 기반 페이지네이션 테스트"""
+        if not auth_headers.get("Authorization"):
+            pytest.skip("Authentication token not available")
+
+        for i in range(3):
+            client.post(
+                "/api/v1/posts",
+                json={"title": f"커서 테스트 {i}", "content": "커서"},
+                headers=auth_headers,
+            )
+
+        response = client.get(
+            "/api/v1/me/posts?limit=2&includeTotal=true", headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["totalPages"] is not None
+        assert data["nextCursor"]
+
+        seen_ids = [p["id"] for p in data["posts"]]
+        cursor = data["nextCursor"]
+        while cursor:
+            response = client.get(
+                "/api/v1/me/posts",
+                params={"limit": 2, "cursor": cursor},
+                headers=auth_headers,
+            )
+            assert response.status_code == 200
+            data = response.json()
+            assert data["totalPages"] is None
+            seen_ids.extend(p["id"] for p in data["posts"])
+            cursor = data["nextCursor"]
+
+        # 중복이나 누락 없이 최신순으로 모든 글을 순회
+        assert len(seen_ids) == len(set(seen_ids))
+        assert seen_ids == sorted(seen_ids, reverse=True)
+
+    def test_post_tags_deduplicated_and_replaced(self, auth_headers):
+        """중복 태그 제거 및 태그 수정 테스트"""
+        if not auth_headers.get("Authorization"):
+            pytest.skip("Authentication token not available")
+
+        suffix = datetime.now().strftime("%H%M%S%f")
+        post_data = {
+            "title": "태그 일괄 처리 테스트",
+            "content": "태그",
+            "tags": [f"a{suffix}", f"b{suffix}", f"a{suffix}", "pytest"],
+        }
+        response = client.post(
+            "/api/v1/posts", json=post_data, headers=auth_headers
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert sorted(data["tags"]) == sorted(
+            [f"a{suffix}", f"b{suffix}", "pytest"]
+        )
+
+        response = client.patch(
+            f"/api/v1/posts/{data['id']}",
+            json={"tags": [f"b{suffix}", f"c{suffix}"]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert sorted(response.json()["tags"]) == [f"b{suffix}", f"c{suffix}"]
+
+    def test_tag_filter(self, auth_headers):
+        """태그 사전을 이용한 태그 필터 테스트"""
+        if not auth_headers.get("Authorization"):
+            pytest.skip("Authentication token not available")
+
+        tag = f"filter{datetime.now().strftime('%H%M%S%f')}"
+        response = client.post(
+            "/api/v1/posts",
+            json={
+                "title": "태그 필터 테스트",
+                "content": "필터",
+                "tags": [tag],
+            },
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+        post_id = response.json()["id"]
+
+        response = client.get("/api/v1/posts", params={"tag": tag})
+        assert response.status_code == 200
+        assert [p["id"] for p in response.json()["posts"]] == [post_id]
+
+        response = client.get("/api/v1/posts", params={"tag": f"{tag}x"})
+        assert response.status_code == 200
+        assert response.json()["posts"] == []
+
+    def test_comments_pagination(self, auth_headers):
+        """댓글 목록 페이지네이션 및 답글 미리보기 테스트"""
+        if not auth_headers.get("Authorization"):
+            pytest.skip("Authentication token not available")
+
+        response = client.post(
+            "/api/v1/posts",
+            json={"title": "댓글 페이지 테스트", "content": "댓글"},
+            headers=auth_headers,
+        )
+        post_id = response.json()["id"]
+
+        def write_comment(content, parent_id=None):
+            response = client.post(
+                f"/api/v1/posts/{post_id}/comments",
+                json={"content": content, "parentCommentId": parent_id},
+                headers=auth_headers,
+            )
+            assert response.status_code == 201
+            return response.json()["id"]
+
+        top_ids = [write_comment(f"댓글 {i}") for i in range(5)]
+        reply_ids = [write_comment(f"답글 {i}", top_ids[0]) for i in range(4)]
+
+        response = client.get(
+            f"/api/v1/posts/{post_id}/comments",
+            params={"limit": 2, "repliesLimit": 2},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        first = data["comments"][0]
+        assert first["id"] == top_ids[0]
+        assert first["replyCount"] == 4
+        assert [r["id"] for r in first["replies"]] == reply_ids[:2]
+
+        seen_ids = [c["id"] for c in data["comments"]]
+        while data["nextCursor"]:
+            data = client.get(
+                f"/api/v1/posts/{post_id}/comments",
+                params={"limit": 2, "cursor": data["nextCursor"]},
+            ).json()
+            seen_ids.extend(c["id"] for c in data["comments"])
+        assert seen_ids == top_ids
+
+        response = client.get(
+            f"/api/v1/posts/{post_id}/comments",
+            params={"parentCommentId": top_ids[0]},
+        )
+        assert [c["id"] for c in response.json()["comments"]] == reply_ids
+
+        response = client.get(
+            f"/api/v1/posts/{post_id}", params={"commentsLimit": 3}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [c["id"] for c in data["comments"]] == top_ids[:3]
+        assert data["commentsNextCursor"]
+
+    def test_invalid_cursor(self):
+        """잘못된 커서 요청 테스트"""
+        response = client.get("/api/v1/posts?cursor=not-a-cursor")
+
+        assert response.status_code == 400
+
+
+class TestCommentTree:
+    """댓글 트리 구성 테스트 클래스"""
+
+    def _comment(self, comment_id, parent_id=None):
+        return SimpleNamespace(
+            id=comment_id,
+            content=f"댓글 {comment_id}",
+            author=SimpleNamespace(id=1, nickname="tester"),
+            created_at=datetime(2024, 1, 1) + timedelta(minutes=comment_id),
+            parent_comment_id=parent_id,
+        )
+
+    def test_nested_replies(self):
+        """여러 단계 대댓글이 트리로 구성되는지 테스트"""
+        comments = [
+            self._comment(3, parent_id=2),
+            self._comment(1),
+            self._comment(2, parent_id=1),
+            self._comment(4),
+        ]
+
+        tree = _build_comment_tree(comments, max_depth=5)
+
+        assert [c.id for c in tree] == [1, 4]
+        assert [c.id for c in tree[0].replies] == [2]
+        assert [c.id for c in tree[0].replies[0].replies] == [3]
+
+    def test_replies_beyond_max_depth_are_flattened(self):
+        """최대 깊이를 넘는 답글이 마지막 단계에 붙는지 테스트"""
+        comments = [
+            self._comment(1),
+            self._comment(2, parent_id=1),
+            self._comment(3, parent_id=2),
+            self._comment(4, parent_id=3),
+            self._comment(5, parent_id=1),
+        ]
+
+        tree = _build_comment_tree(comments, max_depth=2)
+
+        assert [c.id for c in tree[0].replies] == [2, 3, 4, 5]
+        assert all(not c.replies for c in tree[0].replies)
+
+    def test_orphan_reply_kept_as_root(self):
+        """부모가 없는 답글도 누락되지 않는지 테스트"""
+        tree = _build_comment_tree([self._comment(2, parent_id=99)])
+
+        assert [c.id for c in tree] == [2]
+
 
 @pytest.fixture
 def auth_token():
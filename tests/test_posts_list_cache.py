@@ -0,0 +1,146 @@
+"""
+글 목록 응답 캐시 pytest 테스트
+
+This module contains pytest-based tests for the scoped, versioned
+stale-while-revalidate cache in front of the GET /posts list pages.
+"""
+
+import time
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.cache import ScopedVersionedCache
+from app.core.security import INTERNAL_TOKEN_HEADER, internal_api_token
+from app.crud.posts import post_list_cache
+from app.main import app
+
+client = TestClient(app)
+
+
+class TestScopedVersionedCache:
+    """범위별 버전 캐시 테스트 클래스"""
+
+    def test_scoped_invalidation(self):
+        """전체/범위 버전 증가에 따라 해당 항목만 무효화되는지 테스트"""
+        cache = ScopedVersionedCache(10, ttl_seconds=60, stale_seconds=0)
+        cache.set("all", "all-v1", cache.version())
+        cache.set("tag-1", "tag-1-v1", cache.version(1), scope=1)
+        cache.set("tag-2", "tag-2-v1", cache.version(2), scope=2)
+
+        cache.bump([1])
+        assert cache.get("all") == (None, False)
+        assert cache.get("tag-1", scope=1) == (None, False)
+        assert cache.get("tag-2", scope=2) == ("tag-2-v1", False)
+
+        cache.bump_all()
+        assert cache.get("tag-2", scope=2) == (None, False)
+
+    def test_set_ignores_outdated_version(self):
+        """계산 중 무효화된 결과는 저장되지 않는지 테스트"""
+        cache = ScopedVersionedCache(10, ttl_seconds=60, stale_seconds=0)
+        version = cache.version(1)
+        cache.bump([1])
+        assert cache.set("tag-1", "old", version, scope=1) is False
+        assert cache.get("tag-1", scope=1) == (None, False)
+
+    def test_stale_while_revalidate(self):
+        """TTL 이후 stale 허용 시간 동안 이전 값을 stale로 반환하는지 테스트"""
+        cache = ScopedVersionedCache(10, ttl_seconds=0.01, stale_seconds=60)
+        cache.set("key", "value", cache.version())
+        time.sleep(0.02)
+
+        assert cache.get("key") == ("value", True)
+        assert cache.begin_refresh("key") is True
+        assert cache.begin_refresh("key") is False
+        cache.end_refresh("key")
+
+        stats = cache.stats()
+        assert stats["staleHits"] == 1
+        assert stats["maxStaleMs"] > 0
+        assert stats["refreshes"] == 1
+
+    def test_max_entries(self):
+        """최대 항목 수를 넘으면 오래된 항목부터 제거되는지 테스트"""
+        cache = ScopedVersionedCache(2, ttl_seconds=60, stale_seconds=0)
+        for key in ("a", "b", "c"):
+            cache.set(key, key, cache.version())
+
+        assert cache.get("a") == (None, False)
+        assert cache.get("c") == ("c", False)
+        assert cache.stats()["evictions"] == 1
+
+
+class TestPostListCacheAPI:
+    """글 목록 응답 캐시 API 테스트 클래스"""
+
+    def create_post(self, auth_headers, tag: str) -> int:
+        response = client.post(
+            "/api/v1/posts",
+            json={"title": f"캐시 {tag}", "content": "목록", "tags": [tag]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+        return response.json()["id"]
+
+    def list_ids(self, **params) -> list:
+        response = client.get("/api/v1/posts", params=params)
+        assert response.status_code == 200
+        return [post["id"] for post in response.json()["posts"]]
+
+    def test_writes_invalidate_scoped_lists(self, auth_headers):
+        """글/좋아요 쓰기가 전체 목록과 해당 태그 목록만 무효화하는지 테스트"""
+        if not auth_headers.get("Authorization"):
+            pytest.skip("Authentication token not available")
+
+        tag_a = f"cache-a-{uuid.uuid4().hex[:8]}"
+        tag_b = f"cache-b-{uuid.uuid4().hex[:8]}"
+        post_a = self.create_post(auth_headers, tag_a)
+        assert self.list_ids(tag=tag_a) == [post_a]
+        assert self.list_ids()[0] == post_a
+
+        # 다른 태그 글 작성은 태그 A 목록을 무효화하지 않음
+        post_b = self.create_post(auth_headers, tag_b)
+        hits = post_list_cache.stats()["hits"]
+        assert self.list_ids(tag=tag_a) == [post_a]
+        assert post_list_cache.stats()["hits"] == hits + 1
+        assert self.list_ids()[0] == post_b
+
+        # 좋아요는 해당 글의 태그 목록에 바로 반영
+        client.post(f"/api/v1/posts/{post_a}/like", headers=auth_headers)
+        response = client.get("/api/v1/posts", params={"tag": tag_a})
+        assert response.json()["posts"][0]["likeCount"] == 1
+
+    def test_search_and_cursor_bypass_cache(self):
+        """검색어/커서 요청은 캐시를 거치지 않는지 테스트"""
+        stats = post_list_cache.stats()
+        lookups = stats["hits"] + stats["staleHits"] + stats["misses"]
+
+        client.get("/api/v1/posts", params={"query": "캐시"})
+        client.get("/api/v1/posts", params={"page": 100})
+
+        stats = post_list_cache.stats()
+        assert stats["hits"] + stats["staleHits"] + stats["misses"] == lookups
+
+    def test_metrics(self):
+        """메트릭에 글 목록 캐시 상태가 포함되는지 테스트"""
+        client.get("/api/v1/posts")
+        client.get("/api/v1/posts")
+
+        metrics = client.get(
+            "/metrics", headers={INTERNAL_TOKEN_HEADER: internal_api_token()}
+        ).json()["postListCache"]
+        assert metrics["hits"] >= 1
+        assert 0 < metrics["hitRate"] <= 1
+
+
+@pytest.fixture
+def auth_headers():
+    """인증 헤더를 제공하는 픽스처"""
+    login_data = {"email": "user@example.com", "password": "password123"}
+    response = client.post("/api/v1/auth/login", json=login_data)
+
+    if response.status_code == 200:
+        return {"Authorization": f"Bearer {response.json()['accessToken']}"}
+    return {}
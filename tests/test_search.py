@@ -0,0 +1,183 @@
+"""
+검색 색인 pytest 테스트
+
+This module contains pytest-based tests for the post full-text search index.
+"""
+
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.database import sqlalchemy_manager
+from app.core.search import PostSearchIndex, tokenize
+from app.crud.posts import create_post, delete_post
+from app.main import app
+from app.models.users import User
+
+client = TestClient(app)
+
+
+class TestPostSearchIndex:
+    """검색 색인 단위 테스트 클래스"""
+
+    def test_tokenize_korean_bigrams(self):
+        """한글은 음절 bigram으로 분리되는지 테스트"""
+        assert tokenize("시작하기", for_query=True) == ["시작", "작하", "하기"]
+        assert "fastapi" in tokenize("FastAPI는 빠릅니다")
+
+    def test_search_requires_all_terms(self):
+        """모든 검색어를 포함한 글만 반환하는지 테스트"""
+        index = PostSearchIndex()
+        index.add(1, "FastAPI 시작하기", "파이썬 웹 프레임워크")
+        index.add(2, "React 시작하기", "프론트엔드 라이브러리")
+
+        assert {pid for pid, _ in index.search("시작")} == {1, 2}
+        assert [pid for pid, _ in index.search("fastapi 시작")] == [1]
+        assert index.search("django") == []
+
+    def test_title_match_ranks_higher(self):
+        """제목 일치가 본문 일치보다 높은 점수를 받는지 테스트"""
+        index = PostSearchIndex()
+        index.add(1, "일상 기록", "오늘은 duckdb 를 써봤다")
+        index.add(2, "DuckDB 튜닝", "분석 쿼리 최적화")
+        index.add(3, "잡담", "아무 내용")
+
+        assert index.search("duckdb")[0][0] == 2
+
+    def test_incremental_update_and_remove(self):
+        """글 수정/삭제가 색인에 반영되는지 테스트"""
+        index = PostSearchIndex()
+        index.add(1, "원래 제목", "원래 내용")
+        index.add(1, "바뀐 제목", "바뀐 내용")
+
+        assert index.search("원래") == []
+        assert [pid for pid, _ in index.search("바뀐")] == [1]
+
+        index.remove(1)
+        assert index.search("바뀐") == []
+        assert index.stats()["documents"] == 0
+
+    def test_prefix_match_but_not_infix(self):
+        """단어는 접두사로 찾지만 단어 중간 일치는 찾지 않는지 테스트"""
+        index = PostSearchIndex()
+        index.add(1, "FastAPI 튜토리얼", "비동기 서버")
+        index.add(2, "Fast 모드", "빠른 실행")
+
+        assert {pid for pid, _ in index.search("fast")} == {1, 2}
+        assert [pid for pid, _ in index.search("fasta")] == [1]
+        assert index.search("api") == []
+        # 한글은 bigram이므로 단어 중간도 검색됨
+        assert [pid for pid, _ in index.search("동기")] == [1]
+
+        index.remove(1)
+        assert index.search("fasta") == []
+        assert index.stats()["words"] == 1
+
+    def test_other_scripts_indexed(self):
+        """라틴/한글 외 문자도 색인되는지 테스트"""
+        index = PostSearchIndex()
+        index.add(1, "Привет мир", "café 東京タワー")
+
+        assert [pid for pid, _ in index.search("прив")] == [1]
+        assert [pid for pid, _ in index.search("café")] == [1]
+        assert [pid for pid, _ in index.search("東京")] == [1]
+
+    def test_rebuild_keeps_prefix_search(self):
+        """재구성 후에도 접두사 검색과 증분 추가가 동작하는지 테스트"""
+        word = f"rebuildword{datetime.now().strftime('%H%M%S%f')}"
+        index = PostSearchIndex()
+        db = sqlalchemy_manager.get_session()
+        try:
+            user = db.query(User).first()
+            post = create_post(db, f"{word} zeta", "본문", user.id)
+            index.rebuild(db)
+
+            assert [pid for pid, _ in index.search(word[:-2])] == [post.id]
+            index.add(-1, f"{word}x", "본문")
+            assert {pid for pid, _ in index.search(word)} == {post.id, -1}
+            assert [pid for pid, _ in index.search(f"{word}x")] == [-1]
+        finally:
+            delete_post(db, post)
+            db.close()
+
+    def test_sync_follows_database_changes(self):
+        """sync가 재구성 이후 작성/삭제된 글만 반영하는지 테스트"""
+        keyword = f"동기화{datetime.now().strftime('%H%M%S%f')}"
+        index = PostSearchIndex()
+        db = sqlalchemy_manager.get_session()
+        try:
+            index.rebuild(db)
+            user = db.query(User).first()
+            kept = create_post(db, f"{keyword} 유지", "본문", user.id)
+            removed = create_post(db, f"{keyword} 삭제", "본문", user.id)
+            assert index.search(keyword) == []
+
+            index.sync(db)
+            assert {pid for pid, _ in index.search(keyword)} == {
+                kept.id,
+                removed.id,
+            }
+
+            delete_post(db, removed)
+            delete_post(db, kept, soft_delete=False)
+            db.commit()  # 삭제 이후의 스냅샷에서 다시 조회
+            index.sync(db)
+            assert index.search(keyword) == []
+        finally:
+            db.close()
+
+
+class TestSearchAPI:
+    """검색 API 테스트 클래스"""
+
+    def test_search_relevance_sort(self, auth_headers):
+        """relevance 정렬 검색 테스트"""
+        if not auth_headers.get("Authorization"):
+            pytest.skip("Authentication token not available")
+
+        keyword = f"검색어{datetime.now().strftime('%H%M%S%f')}"
+        for title, content in [
+            ("다른 글", f"본문에만 {keyword} 포함"),
+            (f"{keyword} 제목", f"{keyword} 본문"),
+        ]:
+            response = client.post(
+                "/api/v1/posts",
+                json={"title": title, "content": content},
+                headers=auth_headers,
+            )
+            assert response.status_code == 201
+
+        response = client.get(
+            "/api/v1/posts",
+            params={"query": keyword, "sort": "relevance", "limit": 1},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["posts"][0]["title"] == f"{keyword} 제목"
+        assert data["nextCursor"]
+
+        response = client.get(
+            "/api/v1/posts",
+            params={
+                "query": keyword,
+                "sort": "relevance",
+                "limit": 1,
+                "cursor": data["nextCursor"],
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["posts"][0]["title"] == "다른 글"
+        assert data["nextCursor"] is None
+
+
+@pytest.fixture
+def auth_headers():
+    """인증 헤더를 제공하는 픽스처"""
+    login_data = {"email": "user@example.com", "password": "password123"}
+    response = client.post("/api/v1/auth/login", json=login_data)
+
+    if response.status_code == 200:
+        return {"Authorization": f"Bearer {response.json()['accessToken']}"}
+    return {}
@@ -0,0 +1,300 @@
+"""
+writer/reader 배포 모드 pytest 테스트
+
+This module contains pytest-based tests for the snapshot publisher/follower
+and the reader-to-writer request forwarding used in multi-worker mode.
+"""
+
+import asyncio
+import os
+import threading
+
+import duckdb
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.database import DuckDBManager, SQLAlchemyManager
+from app.core.forwarding import WriteForwarder
+from app.core.security import INTERNAL_TOKEN_HEADER, internal_api_token
+from app.core.snapshots import (
+    SNAPSHOT_POINTER,
+    SnapshotFollower,
+    SnapshotPublisher,
+)
+from app.core.tag_cache import TagDictionary
+from app.core.view_counter import view_count_buffer
+from app.main import app, create_app
+from app.models.tags import Tag
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def source(tmp_path):
+    """스냅샷 원본으로 쓸 별도 데이터베이스"""
+    manager = SQLAlchemyManager(DuckDBManager(str(tmp_path / "source.duckdb")))
+    manager.create_tables()
+    yield manager
+    manager.engine.dispose()
+    manager.db_manager.close_connection()
+
+
+def add_tag(manager: SQLAlchemyManager, name: str):
+    db = manager.get_session()
+    try:
+        db.add(Tag(name=name))
+        db.commit()
+    finally:
+        db.close()
+
+
+class TestSnapshotPublisher:
+    """스냅샷 발행기 테스트 클래스"""
+
+    def test_publish_readable_snapshot(self, source, tmp_path):
+        """발행한 스냅샷을 읽기 전용으로 열 수 있는지 테스트"""
+        add_tag(source, "snapshot-tag")
+        publisher = SnapshotPublisher(
+            snapshot_dir=str(tmp_path / "snapshots"), manager=source
+        )
+        path = publisher.publish()
+
+        with open(tmp_path / "snapshots" / SNAPSHOT_POINTER) as f:
+            assert f.read() == os.path.basename(path)
+        conn = duckdb.connect(path, read_only=True)
+        try:
+            names = conn.execute("SELECT name FROM tags").fetchall()
+        finally:
+            conn.close()
+        assert names == [("snapshot-tag",)]
+
+    def test_skip_unchanged_and_prune(self, source, tmp_path):
+        """변경이 없으면 건너뛰고 오래된 스냅샷은 keep개만 남는지 테스트"""
+        snapshot_dir = tmp_path / "snapshots"
+        publisher = SnapshotPublisher(
+            snapshot_dir=str(snapshot_dir), keep=2, manager=source
+        )
+        assert publisher.publish() is not None
+        assert publisher.publish() is None
+
+        for i in range(3):
+            add_tag(source, f"prune-{i}")
+            assert publisher.publish() is not None
+
+        snapshots = [
+            name
+            for name in os.listdir(snapshot_dir)
+            if name != SNAPSHOT_POINTER
+        ]
+        assert len(snapshots) == 2
+        stats = publisher.stats()
+        assert stats["published"] == 4
+        assert stats["skipped"] == 1
+
+    def test_publish_async_copies_off_writer_thread(self, source, tmp_path):
+        """체크포인트만 쓰기 스레드에서 하고 복사는 따로 하는지 테스트"""
+        add_tag(source, "async-tag")
+        publisher = SnapshotPublisher(
+            snapshot_dir=str(tmp_path / "snapshots"), manager=source
+        )
+        threads = {}
+
+        def record(name, method):
+            def wrapper(*args):
+                threads[name] = threading.current_thread().name
+                return method(*args)
+
+            return wrapper
+
+        publisher.checkpoint = record("checkpoint", publisher.checkpoint)
+        publisher.copy = record("copy", publisher.copy)
+
+        path = asyncio.run(publisher.publish_async())
+        assert os.path.exists(path)
+        assert threads["checkpoint"] == "db-writer"
+        assert threads["copy"] != "db-writer"
+        assert asyncio.run(publisher.publish_async()) is None
+
+
+class TestSnapshotFollower:
+    """스냅샷 추적기 테스트 클래스"""
+
+    def test_follow_new_snapshots(self, source, tmp_path):
+        """새 스냅샷이 발행되면 reader 연결이 교체되는지 테스트"""
+        snapshot_dir = str(tmp_path / "snapshots")
+        publisher = SnapshotPublisher(
+            snapshot_dir=snapshot_dir, manager=source
+        )
+        reader = SQLAlchemyManager(
+            DuckDBManager(str(tmp_path / "unused.duckdb"), read_only=True)
+        )
+        follower = SnapshotFollower(snapshot_dir=snapshot_dir, manager=reader)
+
+        def tag_names():
+            db = reader.get_session()
+            try:
+                return {tag.name for tag in db.query(Tag).all()}
+            finally:
+                db.close()
+
+        try:
+            with pytest.raises(RuntimeError):
+                follower.wait_for_snapshot(timeout=0.01)
+
+            add_tag(source, "first")
+            publisher.publish()
+            follower.wait_for_snapshot(timeout=1)
+            assert tag_names() == {"first"}
+            assert follower.refresh() is False
+
+            add_tag(source, "second")
+            publisher.publish()
+            assert follower.refresh() is True
+            assert tag_names() == {"first", "second"}
+            assert follower.stats()["swaps"] == 2
+        finally:
+            reader.engine.dispose()
+            reader.db_manager.close_connection()
+
+    def test_tag_dictionary_sync_adds_new_tags(self, source):
+        """태그 사전 sync가 재구성 이후 생긴 태그만 추가하는지 테스트"""
+        add_tag(source, "old")
+        dictionary = TagDictionary()
+        db = source.get_session()
+        try:
+            assert dictionary.sync(db) == 1
+
+            add_tag(source, "new")
+            db.commit()  # 추가 이후의 스냅샷에서 다시 조회
+            assert dictionary.sync(db) == 1
+            assert dictionary.sync(db) == 0
+        finally:
+            db.close()
+        assert set(dictionary.lookup(["old", "new"])) == {"old", "new"}
+
+
+class TestWriteForwarding:
+    """reader -> writer 요청 전달 테스트 클래스"""
+
+    @pytest.fixture
+    def writer_app(self):
+        return create_app(role="writer")
+
+    @pytest.fixture
+    def reader_client(self, writer_app):
+        forwarder = WriteForwarder(
+            transport=httpx.ASGITransport(app=writer_app)
+        )
+        return TestClient(create_app(role="reader", forwarder=forwarder))
+
+    def test_writes_are_forwarded(self, reader_client, auth_headers):
+        """reader의 쓰기 요청이 writer에서 처리되는지 테스트"""
+        if not auth_headers.get("Authorization"):
+            pytest.skip("Authentication token not available")
+
+        response = reader_client.post(
+            "/api/v1/posts",
+            json={"title": "전달 테스트", "content": "writer에서 저장"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+        post_id = response.json()["id"]
+
+        response = reader_client.get(f"/api/v1/posts/{post_id}")
+        assert response.status_code == 200
+        assert response.json()["title"] == "전달 테스트"
+
+        forwarder = reader_client.app.state.forwarder
+        assert forwarder.stats()["forwarded"] == 1
+
+    def test_internal_api_only_on_writer(self, writer_app, reader_client):
+        """내부 API는 writer에만 있고 reader에서는 막히는지 테스트"""
+        response = reader_client.post(
+            "/internal/view-counts", json={"counts": {}}
+        )
+        assert response.status_code == 404
+        response = client.post("/internal/view-counts", json={"counts": {}})
+        assert response.status_code == 404
+
+        writer_client = TestClient(writer_app)
+        response = writer_client.post(
+            "/internal/view-counts",
+            json={"counts": {"999999": 2}},
+            headers={INTERNAL_TOKEN_HEADER: internal_api_token()},
+        )
+        assert response.status_code == 204
+        assert view_count_buffer.pending(999999) == 2
+        view_count_buffer.drain()
+
+    def test_internal_api_requires_token(self, writer_app):
+        """토큰이 없거나 틀리면 writer 내부 API가 거부하는지 테스트"""
+        writer_client = TestClient(writer_app)
+        for headers in ({}, {INTERNAL_TOKEN_HEADER: "wrong-token"}):
+            response = writer_client.post(
+                "/internal/view-counts",
+                json={"counts": {"999997": 1}},
+                headers=headers,
+            )
+            assert response.status_code == 403
+        assert view_count_buffer.pending(999997) == 0
+
+    def test_configured_internal_token(self, writer_app, monkeypatch):
+        """설정한 INTERNAL_API_TOKEN만 허용하고 전달에도 쓰는지 테스트"""
+        derived = internal_api_token()
+        monkeypatch.setattr(settings, "INTERNAL_API_TOKEN", "shared-secret")
+        assert internal_api_token() == "shared-secret"
+
+        writer_client = TestClient(writer_app)
+        response = writer_client.post(
+            "/internal/view-counts",
+            json={"counts": {"999996": 1}},
+            headers={INTERNAL_TOKEN_HEADER: derived},
+        )
+        assert response.status_code == 403
+
+        forwarder = WriteForwarder(
+            transport=httpx.ASGITransport(app=writer_app)
+        )
+        view_count_buffer.drain()
+        view_count_buffer.increment(999996, 2)
+
+        async def run():
+            try:
+                return await forwarder.forward_view_counts()
+            finally:
+                await forwarder.close()
+
+        assert asyncio.run(run()) == 1
+        assert view_count_buffer.pending(999996) == 2
+        view_count_buffer.drain()
+
+    def test_view_counts_are_forwarded(self, reader_client):
+        """reader의 조회수 증분이 writer로 전달되는지 테스트"""
+        forwarder = reader_client.app.state.forwarder
+        view_count_buffer.drain()
+        view_count_buffer.increment(999998, 3)
+
+        async def run():
+            try:
+                return await forwarder.forward_view_counts()
+            finally:
+                await forwarder.close()
+
+        assert asyncio.run(run()) == 1
+        # 같은 프로세스의 writer 앱이 같은 버퍼에 다시 기록
+        assert view_count_buffer.pending(999998) == 3
+        assert forwarder.stats()["forwardedViews"] == 3
+        view_count_buffer.drain()
+
+
+@pytest.fixture
+def auth_headers():
+    """인증 헤더를 제공하는 픽스처"""
+    login_data = {"email": "user@example.com", "password": "password123"}
+    response = client.post("/api/v1/auth/login", json=login_data)
+
+    if response.status_code == 200:
+        return {"Authorization": f"Bearer {response.json()['accessToken']}"}
+    return {}
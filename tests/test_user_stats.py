@@ -0,0 +1,131 @@
+"""
+사용자 집계 pytest 테스트
+
+This module contains pytest-based tests for the incrementally maintained
+user_stats counters and their reconciliation.
+"""
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select, update
+
+from app.core.database import sqlalchemy_manager
+from app.crud.posts import (
+    create_comment,
+    create_post,
+    delete_comment,
+    delete_post,
+    get_user_stats,
+    reconcile_user_stats,
+    toggle_post_like,
+)
+from app.crud.users import create_user, get_user_by_email
+from app.main import app
+from app.models.user_stats import UserStats
+from app.models.users import User
+
+client = TestClient(app)
+
+READER_EMAIL = "stats_reader@example.com"
+
+
+def _deltas(before: dict, after: dict) -> dict:
+    """집계 변화량 (변화 없는 컬럼 제외)"""
+    return {
+        column: after[column] - before[column]
+        for column in before
+        if after[column] != before[column]
+    }
+
+
+class TestUserStatsMaintenance:
+    """사용자 집계 증분 갱신 테스트 클래스"""
+
+    def setup_method(self):
+        """다른 경로로 쓰인 데이터가 있을 수 있으므로 먼저 재계산"""
+        self.db = sqlalchemy_manager.get_session()
+        reconcile_user_stats(self.db)
+        self.author_id = self.db.scalar(select(User.id).order_by(User.id))
+        reader = get_user_by_email(self.db, READER_EMAIL) or create_user(
+            self.db,
+            READER_EMAIL,
+            password=None,
+            nickname="stats_reader",
+            hashed_password="-",
+        )
+        self.reader_id = reader.id
+
+    def teardown_method(self):
+        """세션 정리"""
+        self.db.close()
+
+    def _stats(self):
+        """작성자/독자 집계 조회"""
+        return (
+            get_user_stats(self.db, self.author_id),
+            get_user_stats(self.db, self.reader_id),
+        )
+
+    def test_counters_follow_crud(self):
+        """글/좋아요/댓글 작성과 삭제가 집계에 반영되는지 테스트"""
+        author_before, reader_before = self._stats()
+
+        post = create_post(self.db, "집계 테스트", "본문", self.author_id)
+        toggle_post_like(self.db, post.id, self.reader_id)
+        comment = create_comment(self.db, post.id, self.reader_id, "댓글")
+
+        author_after, reader_after = self._stats()
+        assert _deltas(author_before, author_after) == {
+            "post_count": 1,
+            "likes_received": 1,
+        }
+        assert _deltas(reader_before, reader_after) == {
+            "comment_count": 1,
+            "likes_given": 1,
+        }
+
+        toggle_post_like(self.db, post.id, self.reader_id)
+        delete_comment(self.db, comment)
+        delete_post(self.db, post, soft_delete=True)
+
+        author_after, reader_after = self._stats()
+        assert _deltas(author_before, author_after) == {}
+        assert _deltas(reader_before, reader_after) == {}
+
+        assert reconcile_user_stats(self.db)["users"] == 0
+
+    def test_reconcile_reports_and_fixes_drift(self):
+        """재계산이 틀어진 집계를 찾아 보정하는지 테스트"""
+        create_post(self.db, "재계산 테스트", "본문", self.author_id)
+        expected = get_user_stats(self.db, self.author_id)
+
+        self.db.execute(
+            update(UserStats)
+            .where(UserStats.user_id == self.author_id)
+            .values(post_count=UserStats.post_count + 5)
+        )
+        self.db.commit()
+
+        result = reconcile_user_stats(self.db)
+        assert result["users"] == 1
+        assert result["columns"]["post_count"] == 1
+        assert get_user_stats(self.db, self.author_id) == expected
+
+
+class TestUserStatsAPI:
+    """사용자 집계 API 테스트 클래스"""
+
+    def test_profile_includes_stats(self):
+        """공개 프로필에 집계가 포함되는지 테스트"""
+        response = client.get("/api/v1/users/1")
+
+        if response.status_code == 200:
+            stats = response.json()["stats"]
+            assert set(stats) == {
+                "postCount",
+                "commentCount",
+                "likesGiven",
+                "likesReceived",
+            }
+        else:
+            # 사용자가 없는 경우
+            assert response.status_code == 404
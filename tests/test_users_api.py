@@ -143,6 +143,47 @@ class TestUsersAPI:
             # 사용자가 없는 경우
             assert response.status_code == 404
 
+    def test_user_posts_exclude_deleted(self, auth_headers):
+        """사용자 글 목록의 삭제 글 제외 및 전체 개수 테스트"""
+        if not auth_headers.get("Authorization"):
+            pytest.skip("Authentication token not available")
+
+        user_id = client.get("/api/v1/me", headers=auth_headers).json()["id"]
+        post_ids = []
+        for content in ["짧은 본문", "긴 본문 " * 50]:
+            response = client.post(
+                "/api/v1/posts",
+                json={"title": "사용자 글 목록 테스트", "content": content},
+                headers=auth_headers,
+            )
+            assert response.status_code == 201
+            post_ids.append(response.json()["id"])
+
+        response = client.get(
+            f"/api/v1/users/{user_id}/posts?includeTotal=true"
+        )
+        assert response.status_code == 200
+        total_before = response.json()["pagination"]["totalCount"]
+
+        response = client.delete(
+            f"/api/v1/posts/{post_ids[0]}", headers=auth_headers
+        )
+        assert response.status_code == 204
+
+        response = client.get(
+            f"/api/v1/users/{user_id}/posts",
+            params={"limit": 100, "includeTotal": True},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["pagination"]["totalCount"] == total_before - 1
+
+        posts = {post["id"]: post for post in data["posts"]}
+        assert post_ids[0] not in posts
+        assert posts[post_ids[1]]["content"].endswith("...")
+        assert len(posts[post_ids[1]]["content"]) == 203
+        assert posts[post_ids[1]]["author"]["id"] == user_id
+
     def test_follow_user_with_auth(self, auth_headers):
         """사용자 팔로우 테스트"""
         if not auth_headers.get("Authorization"):
@@ -0,0 +1,206 @@
+"""
+조회수 버퍼 pytest 테스트
+
+This module contains pytest-based tests for buffered view-count increments.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.database import sqlalchemy_manager
+from app.core.view_counter import ViewCountBuffer, view_count_buffer
+from app.crud.posts import create_post
+from app.main import app
+from app.models.posts import Post
+from app.models.users import User
+
+client = TestClient(app)
+
+
+class TestViewCountBuffer:
+    """조회수 버퍼 테스트 클래스"""
+
+    def _create_post(self, db) -> Post:
+        user = db.query(User).first()
+        return create_post(db, "조회수 테스트", "조회수 버퍼", user.id)
+
+    def test_increments_are_coalesced_until_flush(self):
+        """증분이 메모리에 모였다가 한 번에 반영되는지 테스트"""
+        buffer = ViewCountBuffer(flush_threshold=1000, flush_interval=60)
+        db = sqlalchemy_manager.get_session()
+        try:
+            post = self._create_post(db)
+            for _ in range(5):
+                buffer.increment(post.id)
+
+            assert buffer.pending(post.id) == 5
+            assert buffer.approximate(post) == post.view_count + 5
+            assert buffer.stats()["pendingViews"] == 5
+
+            assert buffer.flush() == 1
+            db.commit()  # 반영 이후의 스냅샷에서 다시 조회
+            db.refresh(post)
+            assert post.view_count == 5
+            assert buffer.pending(post.id) == 0
+            assert buffer.stats()["flushedViews"] == 5
+        finally:
+            db.close()
+
+    def test_threshold_wakes_periodic_flush(self):
+        """임계치에 도달하면 조회 스레드가 아닌 주기 작업이 바로 반영하는지 테스트"""
+        buffer = ViewCountBuffer(flush_threshold=3, flush_interval=60)
+        db = sqlalchemy_manager.get_session()
+        try:
+            first = self._create_post(db)
+            second = self._create_post(db)
+
+            async def run():
+                task = asyncio.create_task(buffer.run_periodic_flush())
+                await asyncio.sleep(0)
+                for post_id in (first.id, second.id):
+                    await asyncio.to_thread(buffer.increment, post_id)
+                # 임계치 전에는 기록만 됨
+                assert buffer.stats()["flushes"] == 0
+
+                await asyncio.to_thread(buffer.increment, first.id)
+                for _ in range(100):
+                    if buffer.stats()["flushes"]:
+                        break
+                    await asyncio.sleep(0.05)
+                task.cancel()
+
+            asyncio.run(run())
+            assert buffer.stats()["flushes"] == 1
+
+            db.commit()
+            db.refresh(first)
+            db.refresh(second)
+            assert (first.view_count, second.view_count) == (2, 1)
+            assert buffer.stats()["lastFlushRows"] == 2
+        finally:
+            db.close()
+
+    def test_threshold_rearms_after_failed_flush(self, monkeypatch):
+        """반영 실패로 증분이 되돌아온 뒤 다음 조회가 다시 반영을 요청하는지 테스트"""
+        buffer = ViewCountBuffer(flush_threshold=2, flush_interval=60)
+        attempts = []
+
+        def flush():
+            pending = buffer.drain()
+            attempts.append(sum(pending.values()))
+            if len(attempts) == 1:
+                buffer.restore(pending)
+                raise RuntimeError("flush failed")
+            return len(pending)
+
+        monkeypatch.setattr(buffer, "flush", flush)
+
+        async def wait_for_attempts(count):
+            for _ in range(100):
+                if len(attempts) >= count:
+                    return
+                await asyncio.sleep(0.05)
+
+        async def run():
+            task = asyncio.create_task(buffer.run_periodic_flush())
+            await asyncio.sleep(0)
+            buffer.increment(1)
+            buffer.increment(1)
+            await wait_for_attempts(1)
+
+            # 임계치를 넘은 채 남은 증분에 조회가 더해지면 다시 반영
+            buffer.increment(1)
+            await wait_for_attempts(2)
+            task.cancel()
+
+        asyncio.run(run())
+        assert attempts == [2, 3]
+
+    def test_threshold_without_flush_task_only_records(self):
+        """주기 작업이 없으면 임계치를 넘어도 기록만 하는지 테스트"""
+        buffer = ViewCountBuffer(flush_threshold=1, flush_interval=60)
+        buffer.increment(1)
+        buffer.increment(1)
+
+        assert buffer.pending(1) == 2
+        assert buffer.stats()["flushes"] == 0
+
+    def test_flush_without_pending_is_noop(self):
+        """반영할 증분이 없으면 아무 것도 하지 않는지 테스트"""
+        buffer = ViewCountBuffer(flush_threshold=10, flush_interval=60)
+
+        assert buffer.flush() == 0
+        assert buffer.stats()["flushes"] == 0
+
+
+class TestViewCountAPI:
+    """조회수 반영 API 테스트 클래스"""
+
+    def test_reads_never_fail_on_threshold_flush(self, auth_headers):
+        """같은 글에 댓글 쓰기와 조회가 몰려도 조회가 실패하지 않는지 테스트"""
+        if not auth_headers.get("Authorization"):
+            pytest.skip("Authentication token not available")
+
+        threshold = view_count_buffer.flush_threshold
+        with TestClient(app) as lifespan_client:
+            response = lifespan_client.post(
+                "/api/v1/posts",
+                json={"title": "동시 조회수", "content": "임계치 반영"},
+                headers=auth_headers,
+            )
+            assert response.status_code == 201
+            post_id = response.json()["id"]
+
+            def read():
+                return lifespan_client.get(
+                    f"/api/v1/posts/{post_id}"
+                ).status_code
+
+            def write(i):
+                return lifespan_client.post(
+                    f"/api/v1/posts/{post_id}/comments",
+                    json={"content": f"동시 댓글 {i}"},
+                    headers=auth_headers,
+                ).status_code
+
+            view_count_buffer.flush_threshold = 1
+            try:
+                with ThreadPoolExecutor(max_workers=16) as pool:
+                    reads = [pool.submit(read) for _ in range(100)]
+                    writes = [pool.submit(write, i) for i in range(20)]
+                    read_codes = [future.result() for future in reads]
+                    write_codes = [future.result() for future in writes]
+            finally:
+                view_count_buffer.flush_threshold = threshold
+
+            assert read_codes == [200] * 100
+            assert write_codes == [201] * 20
+
+            # 주기 작업이 남은 증분까지 반영
+            for _ in range(100):
+                if view_count_buffer.pending(post_id) == 0:
+                    break
+                time.sleep(0.05)
+            assert view_count_buffer.stats()["flushes"] >= 1
+
+        db = sqlalchemy_manager.get_session()
+        try:
+            view_count = db.get(Post, post_id).view_count
+        finally:
+            db.close()
+        assert view_count + view_count_buffer.pending(post_id) == 100
+
+
+@pytest.fixture
+def auth_headers():
+    """인증 헤더를 제공하는 픽스처"""
+    login_data = {"email": "user@example.com", "password": "password123"}
+    response = client.post("/api/v1/auth/login", json=login_data)
+
+    if response.status_code == 200:
+        return {"Authorization": f"Bearer {response.json()['accessToken']}"}
+    return {}
@@ -0,0 +1,216 @@
+"""
+쓰기 스레드 그룹 커밋 pytest 테스트
+
+This module contains pytest-based tests for the single-writer executor that
+serializes mutations and group-commits them.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import DBAPIError
+
+from app.core.config import settings
+from app.core.database import sqlalchemy_manager
+from app.core.writer import WriteExecutor, after_commit
+from app.models.tags import Tag
+
+
+def _add_tag(db, name, fail=False, rollback=False, callbacks=None):
+    """태그 하나를 저장하는 쓰기 작업 (실패/롤백 선택)"""
+    db.add(Tag(name=name))
+    if rollback:
+        db.rollback()
+        return None
+    if fail:
+        db.flush()
+        raise ValueError(name)
+    db.commit()
+    if callbacks is not None:
+        after_commit(db, lambda: callbacks.append(name))
+    return name
+
+
+def _run_concurrently(writer, jobs, read_first=False):
+    """여러 요청 세션의 쓰기를 동시에 제출하고 결과(또는 예외) 반환
+
+    read_first이면 요청처럼 쓰기 전에 읽어서 세션마다 풀 연결을 잡아 둡니다.
+    """
+    sessions = [sqlalchemy_manager.get_session() for _ in jobs]
+    if read_first:
+        for db in sessions:
+            db.execute(select(1))
+
+    async def run():
+        return await asyncio.gather(
+            *(
+                writer.run(_add_tag, db, *args, **kwargs)
+                for db, (args, kwargs) in zip(sessions, jobs)
+            ),
+            return_exceptions=True,
+        )
+
+    try:
+        return asyncio.run(run())
+    finally:
+        for db in sessions:
+            db.close()
+        writer.shutdown()
+
+
+def _stored(names):
+    db = sqlalchemy_manager.get_session()
+    try:
+        return set(db.scalars(select(Tag.name).where(Tag.name.in_(names))))
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def names():
+    """테스트마다 겹치지 않는 태그 이름"""
+    prefix = uuid.uuid4().hex[:8]
+    return [f"writer-{prefix}-{i}" for i in range(6)]
+
+
+class TestWriteExecutor:
+    """쓰기 스레드 테스트 클래스"""
+
+    def test_group_commit(self, names):
+        """동시에 들어온 쓰기가 한 배치로 커밋되는지 테스트"""
+        writer = WriteExecutor(batch_window=0.2)
+        results = _run_concurrently(writer, [((name,), {}) for name in names])
+
+        assert results == names
+        assert _stored(names) == set(names)
+        stats = writer.stats()
+        assert stats["jobs"] == len(names)
+        assert stats["batches"] < len(names)
+
+    def test_failed_job_isolated(self, names):
+        """배치 중 실패한 작업만 오류를 받고 나머지는 커밋되는지 테스트"""
+        writer = WriteExecutor(batch_window=0.2)
+        jobs = [((name,), {"fail": i == 2}) for i, name in enumerate(names)]
+        results = _run_concurrently(writer, jobs)
+
+        assert isinstance(results[2], ValueError)
+        assert [r for i, r in enumerate(results) if i != 2] == [
+            name for i, name in enumerate(names) if i != 2
+        ]
+        assert _stored(names) == set(names) - {names[2]}
+        assert writer.stats()["failed"] == 1
+
+    def test_rollback_in_batch(self, names):
+        """배치 중 롤백한 작업이 다른 작업을 되돌리지 않는지 테스트"""
+        writer = WriteExecutor(batch_window=0.2)
+        jobs = [
+            ((name,), {"rollback": i == 1}) for i, name in enumerate(names)
+        ]
+        results = _run_concurrently(writer, jobs)
+
+        assert results[1] is None
+        assert _stored(names) == set(names) - {names[1]}
+
+    def test_after_commit_runs_once(self, names):
+        """재실행된 배치의 커밋 후 작업이 한 번씩만 실행되는지 테스트"""
+        writer = WriteExecutor(batch_window=0.2)
+        callbacks = []
+        jobs = [
+            ((name,), {"fail": i == 3, "callbacks": callbacks})
+            for i, name in enumerate(names)
+        ]
+        _run_concurrently(writer, jobs)
+
+        assert sorted(callbacks) == sorted(
+            name for i, name in enumerate(names) if i != 3
+        )
+
+    def test_sessions_holding_whole_pool(self):
+        """연결 풀보다 많은 요청 세션이 연결을 잡고 있어도 커밋되는지 테스트"""
+        prefix = uuid.uuid4().hex[:8]
+        capacity = settings.DB_POOL_SIZE + settings.DB_POOL_MAX_OVERFLOW
+        names = [f"writer-{prefix}-{i}" for i in range(capacity)]
+        writer = WriteExecutor(batch_window=0.2)
+        results = _run_concurrently(
+            writer, [((name,), {}) for name in names], read_first=True
+        )
+
+        assert results == names
+        assert _stored(names) == set(names)
+
+    def test_single_job_sees_latest_commit(self, names):
+        """단독 작업이 요청의 이전 스냅샷이 아닌 최신 상태에서 실행되는지 테스트"""
+        db = sqlalchemy_manager.get_session()
+        other = sqlalchemy_manager.get_session()
+        try:
+            # 요청이 먼저 읽어 트랜잭션을 연 뒤 다른 세션이 커밋
+            assert (
+                db.scalar(select(Tag.id).where(Tag.name == names[0])) is None
+            )
+            _add_tag(other, names[0])
+
+            writer = WriteExecutor(batch_window=0)
+            try:
+                found = asyncio.run(
+                    writer.run(
+                        lambda db: db.scalar(
+                            select(Tag.id).where(Tag.name == names[0])
+                        ),
+                        db,
+                    )
+                )
+            finally:
+                writer.shutdown()
+            assert found is not None
+        finally:
+            db.close()
+            other.close()
+
+    def test_conflict_resubmits_job(self, names):
+        """쓰기 충돌로 실패한 작업을 다시 제출해 성공시키는지 테스트"""
+        attempts = []
+
+        def add_tag_once_conflicting(db):
+            attempts.append(db.in_transaction())
+            db.add(Tag(name=names[0]))
+            db.flush()
+            if len(attempts) == 1:
+                raise DBAPIError(
+                    "INSERT", {}, Exception("Duplicate key in index")
+                )
+            db.commit()
+            return names[0]
+
+        db = sqlalchemy_manager.get_session()
+        writer = WriteExecutor(batch_window=0)
+        try:
+            result = asyncio.run(
+                writer.run_retrying(add_tag_once_conflicting, db)
+            )
+        finally:
+            writer.shutdown()
+            db.close()
+
+        assert result == names[0]
+        # 실패한 작업의 세션은 롤백되어 새 트랜잭션에서 다시 실행됨
+        assert attempts == [False, False]
+        assert _stored(names) == {names[0]}
+        assert writer.stats()["retriedJobs"] == 1
+
+    def test_other_errors_not_resubmitted(self, names):
+        """쓰기 충돌이 아닌 오류는 다시 제출하지 않는지 테스트"""
+        writer = WriteExecutor(batch_window=0)
+        db = sqlalchemy_manager.get_session()
+        try:
+            with pytest.raises(ValueError):
+                asyncio.run(
+                    writer.run_retrying(_add_tag, db, names[0], fail=True)
+                )
+        finally:
+            writer.shutdown()
+            db.close()
+
+        assert _stored(names) == set()
+        assert writer.stats()["retriedJobs"] == 0